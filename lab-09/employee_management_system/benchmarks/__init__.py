@@ -0,0 +1,3 @@
+"""
+Benchmarks package - замеры производительности системы
+"""
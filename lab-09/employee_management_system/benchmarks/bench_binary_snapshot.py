@@ -0,0 +1,81 @@
+"""
+Замер: холодный старт отчета по JSON-файлу и по двоичному снимку (mmap).
+
+"Открытие и поиск" - время от открытия файла до данных одного
+сотрудника; "фонд оплаты" - полный проход по зарплатам.
+
+Запуск: python -m benchmarks.bench_binary_snapshot --employees 200000
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+
+from benchmarks.generate import generate_company
+from src.core.company import Company
+from src.persistence.binary_snapshot import MappedCompany, write_binary_snapshot
+
+
+def timed(action, repeat: int):
+    """Лучшее время и результат действия"""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        start = time.perf_counter()
+        result = action()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    company = generate_company(args.employees)
+    directory = tempfile.mkdtemp()
+    json_path = os.path.join(directory, "company.json")
+    binary_path = os.path.join(directory, "company.snap")
+    company.save_to_file(json_path, streaming=True, compact=True)
+    write_binary_snapshot(company, binary_path)
+    employee_id = args.employees // 2
+    del company
+
+    def json_lookup():
+        return Company.load_from_file(json_path).find_employee_by_id(employee_id)
+
+    def json_total():
+        return Company.load_from_file(json_path).calculate_total_monthly_cost()
+
+    def binary_lookup():
+        with MappedCompany(binary_path) as mapped:
+            return mapped.find_employee_by_id(employee_id)
+
+    def binary_total():
+        with MappedCompany(binary_path) as mapped:
+            return mapped.calculate_total_monthly_cost()
+
+    print(
+        f"{'Формат':<8} {'файл, МБ':>9} {'открытие и поиск, с':>20} "
+        f"{'фонд оплаты, с':>15}"
+    )
+    for title, path, lookup, total in [
+        ("JSON", json_path, json_lookup, json_total),
+        ("mmap", binary_path, binary_lookup, binary_total),
+    ]:
+        lookup_time, _ = timed(lookup, args.repeat)
+        total_time, _ = timed(total, args.repeat)
+        print(
+            f"{title:<8} {os.path.getsize(path) / 2**20:>9.1f} "
+            f"{lookup_time:>20.4f} {total_time:>15.4f}"
+        )
+    os.remove(json_path)
+    os.remove(binary_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Замер: ранжирование кандидатов по приросту покрытия навыков проекта.
+
+Запуск: python -m benchmarks.bench_coverage --employees 400000
+"""
+
+import argparse
+import time
+
+from benchmarks.generate import SKILLS, generate_company
+from src.analytics.coverage import SkillCoverage
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=400_000)
+    parser.add_argument("--projects", type=int, default=200)
+    args = parser.parse_args()
+
+    company = generate_company(args.employees, n_projects=args.projects)
+    for i, project in enumerate(company.projects):
+        project.required_skills = SKILLS[i % 3 : i % 3 + 5]
+
+    start = time.perf_counter()
+    coverage = SkillCoverage.from_company(company)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    missing = [coverage.missing_skills(p) for p in company.projects]
+    coverage_time = time.perf_counter() - start
+
+    project = company.projects[0]
+    start = time.perf_counter()
+    ranked = coverage.rank_candidates(project, limit=50)
+    rank_time = time.perf_counter() - start
+
+    print(f"Разработчиков в снимке:         {len(coverage)}")
+    print(f"Построение масок:               {build_time:.3f} с")
+    print(f"Недостающие навыки проектов:    {coverage_time * 1000:.2f} мс")
+    print(f"Ранжирование для одного проекта: {rank_time * 1000:.2f} мс")
+    print(f"Проектов с пробелами:           {sum(1 for m in missing if m)}")
+    print(f"Лучший прирост:                 {ranked[0][1] if ranked else 0}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Замер: память компании, загруженной из JSON, с пулом строк и без него.
+
+Запуск: python -m benchmarks.bench_interning --employees 200000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from benchmarks.generate import generate_company
+from src.core.company import Company
+from src.utils.interning import STRING_POOL
+
+
+def loaded_size(text: str, interning: bool) -> tuple[int, Company]:
+    """Память, которую удерживает компания после загрузки из JSON-текста."""
+    STRING_POOL.clear()
+    STRING_POOL.enabled = interning
+    gc.collect()
+    tracemalloc.start()
+    try:
+        data = json.loads(text)
+        company = Company.from_dict(data)
+        del data
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+        STRING_POOL.enabled = True
+    return size, company
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=200_000)
+    args = parser.parse_args()
+
+    text = json.dumps(generate_company(args.employees).to_dict(), ensure_ascii=False)
+
+    plain, company = loaded_size(text, interning=False)
+    del company
+    interned, company = loaded_size(text, interning=True)
+    stats = STRING_POOL.stats()
+
+    count = len(company.get_all_employees())
+    print(f"Сотрудников:          {count}")
+    print(
+        f"Без пула строк:       {plain / 2**20:.1f} МБ ({plain / count:.0f} байт/сотр.)"
+    )
+    print(
+        f"С пулом строк:        {interned / 2**20:.1f} МБ "
+        f"({interned / count:.0f} байт/сотр.)"
+    )
+    print(f"Экономия:             {(plain - interned) / 2**20:.1f} МБ")
+    print(
+        f"Пул: {stats['unique']} уникальных строк, {stats['hits']} замен, "
+        f"~{stats['saved_bytes'] / 2**20:.1f} МБ дубликатов"
+    )
+
+
+if __name__ == "__main__":
+    main()
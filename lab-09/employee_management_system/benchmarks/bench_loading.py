@@ -0,0 +1,74 @@
+"""
+Замер: загрузка отдела и проекта из словаря с проверкой полей и без нее.
+
+Запуск: python -m benchmarks.bench_loading --employees 200000
+"""
+
+import argparse
+import gc
+import json
+import time
+
+from benchmarks.generate import generate_company
+from src.core.department import Department
+from src.core.project import Project
+
+
+def timed_load(load, text: str, trusted: bool, repeat: int) -> float:
+    """
+    Лучшее время загрузки; каждый прогон получает свежую копию данных.
+
+    Сборщик мусора приостановлен, как в Company.bulk_load, чтобы замер
+    отражал стоимость создания объектов, а не проходов gc.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        data = json.loads(text)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            load(data, trusted=trusted)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    company = generate_company(args.employees, n_departments=1, n_projects=0)
+    employees = company.departments[0].to_dict()["employees"]
+    del company
+    department = json.dumps({"name": "Development", "employees": employees})
+    project = json.dumps(
+        {
+            "project_id": 1,
+            "name": "Project",
+            "description": "Сгенерированный проект",
+            "deadline": "2030-12-31",
+            "status": "active",
+            "team": employees,
+        }
+    )
+
+    print(
+        f"{'Загрузка':<22} {'проверка, с':>12} {'доверенная, с':>14} {'ускорение':>10}"
+    )
+    for title, load, text in [
+        ("Department.from_dict", Department.from_dict, department),
+        ("Project.from_dict", Project.from_dict, project),
+    ]:
+        checked = timed_load(load, text, False, args.repeat)
+        trusted = timed_load(load, text, True, args.repeat)
+        print(
+            f"{title:<22} {checked:>12.3f} {trusted:>14.3f} {checked / trusted:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Замер: память на одного сотрудника каждого класса (tracemalloc).
+
+Аргументы конструкторов создаются заранее, поэтому замер учитывает только
+сами объекты: экземпляр, его атрибуты и служебный список наблюдателей.
+Для сравнения каждый класс замеряется и в варианте с __dict__ (см. dict_backed).
+
+Запуск: python -m benchmarks.bench_memory --count 100000
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+from types import MemberDescriptorType
+
+from benchmarks.generate import generate_employee
+from src.core.employee import Employee
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
+
+CLASSES = [Employee, Manager, Developer, Salesperson]
+
+
+def slot_names(cls: type) -> list[str]:
+    """Имена (с учетом искажения) всех слотов класса и его предков."""
+    return [
+        name
+        for klass in cls.__mro__
+        for name, value in vars(klass).items()
+        if isinstance(value, MemberDescriptorType)
+    ]
+
+
+def dict_backed(cls: type) -> type:
+    """
+    Теневой подкласс cls, хранящий атрибуты в __dict__ экземпляра.
+
+    Одноименные атрибуты класса закрывают дескрипторы слотов предков,
+    поэтому конструктор и свойства cls работают без изменений, а значения
+    попадают в словарь экземпляра.
+    """
+    namespace = {name: None for name in slot_names(cls)}
+    return type(f"{cls.__name__}Dict", (cls,), namespace)
+
+
+def arguments(cls: type, count: int) -> list[tuple]:
+    """Готовит аргументы конструктора для count сотрудников класса cls."""
+    rng = random.Random(42)
+    offset = CLASSES.index(cls)
+    args = []
+    for i in range(count):
+        emp = generate_employee(rng, i * 4 + offset + 4, "Development")
+        data = emp.to_dict()
+        del data["type"]
+        args.append(tuple(data.values()))
+    return args
+
+
+def bytes_per_employee(cls: type, args: list[tuple]) -> float:
+    """Средний прирост памяти на один созданный объект класса cls."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    employees = [cls(*a) for a in args]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Список ссылок на объекты к самим объектам не относится
+    list_size = employees.__sizeof__()
+    return (after - before - list_size) / len(employees)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'Класс':<12} {'__slots__':>12} {'__dict__':>12} {'dict/slots':>11}")
+    for cls in CLASSES:
+        shadow = dict_backed(cls)
+        ctor_args = arguments(cls, args.count)
+        slots = bytes_per_employee(cls, ctor_args)
+        # Пустые ячейки унаследованных слотов есть только у теневого класса
+        unused = cls.__basicsize__ - object.__basicsize__
+        dicts = bytes_per_employee(shadow, ctor_args) - unused
+        print(
+            f"{cls.__name__:<12} {slots:>12.1f} {dicts:>12.1f} {dicts / slots:>10.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
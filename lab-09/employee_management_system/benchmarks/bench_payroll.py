@@ -0,0 +1,67 @@
+"""
+Замер: расчет зарплат объектным путем и колоночным движком NumPy.
+
+Запуск: python -m benchmarks.bench_payroll --employees 1000000
+"""
+
+import argparse
+import time
+
+from benchmarks.generate import generate_company
+
+
+def object_payroll(company) -> tuple[float, dict, dict]:
+    """Считает фонд оплаты труда вызовом calculate_salary() у каждого объекта."""
+    total = 0.0
+    for emp in company.iter_all_employees():
+        total += emp.calculate_salary()
+    departments = {}
+    for dep in company.departments:
+        dep_total = 0.0
+        for emp in dep:
+            dep_total += emp.calculate_salary()
+        departments[dep.name] = dep_total
+    projects = {p.project_id: p.calculate_total_salary() for p in company.projects}
+    return total, departments, projects
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=1_000_000)
+    parser.add_argument("--projects", type=int, default=1_000)
+    parser.add_argument("--team-size", type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    company = generate_company(
+        args.employees, n_projects=args.projects, team_size=args.team_size
+    )
+    print(
+        f"Генерация {args.employees} сотрудников: {time.perf_counter() - start:.2f} с"
+    )
+
+    start = time.perf_counter()
+    expected = object_payroll(company)
+    object_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns = company.get_payroll_columns()
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    salaries = columns.salaries()
+    actual = (
+        columns.total(salaries),
+        columns.department_totals(salaries),
+        columns.project_totals(salaries),
+    )
+    columnar_time = time.perf_counter() - start
+
+    print(f"Объектный путь:            {object_time:.3f} с")
+    print(f"Построение колонок:        {build_time:.3f} с")
+    print(f"Колоночный расчет:         {columnar_time:.3f} с")
+    print(f"Результаты совпадают:      {actual == expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Замер: сохранение компании в JSON целиком через словарь и потоково.
+
+Для каждого способа измеряются время записи и пиковый прирост памяти
+(tracemalloc, отдельным прогоном, так как трассировка замедляет запись).
+
+Запуск: python -m benchmarks.bench_saving --employees 200000
+"""
+
+import argparse
+import gc
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.generate import generate_company
+from src.persistence.streaming import company_document, write_json_file
+
+
+def save_whole(company, path: str, indent) -> None:
+    """Прежний способ: словарь всей компании и json.dump"""
+    separators = (",", ":") if indent is None else None
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            company.to_dict(),
+            f,
+            ensure_ascii=False,
+            indent=indent,
+            separators=separators,
+        )
+
+
+def save_streaming(company, path: str, indent) -> None:
+    write_json_file(path, company_document(company), indent)
+
+
+def measure(save, company, path: str, indent) -> tuple[float, int]:
+    """Время записи (с) и пиковый прирост памяти (байт)"""
+    gc.collect()
+    start = time.perf_counter()
+    save(company, path, indent)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    try:
+        save(company, path, indent)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=200_000)
+    args = parser.parse_args()
+
+    company = generate_company(args.employees)
+    path = os.path.join(tempfile.mkdtemp(), "company.json")
+    print(f"{'Способ':<28} {'время, с':>9} {'пик памяти, МБ':>15} {'файл, МБ':>9}")
+    for title, save, indent in [
+        ("json.dump(to_dict), indent=2", save_whole, 2),
+        ("потоково, indent=2", save_streaming, 2),
+        ("json.dump(to_dict), compact", save_whole, None),
+        ("потоково, compact", save_streaming, None),
+    ]:
+        elapsed, peak = measure(save, company, path, indent)
+        size = os.path.getsize(path)
+        print(f"{title:<28} {elapsed:>9.2f} {peak / 2**20:>15.1f} {size / 2**20:>9.1f}")
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Замер: пакет сценариев "что если" для фонда оплаты труда.
+
+Запуск: python -m benchmarks.bench_scenarios --employees 200000 --scenarios 200
+"""
+
+import argparse
+import time
+
+from benchmarks.generate import LEVELS, generate_company
+from src.analytics.scenarios import Adjustment, Scenario
+
+
+def make_scenarios(count: int) -> list[Scenario]:
+    """Создает сценарии повышения зарплат разного вида."""
+    scenarios = []
+    for i in range(count):
+        percent = 1 + (i % 10) / 100
+        scenarios.append(
+            Scenario(
+                f"Сценарий {i}",
+                [
+                    Adjustment(
+                        "base_salary", "scale", percent, seniority=LEVELS[i % 3]
+                    ),
+                    Adjustment("bonus", "scale", 1 + (i % 5) / 100),
+                    Adjustment("commission_rate", "set", 0.05 + (i % 4) / 100),
+                ],
+            )
+        )
+    return scenarios
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=200_000)
+    parser.add_argument("--scenarios", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    company = generate_company(args.employees, n_projects=1_000, team_size=20)
+    scenarios = make_scenarios(args.scenarios)
+
+    start = time.perf_counter()
+    results = company.simulate_payroll(scenarios, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"Сценариев:                 {len(results)}")
+    print(f"Время расчета:             {elapsed:.3f} с")
+    print(f"На сценарий:               {elapsed / len(results) * 1000:.2f} мс")
+    print(f"Максимальный прирост:      {max(r.delta for r in results):.2f}")
+
+
+if __name__ == "__main__":
+    main()
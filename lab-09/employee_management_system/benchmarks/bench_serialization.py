@@ -0,0 +1,168 @@
+"""
+Замер: сериализация сотрудников скомпилированными кодеками и прежним путем.
+
+Прежний путь воспроизведен здесь для сравнения: обход слотов иерархии
+с разбором искаженных имен в to_dict и выбор класса цепочкой проверок
+ключей с удалением "type" из словаря в from_dict.
+
+Проверяющий from_dict кодека делает ту же работу, что и прежний путь
+(пул строк и конструктор класса со всеми проверками), но без копирования
+словаря и подбора класса; заметный выигрыш дает только доверенная
+загрузка. Оба пути декодируют одинаковые свежие копии словарей, каждая
+операция повторяется --repeat раз поочередно с прежним путем и берется
+лучшее время: одиночный замер на разных по расположению в памяти данных
+колебался в пределах 0.9-1.3x.
+
+Запуск: python -m benchmarks.bench_serialization --records 1000000
+"""
+
+import argparse
+import gc
+import random
+import time
+
+from benchmarks.generate import generate_employee
+from src.core.department import employee_from_dict
+from src.core.employee import Employee
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
+from src.utils.interning import intern_employee_data
+
+
+def legacy_to_dict(employee: Employee) -> dict:
+    """Прежний Employee.to_dict: обход слотов и разбор имен при каждом вызове."""
+    data = {"type": type(employee).__name__}
+    for cls in reversed(type(employee).__mro__):
+        for slot in cls.__dict__.get("__slots__", ()):
+            if slot.endswith("__") or slot == "__observers":
+                continue
+            if slot.startswith("__"):
+                slot = f"_{cls.__name__.lstrip('_')}{slot}"
+            data[slot.split("__")[-1]] = getattr(employee, slot)
+    return data
+
+
+LEGACY_FIELDS = {
+    Employee: ["id", "name", "department", "base_salary"],
+    Manager: ["id", "name", "department", "base_salary", "bonus"],
+    Developer: [
+        "id",
+        "name",
+        "department",
+        "base_salary",
+        "tech_stack",
+        "seniority_level",
+    ],
+    Salesperson: [
+        "id",
+        "name",
+        "department",
+        "base_salary",
+        "commission_rate",
+        "sales_volume",
+    ],
+}
+
+
+def legacy_from_dict(data: dict) -> Employee:
+    """Прежний путь: пул строк, цепочка проверок ключей, del data["type"], cls(**data)."""
+    intern_employee_data(data)
+    if "bonus" in data:
+        cls = Manager
+    elif "tech_stack" in data:
+        cls = Developer
+    elif "commission_rate" in data:
+        cls = Salesperson
+    else:
+        cls = Employee
+    if not data["type"] == cls.__name__:
+        raise ValueError("Неподходящий тип данных!")
+    del data["type"]
+    for field in LEGACY_FIELDS[cls]:
+        if field not in data:
+            raise ValueError(f"Для создания {cls.__name__} отсутствует поле: '{field}'")
+    return cls(**data)
+
+
+def timed(function, prepare=None) -> float:
+    """
+    Время вызова function() при приостановленном сборщике мусора.
+
+    :param prepare: Подготовка данных вне замера; ее результат передается
+        в function
+    """
+    data = prepare() if prepare is not None else None
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        function() if prepare is None else function(data)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def best_pair(old, new, repeat: int, prepare=None) -> tuple[float, float]:
+    """Лучшее время двух вариантов, запускаемых поочередно на одних данных."""
+    old_best = new_best = float("inf")
+    for _ in range(repeat):
+        old_best = min(old_best, timed(old, prepare))
+        new_best = min(new_best, timed(new, prepare))
+    return old_best, new_best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    employees = [
+        generate_employee(rng, emp_id, "Development")
+        for emp_id in range(1, args.records + 1)
+    ]
+
+    legacy_encode, compiled_encode = best_pair(
+        lambda: [legacy_to_dict(e) for e in employees],
+        lambda: [e.to_dict() for e in employees],
+        args.repeat,
+    )
+    records = [e.to_dict() for e in employees]
+    assert records == [legacy_to_dict(e) for e in employees]
+
+    # Прежний путь удаляет "type", поэтому ему нужны собственные копии;
+    # кодек читает такие же свежие копии, чтобы расположение словарей
+    # в памяти не влияло на сравнение
+    def copies():
+        return [dict(r) for r in records]
+
+    def legacy_decode_run(data):
+        return [legacy_from_dict(r) for r in data]
+
+    legacy_decode, compiled_decode = best_pair(
+        legacy_decode_run,
+        lambda data: [employee_from_dict(r) for r in data],
+        args.repeat,
+        copies,
+    )
+    _, trusted_decode = best_pair(
+        legacy_decode_run,
+        lambda data: [employee_from_dict(r, True) for r in data],
+        args.repeat,
+        copies,
+    )
+
+    print(f"Записей: {args.records}, лучшее из {args.repeat}")
+    print(f"{'Операция':<24} {'прежний, с':>11} {'кодек, с':>9} {'ускорение':>10}")
+    for title, old, new in [
+        ("to_dict", legacy_encode, compiled_encode),
+        ("from_dict", legacy_decode, compiled_decode),
+        ("from_dict (trusted)", legacy_decode, trusted_decode),
+    ]:
+        print(f"{title:<24} {old:>11.3f} {new:>9.3f} {old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Замер: прежний формат компании (участники проектов полностью) и формат 2
+(участники проектов по ID).
+
+Сравниваются размер компактного JSON, время загрузки (json.loads и
+Company.from_dict) и число объектов сотрудников после загрузки.
+
+Запуск: python -m benchmarks.bench_snapshot_format --employees 100000
+"""
+
+import argparse
+import gc
+import json
+import time
+
+from benchmarks.generate import generate_company
+from src.core.company import Company
+
+
+def legacy_dict(company: Company) -> dict:
+    """Словарь компании в прежнем формате без format_version"""
+    return {
+        "name": company.name,
+        "departments": [d.to_dict() for d in company.departments],
+        "projects": [p.to_dict() for p in company.projects],
+    }
+
+
+def employee_objects(company: Company) -> int:
+    """Число различных объектов сотрудников в отделах и командах"""
+    objects = {id(emp) for emp in company.iter_all_employees()}
+    for project in company.projects:
+        objects.update(id(emp) for emp in project.team)
+    return len(objects)
+
+
+def timed_load(text: str, repeat: int) -> tuple[float, Company]:
+    """
+    Лучшее время загрузки.
+
+    Сборщик мусора приостановлен, как внутри Company.bulk_load, чтобы
+    разбор JSON не прерывался проходами gc по ранее созданным объектам.
+    """
+    best, company = float("inf"), None
+    for _ in range(repeat):
+        company = None
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            company = Company.from_dict(json.loads(text))
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best, company
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=100_000)
+    parser.add_argument("--projects", type=int, default=2_000)
+    parser.add_argument("--team-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    company = generate_company(
+        args.employees, n_projects=args.projects, team_size=args.team_size
+    )
+    print(
+        f"Сотрудников: {args.employees}, "
+        f"мест в командах: {args.projects * args.team_size}"
+    )
+    print(f"{'Формат':<10} {'файл, МБ':>9} {'загрузка, с':>12} {'объектов':>10}")
+    for title, data in [
+        ("прежний", legacy_dict(company)),
+        ("2 (по ID)", company.to_dict()),
+    ]:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        del data
+        elapsed, loaded = timed_load(text, args.repeat)
+        print(
+            f"{title:<10} {len(text.encode('utf-8')) / 2**20:>9.1f} "
+            f"{elapsed:>12.2f} {employee_objects(loaded):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Замер: пакетное распределение разработчиков по проектам.
+
+Запуск: python -m benchmarks.bench_staffing --employees 100000 --projects 2000
+"""
+
+import argparse
+import random
+import time
+
+from benchmarks.generate import SKILLS, generate_company
+from src.analytics.staffing import StaffingRequest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=100_000)
+    parser.add_argument("--projects", type=int, default=2_000)
+    parser.add_argument("--load-limit", type=int, default=1)
+    args = parser.parse_args()
+
+    company = generate_company(args.employees, n_projects=args.projects, team_size=3)
+    rng = random.Random(1)
+    requests = []
+    for project in company.projects:
+        project.required_skills = rng.sample(SKILLS, rng.randint(3, 6))
+        requests.append(
+            StaffingRequest(
+                project, budget=rng.uniform(200_000, 800_000), max_members=4
+            )
+        )
+
+    plan = company.plan_staffing(requests, load_limit=args.load_limit)
+
+    start = time.perf_counter()
+    company.apply_staffing(plan)
+    apply_time = time.perf_counter() - start
+
+    print(f"Назначений:                {len(plan.assignments)}")
+    print(f"Целевая функция:           {plan.objective}")
+    print(f"Суммарная зарплата:        {plan.total_cost:.2f}")
+    print(f"Проектов с пробелами:      {sum(1 for m in plan.missing.values() if m)}")
+    print(f"Время расчета плана:       {plan.runtime:.3f} с")
+    print(f"Применение плана:          {apply_time:.3f} с")
+
+
+if __name__ == "__main__":
+    main()
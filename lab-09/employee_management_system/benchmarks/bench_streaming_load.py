@@ -0,0 +1,75 @@
+"""
+Замер: загрузка компании из JSON-файла целиком (json.load) и потоково.
+
+Для каждого способа измеряются время загрузки и пиковая память
+(tracemalloc, отдельным прогоном). Пик включает и саму загруженную
+компанию, поэтому рядом выводится память, которую она удерживает.
+
+Запуск: python -m benchmarks.bench_streaming_load --employees 200000
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.generate import generate_company
+from src.core.company import Company
+
+
+def load_whole(path: str) -> Company:
+    """Прежний способ: json.load всего файла, затем from_dict"""
+    return Company.load_from_file(path)
+
+
+def load_streaming(path: str) -> Company:
+    return Company.load_from_file(path, streaming=True)
+
+
+def measure(load, path: str) -> tuple[float, int, int]:
+    """Время загрузки (с), пиковая и удерживаемая компанией память (байт)"""
+    gc.collect()
+    start = time.perf_counter()
+    company = load(path)
+    elapsed = time.perf_counter() - start
+    del company
+    gc.collect()
+    tracemalloc.start()
+    try:
+        company = load(path)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=200_000)
+    parser.add_argument("--compact", action="store_true")
+    args = parser.parse_args()
+
+    # Путь задается абсолютным: load_from_file присоединяет его к data/json
+    path = os.path.join(tempfile.mkdtemp(), "company.json")
+    generate_company(args.employees).save_to_file(
+        path, streaming=True, compact=args.compact
+    )
+    size = os.path.getsize(path)
+    print(f"Файл: {size / 2**20:.1f} МБ")
+    print(f"{'Способ':<20} {'время, с':>9} {'пик, МБ':>9} {'компания, МБ':>13}")
+    for title, load in [
+        ("json.load + from_dict", load_whole),
+        ("потоково", load_streaming),
+    ]:
+        elapsed, peak, retained = measure(load, path)
+        print(
+            f"{title:<20} {elapsed:>9.2f} {peak / 2**20:>9.1f} {retained / 2**20:>13.1f}"
+        )
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Генерация больших компаний для замеров производительности."""
+
+import random
+
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.core.project import Project
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
+
+DEPARTMENT_NAMES = ["Development", "QA", "Sales", "Marketing", "Support", "HR"]
+SKILLS = ["Python", "Java", "Go", "SQL", "Kafka", "Docker", "React", "Rust", "Scala"]
+LEVELS = ["junior", "middle", "senior"]
+STATUSES = ["planning", "active", "completed", "cancelled"]
+
+
+def generate_employee(rng: random.Random, emp_id: int, department: str) -> Employee:
+    """Создает случайного сотрудника одного из четырех типов."""
+    base_salary = float(rng.randrange(30_000, 300_000))
+    kind = emp_id % 4
+    if kind == 0:
+        return Employee(emp_id, f"Employee {emp_id}", department, base_salary)
+    if kind == 1:
+        return Manager(
+            emp_id,
+            f"Manager {emp_id}",
+            department,
+            base_salary,
+            float(rng.randrange(1_000, 50_000)),
+        )
+    if kind == 2:
+        return Developer(
+            emp_id,
+            f"Developer {emp_id}",
+            department,
+            base_salary,
+            rng.sample(SKILLS, rng.randint(1, 4)),
+            rng.choice(LEVELS),
+        )
+    return Salesperson(
+        emp_id,
+        f"Salesperson {emp_id}",
+        department,
+        base_salary,
+        round(rng.uniform(0.01, 0.3), 3),
+        float(rng.randrange(0, 1_000_000)),
+    )
+
+
+def generate_company(
+    n_employees: int,
+    n_departments: int = 20,
+    n_projects: int = 200,
+    team_size: int = 10,
+    seed: int = 0,
+) -> Company:
+    """
+    Создает компанию заданного размера.
+
+    :param n_employees: Число сотрудников.
+    :param n_departments: Число отделов.
+    :param n_projects: Число проектов.
+    :param team_size: Размер команды каждого проекта.
+    :param seed: Зерно генератора случайных чисел.
+    """
+    rng = random.Random(seed)
+    company = Company("Generated Corp")
+    with company.bulk_load():
+        departments = []
+        for i in range(n_departments):
+            name = f"{DEPARTMENT_NAMES[i % len(DEPARTMENT_NAMES)]} {i}"
+            department = Department(name)
+            company.add_department(department)
+            departments.append(department)
+        for emp_id in range(1, n_employees + 1):
+            department = departments[emp_id % n_departments]
+            department.add_employee(
+                generate_employee(rng, emp_id, department.name.split()[0])
+            )
+        for project_id in range(1, n_projects + 1):
+            project = Project(
+                project_id,
+                f"Project {project_id}",
+                "Сгенерированный проект",
+                "2030-12-31",
+                rng.choice(STATUSES),
+            )
+            company.add_project(project)
+            for emp_id in rng.sample(
+                range(1, n_employees + 1), min(team_size, n_employees)
+            ):
+                project.add_team_member(
+                    departments[emp_id % n_departments].find_employee_by_id(emp_id)
+                )
+    return company
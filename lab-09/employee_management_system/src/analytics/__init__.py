@@ -0,0 +1,3 @@
+"""
+Analytics package - аналитические расчеты по компании
+"""
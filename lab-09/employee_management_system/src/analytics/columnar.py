@@ -0,0 +1,249 @@
+"""Колоночный расчет зарплат поверх массивов NumPy."""
+
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:  # numpy - необязательная зависимость
+    np = None
+
+from src.core.employee import Employee
+from src.employees.developer import SENIORITY_COEFFICIENTS, Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
+
+# Коды типов сотрудников в колонке type_code
+TYPE_EMPLOYEE = 0
+TYPE_MANAGER = 1
+TYPE_DEVELOPER = 2
+TYPE_SALESPERSON = 3
+TYPE_OTHER = 4
+
+TYPE_CODES = {
+    Employee: TYPE_EMPLOYEE,
+    Manager: TYPE_MANAGER,
+    Developer: TYPE_DEVELOPER,
+    Salesperson: TYPE_SALESPERSON,
+}
+
+# Коды уровней seniority в колонке seniority (-1 - не разработчик)
+SENIORITY_LEVELS = tuple(SENIORITY_COEFFICIENTS)
+SENIORITY_CODES = {level: code for code, level in enumerate(SENIORITY_LEVELS)}
+
+
+def require_numpy():
+    """Возвращает модуль numpy или сообщает, что он не установлен."""
+    if np is None:
+        raise ImportError("Для колоночного расчета зарплат требуется пакет numpy!")
+    return np
+
+
+def sequential_sum(values) -> float:
+    """Суммирует массив слева направо, как встроенная sum() по объектам."""
+    if len(values) == 0:
+        return 0.0
+    return float(np.cumsum(values)[-1])
+
+
+def group_sums(values, groups, n_groups: int):
+    """Суммирует значения по группам слева направо внутри каждой группы."""
+    return np.bincount(groups, weights=values, minlength=n_groups)
+
+
+class PayrollColumns:
+    """
+    Колоночное зеркало входных данных для расчета зарплат.
+
+    Каждая строка - один сотрудник. Колонки хранят код типа, базовую
+    зарплату, бонус, код и коэффициент seniority, процент комиссии и объем
+    продаж. Состав отделов и команд проектов хранится как списки строк.
+
+    Первые company_rows строк - сотрудники компании; за ними идут участники
+    команд проектов, не состоящие ни в одном отделе. Они учитываются только
+    в суммах своих проектов, но не в total().
+    """
+
+    def __init__(self, employees: Iterable[Employee]):
+        """
+        Строит колонки по сотрудникам.
+
+        :param employees: Сотрудники, по одному на строку (без повторов ID).
+        """
+        require_numpy()
+        self.__row_by_id: dict[int, int] = {}
+        self.__groups: dict[str, dict] = {"department": {}, "project": {}}
+        self.__group_rows: dict[str, list[list[int]]] = {
+            "department": [],
+            "project": [],
+        }
+
+        ids, types, base, bonus, seniority, coef, rate, volume = ([] for _ in range(8))
+        for emp in employees:
+            self.__row_by_id[emp.id] = len(ids)
+            code = TYPE_CODES.get(type(emp), TYPE_OTHER)
+            ids.append(emp.id)
+            types.append(code)
+            # Неизвестные подклассы считаются объектным путем и попадают в base
+            base.append(
+                emp.base_salary if code != TYPE_OTHER else emp.calculate_salary()
+            )
+            bonus.append(emp.bonus if code == TYPE_MANAGER else 0.0)
+            if code == TYPE_DEVELOPER:
+                seniority.append(SENIORITY_CODES[emp.seniority_level])
+                coef.append(SENIORITY_COEFFICIENTS[emp.seniority_level])
+            else:
+                seniority.append(-1)
+                coef.append(1.0)
+            if code == TYPE_SALESPERSON:
+                rate.append(emp.commission_rate)
+                volume.append(emp.sales_volume)
+            else:
+                rate.append(0.0)
+                volume.append(0.0)
+
+        self.ids = np.array(ids, dtype=np.int64)
+        self.type_code = np.array(types, dtype=np.int8)
+        self.base_salary = np.array(base, dtype=np.float64)
+        self.bonus = np.array(bonus, dtype=np.float64)
+        self.seniority = np.array(seniority, dtype=np.int8)
+        self.coefficient = np.array(coef, dtype=np.float64)
+        self.commission_rate = np.array(rate, dtype=np.float64)
+        self.sales_volume = np.array(volume, dtype=np.float64)
+        self.__flat: dict[str, Optional[tuple]] = {"department": None, "project": None}
+        self.__company_rows = len(ids)
+
+    @classmethod
+    def from_company(cls, company) -> "PayrollColumns":
+        """Строит колонки по сотрудникам, отделам и проектам компании."""
+        columns = cls(company.iter_all_employees())
+        for dep in company.departments:
+            columns.add_group("department", dep.name, dep)
+        for proj in company.projects:
+            columns.add_group("project", proj.project_id, proj.team)
+        return columns
+
+    def __len__(self) -> int:
+        """Возвращает число строк."""
+        return len(self.ids)
+
+    @property
+    def company_rows(self) -> int:
+        """Возвращает число строк сотрудников компании (без внешних участников)."""
+        return self.__company_rows
+
+    def row_of(self, employee_id: int) -> Optional[int]:
+        """Возвращает номер строки сотрудника по ID."""
+        return self.__row_by_id.get(employee_id)
+
+    def add_group(self, kind: str, key, members: Iterable[Employee]) -> None:
+        """
+        Добавляет группу строк (отдел или команду проекта).
+
+        Сотрудники, которых еще нет в колонках, дописываются новыми строками.
+        """
+        rows = []
+        extra = []
+        for emp in members:
+            row = self.__row_by_id.get(emp.id)
+            if row is None:
+                extra.append(emp)
+                row = len(self.ids) + len(extra) - 1
+            rows.append(row)
+        if extra:
+            self._append_rows(extra)
+        groups = self.__groups[kind]
+        if key in groups:
+            self.__group_rows[kind][groups[key]].extend(rows)
+        else:
+            groups[key] = len(self.__group_rows[kind])
+            self.__group_rows[kind].append(rows)
+        self.__flat[kind] = None
+
+    def _append_rows(self, employees: list[Employee]) -> None:
+        """Дописывает строки для сотрудников вне отделов компании."""
+        tail = PayrollColumns(employees)
+        offset = len(self.ids)
+        for emp_id, row in tail.__row_by_id.items():
+            self.__row_by_id[emp_id] = offset + row
+        for name in (
+            "ids",
+            "type_code",
+            "base_salary",
+            "bonus",
+            "seniority",
+            "coefficient",
+            "commission_rate",
+            "sales_volume",
+        ):
+            setattr(
+                self, name, np.concatenate([getattr(self, name), getattr(tail, name)])
+            )
+
+    def group_keys(self, kind: str) -> list:
+        """Возвращает ключи групп в порядке добавления."""
+        return list(self.__groups[kind])
+
+    def group_layout(self, kind: str) -> tuple:
+        """
+        Возвращает плоское представление групп: строки и номер группы для каждой.
+
+        :return: Пара массивов (rows, labels) одинаковой длины.
+        """
+        if self.__flat[kind] is None:
+            members = self.__group_rows[kind]
+            rows = [row for group in members for row in group]
+            labels = [label for label, group in enumerate(members) for _ in group]
+            self.__flat[kind] = (
+                np.array(rows, dtype=np.int64),
+                np.array(labels, dtype=np.int64),
+            )
+        return self.__flat[kind]
+
+    def salaries(
+        self,
+        base_salary=None,
+        bonus=None,
+        coefficient=None,
+        commission_rate=None,
+        sales_volume=None,
+    ):
+        """
+        Векторно вычисляет итоговые зарплаты всех строк.
+
+        Для каждого типа формула совпадает с calculate_salary(): нейтральные
+        значения (бонус 0, коэффициент 1, комиссия 0) не меняют результат.
+        Любую колонку можно подменить, не трогая сохраненные данные.
+        """
+        base = self.base_salary if base_salary is None else base_salary
+        bonus = self.bonus if bonus is None else bonus
+        coef = self.coefficient if coefficient is None else coefficient
+        rate = self.commission_rate if commission_rate is None else commission_rate
+        volume = self.sales_volume if sales_volume is None else sales_volume
+        return (base + bonus) * coef + volume * rate
+
+    def total(self, salaries=None) -> float:
+        """
+        Возвращает фонд оплаты труда компании.
+
+        Суммируются только строки сотрудников компании, как в
+        Company.calculate_total_monthly_cost(); участники проектов вне
+        отделов входят лишь в project_totals().
+        """
+        values = self.salaries() if salaries is None else salaries
+        return sequential_sum(values[: self.__company_rows])
+
+    def group_totals(self, kind: str, salaries=None) -> dict:
+        """Возвращает суммы зарплат по группам (отделам или проектам)."""
+        values = self.salaries() if salaries is None else salaries
+        rows, labels = self.group_layout(kind)
+        keys = self.group_keys(kind)
+        sums = group_sums(values[rows], labels, len(keys))
+        return {key: float(total) for key, total in zip(keys, sums)}
+
+    def department_totals(self, salaries=None) -> dict[str, float]:
+        """Возвращает суммы зарплат по отделам."""
+        return self.group_totals("department", salaries)
+
+    def project_totals(self, salaries=None) -> dict[int, float]:
+        """Возвращает суммы зарплат команд по проектам."""
+        return self.group_totals("project", salaries)
@@ -0,0 +1,188 @@
+"""Покрытие требуемых навыков проектов на битовых масках."""
+
+import heapq
+from typing import Iterable, Optional
+
+from src.core.employee import Employee
+from src.core.project import Project
+from src.utils.skill_index import normalize_skill
+
+
+class SkillVocabulary:
+    """Словарь навыков: каждому нормализованному навыку выделяется свой бит."""
+
+    def __init__(self, skills: Iterable[str] = ()):
+        """
+        Инициализация словаря
+
+        :param skills: Навыки для начального заполнения словаря
+        """
+        self.__bits: dict[str, int] = {}
+        self.__names: list[str] = []
+        for skill in skills:
+            self.bit(skill)
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    def __contains__(self, skill: str) -> bool:
+        return normalize_skill(skill) in self.__bits
+
+    def bit(self, skill: str) -> int:
+        """Возвращает номер бита навыка, добавляя навык при необходимости"""
+        key = normalize_skill(skill)
+        position = self.__bits.get(key)
+        if position is None:
+            position = self.__bits[key] = len(self.__names)
+            self.__names.append(key)
+        return position
+
+    def encode(self, skills: Iterable[str]) -> int:
+        """Кодирует набор навыков в битовую маску"""
+        mask = 0
+        for skill in skills:
+            mask |= 1 << self.bit(skill)
+        return mask
+
+    def decode(self, mask: int) -> list[str]:
+        """Возвращает навыки битовой маски в порядке номеров битов"""
+        skills = []
+        while mask:
+            low = mask & -mask
+            skills.append(self.__names[low.bit_length() - 1])
+            mask ^= low
+        return skills
+
+
+class SkillCoverage:
+    """
+    Снимок навыков разработчиков в виде битовых масок.
+
+    Разработчики с одинаковым набором навыков группируются по маске, поэтому
+    ранжирование кандидатов проверяет каждую уникальную маску один раз.
+    После изменения стеков технологий снимок нужно построить заново.
+    """
+
+    def __init__(
+        self,
+        developers: Iterable[Employee],
+        vocabulary: Optional[SkillVocabulary] = None,
+    ):
+        """
+        Инициализация снимка
+
+        :param developers: Сотрудники; без стека технологий пропускаются
+        :param vocabulary: Общий словарь навыков (по умолчанию новый)
+        """
+        self.__vocabulary = vocabulary if vocabulary is not None else SkillVocabulary()
+        self.__employees: dict[int, Employee] = {}
+        self.__masks: dict[int, int] = {}
+        self.__by_mask: dict[int, list[int]] = {}
+        for emp in developers:
+            stack = getattr(emp, "tech_stack", None)
+            if stack is None:
+                continue
+            mask = self.__vocabulary.encode(stack)
+            self.__employees[emp.id] = emp
+            self.__masks[emp.id] = mask
+            self.__by_mask.setdefault(mask, []).append(emp.id)
+        for ids in self.__by_mask.values():
+            ids.sort()
+
+    @classmethod
+    def from_company(cls, company, vocabulary: Optional[SkillVocabulary] = None):
+        """Строит снимок по всем разработчикам компании"""
+        return cls(company.iter_all_employees(), vocabulary)
+
+    @property
+    def vocabulary(self) -> SkillVocabulary:
+        """Возвращает словарь навыков снимка"""
+        return self.__vocabulary
+
+    def __len__(self) -> int:
+        return len(self.__masks)
+
+    def get(self, employee_id: int) -> Optional[Employee]:
+        """Возвращает разработчика снимка по ID"""
+        return self.__employees.get(employee_id)
+
+    def mask_groups(self) -> dict[int, list[int]]:
+        """Возвращает группы ID разработчиков (по возрастанию) по маске навыков"""
+        return {mask: ids.copy() for mask, ids in self.__by_mask.items()}
+
+    def mask_of(self, employee: Employee) -> int:
+        """Возвращает маску навыков сотрудника"""
+        if self.__employees.get(employee.id) is employee:
+            return self.__masks[employee.id]
+        return self.__vocabulary.encode(getattr(employee, "tech_stack", ()))
+
+    def team_mask(self, team: Iterable[Employee]) -> int:
+        """Возвращает объединение навыков команды"""
+        mask = 0
+        for emp in team:
+            mask |= self.mask_of(emp)
+        return mask
+
+    def required_mask(self, project: Project) -> int:
+        """Возвращает маску навыков, требуемых в проекте"""
+        return self.__vocabulary.encode(project.required_skills)
+
+    def missing_mask(self, project: Project) -> int:
+        """Возвращает маску требуемых навыков, не покрытых командой"""
+        return self.required_mask(project) & ~self.team_mask(project.team)
+
+    def coverage(self, project: Project) -> dict:
+        """
+        Возвращает покрытие требуемых навыков командой проекта.
+
+        :return: Словарь с ключами required, covered, missing и ratio
+        """
+        required = self.required_mask(project)
+        covered = required & self.team_mask(project.team)
+        return {
+            "required": self.__vocabulary.decode(required),
+            "covered": self.__vocabulary.decode(covered),
+            "missing": self.__vocabulary.decode(required & ~covered),
+            "ratio": (covered.bit_count() / required.bit_count() if required else 1.0),
+        }
+
+    def missing_skills(self, project: Project) -> list[str]:
+        """Возвращает требуемые навыки, которых нет у команды проекта"""
+        return self.__vocabulary.decode(self.missing_mask(project))
+
+    def marginal_gain(self, project: Project, candidate: Employee) -> int:
+        """Возвращает число недостающих навыков, которые добавит кандидат"""
+        return (self.mask_of(candidate) & self.missing_mask(project)).bit_count()
+
+    def rank_candidates(
+        self, project: Project, limit: Optional[int] = None
+    ) -> list[tuple[Employee, int]]:
+        """
+        Ранжирует разработчиков снимка по приросту покрытия проекта.
+
+        Участники команды и кандидаты без прироста не включаются.
+
+        :param project: Проект с требуемыми навыками
+        :param limit: Максимальное число кандидатов в ответе
+        :return: Пары (разработчик, прирост) по убыванию прироста, затем по ID
+        """
+        missing = self.missing_mask(project)
+        if not missing:
+            return []
+        team = {emp.id for emp in project.team}
+        by_gain: dict[int, list[list[int]]] = {}
+        for mask, ids in self.__by_mask.items():
+            gain = (mask & missing).bit_count()
+            if gain:
+                by_gain.setdefault(gain, []).append(ids)
+
+        # Списки ID внутри маски отсортированы, поэтому каждая группа прироста
+        # сливается по возрастанию ID до набора нужного числа кандидатов
+        ranked: list[tuple[Employee, int]] = []
+        for gain in sorted(by_gain, reverse=True):
+            for emp_id in heapq.merge(*by_gain[gain]):
+                if limit is not None and len(ranked) >= limit:
+                    return ranked
+                if emp_id not in team:
+                    ranked.append((self.__employees[emp_id], gain))
+        return ranked
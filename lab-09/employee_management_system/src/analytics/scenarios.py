@@ -0,0 +1,289 @@
+"""Пакетные сценарии "что если" для фонда оплаты труда поверх колонок NumPy."""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional, Sequence
+
+from src.analytics.columnar import (
+    SENIORITY_CODES,
+    TYPE_CODES,
+    TYPE_DEVELOPER,
+    TYPE_MANAGER,
+    TYPE_SALESPERSON,
+    PayrollColumns,
+    require_numpy,
+)
+
+# Колонки, которые может изменять сценарий, и типы сотрудников, для которых
+# колонка имеет смысл (None - для всех)
+ADJUSTABLE_COLUMNS = {
+    "base_salary": None,
+    "bonus": TYPE_MANAGER,
+    "coefficient": TYPE_DEVELOPER,
+    "commission_rate": TYPE_SALESPERSON,
+    "sales_volume": TYPE_SALESPERSON,
+}
+OPERATIONS = ("scale", "add", "set")
+TYPE_NAMES = {cls.__name__: code for cls, code in TYPE_CODES.items()}
+
+
+class Adjustment:
+    """
+    Одно изменение колонки для отобранных сотрудников.
+
+    Например, Adjustment("base_salary", "scale", 1.05, seniority="senior")
+    повышает базовую зарплату senior-разработчиков на 5%.
+    """
+
+    __slots__ = (
+        "column",
+        "operation",
+        "value",
+        "employee_type",
+        "seniority",
+        "department",
+    )
+
+    def __init__(
+        self,
+        column: str,
+        operation: str,
+        value: float,
+        employee_type: Optional[str] = None,
+        seniority: Optional[str] = None,
+        department: Optional[str] = None,
+    ):
+        """
+        :param column: Изменяемая колонка (см. ADJUSTABLE_COLUMNS)
+        :param operation: "scale" - умножить, "add" - прибавить, "set" - заменить
+        :param value: Множитель, слагаемое или новое значение
+        :param employee_type: Только сотрудники этого класса ("Manager", "Developer", ...)
+        :param seniority: Только разработчики этого уровня
+        :param department: Только сотрудники этого отдела компании
+        """
+        if column not in ADJUSTABLE_COLUMNS:
+            raise ValueError(
+                f"Колонка должна быть одной из: {list(ADJUSTABLE_COLUMNS)}"
+            )
+        if operation not in OPERATIONS:
+            raise ValueError(f"Операция должна быть одной из: {list(OPERATIONS)}")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError("Значение изменения должно быть числом!")
+        if employee_type is not None and employee_type not in TYPE_NAMES:
+            raise ValueError(f"Тип сотрудника должен быть одним из: {list(TYPE_NAMES)}")
+        if seniority is not None and seniority not in SENIORITY_CODES:
+            raise ValueError(f"Уровень должен быть одним из: {list(SENIORITY_CODES)}")
+        self.column = column
+        self.operation = operation
+        self.value = float(value)
+        self.employee_type = employee_type
+        self.seniority = seniority
+        self.department = department
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Adjustment":
+        """Создает изменение из словаря с теми же ключами, что и параметры"""
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        """Преобразует изменение в словарь"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Scenario:
+    """Именованный набор изменений, применяемых последовательно."""
+
+    def __init__(self, name: str, adjustments: Sequence[Adjustment]):
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("Название сценария не может быть пустым!")
+        if not all(isinstance(a, Adjustment) for a in adjustments):
+            raise ValueError("Сценарий должен состоять из объектов Adjustment!")
+        self.name = name
+        self.adjustments = list(adjustments)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Scenario":
+        """Создает сценарий из словаря {"name": ..., "adjustments": [...]}"""
+        return cls(data["name"], [Adjustment.from_dict(a) for a in data["adjustments"]])
+
+    def to_dict(self) -> dict:
+        """Преобразует сценарий в словарь"""
+        return {
+            "name": self.name,
+            "adjustments": [a.to_dict() for a in self.adjustments],
+        }
+
+
+class ScenarioResult:
+    """
+    Итоги одного сценария и их отклонения от текущего фонда оплаты труда.
+
+    total и delta относятся к фонду оплаты компании (PayrollColumns.total):
+    участники проектов вне отделов входят только в суммы проектов.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        total: float,
+        department_totals: dict[str, float],
+        project_totals: dict[int, float],
+        baseline: Optional["ScenarioResult"] = None,
+    ):
+        self.name = name
+        self.total = total
+        self.department_totals = department_totals
+        self.project_totals = project_totals
+        if baseline is None:
+            self.delta = 0.0
+            self.department_deltas = dict.fromkeys(department_totals, 0.0)
+            self.project_deltas = dict.fromkeys(project_totals, 0.0)
+        else:
+            self.delta = total - baseline.total
+            self.department_deltas = {
+                key: value - baseline.department_totals[key]
+                for key, value in department_totals.items()
+            }
+            self.project_deltas = {
+                key: value - baseline.project_totals[key]
+                for key, value in project_totals.items()
+            }
+
+    def to_dict(self) -> dict:
+        """Преобразует результат в словарь для отчетов"""
+        return {
+            "name": self.name,
+            "total": self.total,
+            "delta": self.delta,
+            "department_totals": self.department_totals,
+            "department_deltas": self.department_deltas,
+            "project_totals": self.project_totals,
+            "project_deltas": self.project_deltas,
+        }
+
+
+class ScenarioEngine:
+    """
+    Вычисляет сценарии над неизменяемым снимком PayrollColumns.
+
+    Каждый сценарий копирует только изменяемые колонки, поэтому ни снимок,
+    ни объекты сотрудников не меняются. Маски отбора строк кэшируются
+    и переиспользуются между сценариями.
+    """
+
+    def __init__(self, columns: PayrollColumns):
+        """
+        :param columns: Снимок входных данных зарплат (Company.get_payroll_columns)
+        """
+        self.__np = require_numpy()
+        self.__columns = columns
+        self.__masks: dict[tuple, object] = {}
+        self.__baseline = self._result("baseline", columns.salaries())
+
+    @property
+    def baseline(self) -> ScenarioResult:
+        """Возвращает итоги без изменений"""
+        return self.__baseline
+
+    def _mask(self, adjustment: Adjustment):
+        """Булева маска строк, к которым применяется изменение (None - все)"""
+        key = (
+            ADJUSTABLE_COLUMNS[adjustment.column],
+            adjustment.employee_type,
+            adjustment.seniority,
+            adjustment.department,
+        )
+        if key == (None, None, None, None):
+            return None
+        if key not in self.__masks:
+            np = self.__np
+            columns = self.__columns
+            mask = np.ones(len(columns), dtype=bool)
+            if key[0] is not None:
+                mask &= columns.type_code == key[0]
+            if adjustment.employee_type is not None:
+                mask &= columns.type_code == TYPE_NAMES[adjustment.employee_type]
+            if adjustment.seniority is not None:
+                mask &= columns.seniority == SENIORITY_CODES[adjustment.seniority]
+            if adjustment.department is not None:
+                members = np.zeros(len(columns), dtype=bool)
+                keys = columns.group_keys("department")
+                if adjustment.department in keys:
+                    rows, labels = columns.group_layout("department")
+                    members[rows[labels == keys.index(adjustment.department)]] = True
+                mask &= members
+            self.__masks[key] = mask
+        return self.__masks[key]
+
+    def salaries(self, scenario: Scenario):
+        """Возвращает вектор зарплат всех строк после применения сценария"""
+        overrides = {}
+        for adjustment in scenario.adjustments:
+            column = overrides.get(adjustment.column)
+            if column is None:
+                column = getattr(self.__columns, adjustment.column).copy()
+                overrides[adjustment.column] = column
+            mask = self._mask(adjustment)
+            target = slice(None) if mask is None else mask
+            if adjustment.operation == "scale":
+                column[target] *= adjustment.value
+            elif adjustment.operation == "add":
+                column[target] += adjustment.value
+            else:
+                column[target] = adjustment.value
+        return self.__columns.salaries(**overrides)
+
+    def _result(
+        self, name: str, salaries, baseline: Optional[ScenarioResult] = None
+    ) -> ScenarioResult:
+        """Собирает итоги по вектору зарплат"""
+        columns = self.__columns
+        return ScenarioResult(
+            name,
+            columns.total(salaries),
+            columns.department_totals(salaries),
+            columns.project_totals(salaries),
+            baseline,
+        )
+
+    def evaluate(self, scenario: Scenario) -> ScenarioResult:
+        """Вычисляет один сценарий"""
+        return self._result(scenario.name, self.salaries(scenario), self.__baseline)
+
+    def evaluate_many(
+        self, scenarios: Iterable[Scenario], workers: Optional[int] = None
+    ) -> list[ScenarioResult]:
+        """
+        Вычисляет пакет сценариев.
+
+        :param scenarios: Сценарии в порядке результатов
+        :param workers: Число процессов; None или 1 - в текущем процессе
+        """
+        scenarios = list(scenarios)
+        if workers is None or workers <= 1 or len(scenarios) < 2:
+            return [self.evaluate(scenario) for scenario in scenarios]
+        chunk = -(-len(scenarios) // workers)
+        batches = [scenarios[i : i + chunk] for i in range(0, len(scenarios), chunk)]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.__columns,),
+        ) as pool:
+            results = []
+            for batch in pool.map(_evaluate_batch, batches):
+                results.extend(batch)
+        return results
+
+
+# Движок процесса-обработчика: снимок передается один раз при запуске процесса
+_worker_engine: Optional[ScenarioEngine] = None
+
+
+def _init_worker(columns: PayrollColumns) -> None:
+    """Создает движок сценариев в процессе-обработчике"""
+    global _worker_engine
+    _worker_engine = ScenarioEngine(columns)
+
+
+def _evaluate_batch(scenarios: list[Scenario]) -> list[ScenarioResult]:
+    """Вычисляет часть пакета в процессе-обработчике"""
+    return [_worker_engine.evaluate(scenario) for scenario in scenarios]
@@ -0,0 +1,266 @@
+"""Пакетное распределение разработчиков по проектам с учетом навыков."""
+
+import heapq
+import time
+from typing import Iterable, Optional
+
+from src.analytics.coverage import SkillCoverage
+from src.core.employee import Employee
+from src.core.project import Project
+from src.utils.validators import ProjectValidator
+
+
+class StaffingRequest:
+    """Запрос на укомплектование проекта: бюджет и число новых участников."""
+
+    __slots__ = ("project", "budget", "max_members")
+
+    def __init__(
+        self,
+        project: Project,
+        budget: Optional[float] = None,
+        max_members: Optional[int] = None,
+    ):
+        """
+        Инициализация запроса
+
+        :param project: Проект с заполненными required_skills
+        :param budget: Лимит суммарной зарплаты новых участников (None - без лимита)
+        :param max_members: Максимум новых участников (None - без лимита)
+        """
+        if not isinstance(project, Project):
+            raise ValueError("Запрос должен ссылаться на объект Project!")
+        if budget is not None:
+            budget = ProjectValidator.validate_non_negative_number(budget, "Бюджет")
+        if max_members is not None:
+            ProjectValidator.validate_positive_integer(max_members, "Число участников")
+        self.project = project
+        self.budget = budget
+        self.max_members = max_members
+
+
+class Assignment:
+    """Назначение сотрудника на проект и его вклад в покрытие навыков."""
+
+    __slots__ = ("employee", "project", "gain", "cost")
+
+    def __init__(self, employee: Employee, project: Project, gain: int, cost: float):
+        self.employee = employee
+        self.project = project
+        self.gain = gain
+        self.cost = cost
+
+    def __repr__(self):
+        return (
+            f"Assignment(employee={self.employee.id}, "
+            f"project={self.project.project_id}, gain={self.gain})"
+        )
+
+
+class StaffingPlan:
+    """Результат распределения: назначения, целевая функция и время расчета."""
+
+    def __init__(
+        self,
+        assignments: list[Assignment],
+        missing: dict[int, list[str]],
+        runtime: float,
+    ):
+        """
+        :param assignments: Назначения в порядке выбора
+        :param missing: ID проекта -> навыки, оставшиеся непокрытыми
+        :param runtime: Время расчета в секундах
+        """
+        self.assignments = assignments
+        self.missing = missing
+        self.runtime = runtime
+
+    @property
+    def objective(self) -> int:
+        """Число пар (проект, навык), покрытых назначениями"""
+        return sum(a.gain for a in self.assignments)
+
+    @property
+    def total_cost(self) -> float:
+        """Суммарная зарплата назначенных сотрудников"""
+        total = 0.0
+        for assignment in self.assignments:
+            total += assignment.cost
+        return total
+
+    def to_dict(self) -> dict:
+        """Преобразует план в словарь для отчетов"""
+        return {
+            "assignments": [
+                {
+                    "employee_id": a.employee.id,
+                    "project_id": a.project.project_id,
+                    "gain": a.gain,
+                    "cost": a.cost,
+                }
+                for a in self.assignments
+            ],
+            "objective": self.objective,
+            "total_cost": self.total_cost,
+            "missing": self.missing,
+            "runtime": self.runtime,
+        }
+
+
+class _ProjectState:
+    """Изменяемое состояние проекта во время жадного выбора."""
+
+    __slots__ = ("request", "missing", "budget", "slots", "team", "masks")
+
+    def __init__(self, request: StaffingRequest, missing: int, team: set[int]):
+        self.request = request
+        self.missing = missing
+        self.budget = request.budget
+        self.slots = request.max_members
+        self.team = team
+        self.masks: list[tuple[int, int]] = []
+
+    def rank_masks(self, masks: Iterable[int]) -> None:
+        """Упорядочивает полезные маски навыков по убыванию прироста"""
+        ranked = [((mask & self.missing).bit_count(), mask) for mask in masks]
+        self.masks = sorted((item for item in ranked if item[0]), reverse=True)
+
+
+class StaffingOptimizer:
+    """
+    Жадный (lazy greedy) распределитель разработчиков по проектам.
+
+    На каждом шаге выбирается назначение с наибольшим числом новых покрытых
+    навыков, при равенстве - более дешевое. Сотрудники сгруппированы по маске
+    навыков и внутри группы отсортированы по зарплате, поэтому лучший кандидат
+    проекта ищется перебором уникальных масок, а не всех сотрудников.
+    Оценки проектов в общей куче пересчитываются лениво, только когда проект
+    оказывается на вершине.
+    """
+
+    def __init__(
+        self,
+        company,
+        load_limit: Optional[int] = None,
+        coverage: Optional[SkillCoverage] = None,
+    ):
+        """
+        :param company: Компания, сотрудники и проекты которой распределяются
+        :param load_limit: Максимум проектов на сотрудника; по умолчанию
+            на единицу меньше порога перегрузки компании
+        :param coverage: Готовый снимок навыков (по умолчанию строится заново)
+        """
+        if load_limit is None:
+            load_limit = company.overload_threshold - 1
+        else:
+            ProjectValidator.validate_positive_integer(load_limit, "Лимит нагрузки")
+        self.__company = company
+        self.__load_limit = load_limit
+        if coverage is None:
+            coverage = SkillCoverage.from_company(company)
+        self.__coverage = coverage
+
+    def _cost(self, employee_id: int) -> float:
+        """Зарплата сотрудника из индекса зарплат компании"""
+        salary = self.__company.salary_index.salary_of(employee_id)
+        if salary is None:
+            salary = self.__coverage.get(employee_id).calculate_salary()
+        return salary
+
+    def plan(self, requests: Iterable[StaffingRequest]) -> StaffingPlan:
+        """Строит план назначений, не изменяя проекты"""
+        start = time.perf_counter()
+        coverage = self.__coverage
+        costs: dict[int, float] = {}
+        pools: dict[int, list[int]] = {}
+        for mask, ids in coverage.mask_groups().items():
+            if not mask:
+                continue
+            for emp_id in ids:
+                costs[emp_id] = self._cost(emp_id)
+            pools[mask] = sorted(ids, key=lambda i: (costs[i], i))
+        heads = dict.fromkeys(pools, 0)
+        loads = {emp_id: self.__company.get_project_load(emp_id) for emp_id in costs}
+        limit = self.__load_limit
+
+        def best(state: _ProjectState) -> Optional[tuple[int, float, int]]:
+            """Лучший допустимый кандидат проекта: (-прирост, зарплата, ID)"""
+            if not state.missing or state.slots == 0:
+                return None
+            found = None
+            # Маски упорядочены по приросту, поэтому перебор прекращается,
+            # как только прирост становится меньше найденного
+            for gain, mask in state.masks:
+                if found is not None and -gain > found[0]:
+                    break
+                # Сотрудники, исчерпавшие лимит нагрузки, больше не понадобятся
+                pool = pools[mask]
+                head = heads[mask]
+                while head < len(pool) and loads[pool[head]] >= limit:
+                    head += 1
+                heads[mask] = head
+                for pos in range(head, len(pool)):
+                    emp_id = pool[pos]
+                    if emp_id in state.team or loads[emp_id] >= limit:
+                        continue
+                    if state.budget is None or costs[emp_id] <= state.budget:
+                        candidate = (-gain, costs[emp_id], emp_id)
+                        if found is None or candidate < found:
+                            found = candidate
+                    break
+            return found
+
+        states: list[_ProjectState] = []
+        heap: list[tuple[int, float, int, int]] = []
+        for request in requests:
+            project = request.project
+            team = {emp.id for emp in project.team}
+            missing = coverage.required_mask(project) & ~coverage.team_mask(
+                project.team
+            )
+            states.append(_ProjectState(request, missing, team))
+            states[-1].rank_masks(pools)
+            choice = best(states[-1])
+            if choice is not None:
+                heap.append((*choice, len(states) - 1))
+        heapq.heapify(heap)
+
+        assignments: list[Assignment] = []
+        while heap:
+            *popped, index = heapq.heappop(heap)
+            state = states[index]
+            choice = best(state)
+            if choice is None:
+                continue
+            # Оценка проекта устарела, только если упал прирост и проект уступил
+            # вершину кучи; удорожание кандидата при том же приросте допустимо
+            stale = choice[0] != popped[0] and heap and choice > heap[0][:3]
+            if stale:
+                heapq.heappush(heap, (*choice, index))
+                continue
+            neg_gain, cost, emp_id = choice
+            employee = coverage.get(emp_id)
+            assignments.append(
+                Assignment(employee, state.request.project, -neg_gain, cost)
+            )
+            state.missing &= ~coverage.mask_of(employee)
+            state.team.add(emp_id)
+            if state.budget is not None:
+                state.budget -= cost
+            if state.slots is not None:
+                state.slots -= 1
+            loads[emp_id] += 1
+            state.rank_masks(mask for _, mask in state.masks)
+            choice = best(state)
+            if choice is not None:
+                heapq.heappush(heap, (*choice, index))
+
+        missing = {
+            state.request.project.project_id: coverage.vocabulary.decode(state.missing)
+            for state in states
+        }
+        return StaffingPlan(assignments, missing, time.perf_counter() - start)
+
+    def apply(self, plan: StaffingPlan) -> None:
+        """Применяет план к компании (см. Company.apply_staffing)"""
+        self.__company.apply_staffing(plan)
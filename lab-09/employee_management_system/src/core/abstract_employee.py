@@ -8,6 +8,8 @@ class AbstractEmployee(ABC):
     Абстрактный класс, описывающий общие свойства и методы всех сотрудников компании.
     """
 
+    __slots__ = ()
+
 
 class ISalaryCalculable(ABC):
     """Абстрактный класс для вычисления итоговой зарплаты сотрудника."""
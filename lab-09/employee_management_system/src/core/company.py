@@ -1,49 +1,483 @@
 """Класс Company (Компания) с агрегацией отделов и проектов."""
 
 import os
+import gc
 import json
 import csv
-from typing import Optional
+import math
+from collections import ChainMap
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Callable, Iterable, Iterator, Mapping, Optional, Sequence, Union
 
 from .abstract_employee import AbstractEmployee
 from .employee import Employee
-from .department import Department
+from .department import Department, employee_from_dict
 from .project import Project
+from src.analytics.columnar import PayrollColumns
+from src.analytics.scenarios import Scenario, ScenarioEngine, ScenarioResult
+from src.analytics.staffing import StaffingOptimizer, StaffingPlan, StaffingRequest
+from src.persistence.streaming import (
+    JsonStreamReader,
+    company_document,
+    write_json_file,
+)
+from src.patterns.observer import (
+    ICompanyObserver,
+    IDepartmentObserver,
+    IEmployeeObserver,
+    IProjectObserver,
+)
 from src.utils.exceptions import (
     DepartmentNotFoundError,
     ProjectNotFoundError,
     DuplicateIdError,
     EmployeeNotFoundError,
+    PayrollMismatchError,
+    BulkLoadError,
 )
+from src.utils.aggregation import AggregateStats, group_aggregate
+from src.utils.comparators import SortKeyCache, sort_employees
+from src.utils.fields import FieldSpec
+from src.utils.history import TemporalStore, Timestamp
+from src.utils.salary_index import SalaryIndex
+from src.utils.skill_index import SkillIndex
 from src.utils.validators import CompanyValidator
 
 
-class Company:
+def _position_of(entries: list[Employee], employee: Employee) -> Optional[int]:
+    """Позиция именно этого объекта в списке (сравнение по идентичности)"""
+    for position, entry in enumerate(entries):
+        if entry is employee:
+            return position
+    return None
+
+
+class Company(IDepartmentObserver, IProjectObserver, IEmployeeObserver):
     """Класс, для управления компанией и её атрибутами"""
 
-    def __init__(self, name: str):
+    # Режим отладки: сверять накопленный фонд оплаты труда с полным пересчетом
+    debug_payroll = False
+    # Версия формата to_dict: 2 - команды проектов ссылаются на сотрудников по ID
+    FORMAT_VERSION = 2
+
+    def __init__(self, name: str, overload_threshold: int = 2):
         """
         Инициализация основных атрибутов компании
 
         :param name: Название компании
+        :param overload_threshold: Число проектов, начиная с которого сотрудник перегружен
         """
         validator = CompanyValidator()
         validator.validate_name(name)
+        validator.validate_positive_integer(overload_threshold, "Порог перегрузки")
 
         self.name = name
+        self.__observers: list[ICompanyObserver] = []
         self.__departments: list[Department] = []
-        self.__projects: list[Project] = []
+        self.__departments_by_name: dict[str, Department] = {}
+        # Реестр проектов по ID и группы проектов по статусу
+        self.__projects: dict[int, Project] = {}
+        self.__projects_by_status: dict[str, dict[Project, None]] = {}
+        # Индекс id -> сотрудник и записи отделов с этим id (по одной на отдел);
+        # в индексе - первый из объектов, оставшихся в отделах
+        self.__employee_index: dict[int, Employee] = {}
+        self.__employee_refs: dict[int, list[Employee]] = {}
+        # Счетчик версий состава компании и кэш списка сотрудников
+        self.__version = 0
+        self.__employees_cache: tuple[Employee, ...] = ()
+        self.__employees_cache_version = -1
+        # Счетчик изменений атрибутов сотрудников и кэш ключей сортировки
+        self.__attributes_version = 0
+        self.__sort_keys = SortKeyCache()
+        self.__total_monthly_cost = 0.0
+        self.__salary_index = SalaryIndex()
+        self.__skill_index = SkillIndex()
+        # Версия входных данных зарплат и кэш колоночного зеркала
+        self.__payroll_version = 0
+        self.__payroll_columns: Optional[PayrollColumns] = None
+        self.__payroll_columns_key: Optional[tuple[int, int]] = None
+        # Обратный индекс: id сотрудника -> проекты, где он в команде
+        self.__employee_projects: dict[int, dict[Project, None]] = {}
+        self.__overload_threshold = overload_threshold
+        self.__overloaded: dict[int, None] = {}
+        # Режим массовой загрузки: глубина вложенности и отложенные проекты
+        self.__bulk_depth = 0
+        self.__bulk_errors: list[Exception] = []
+        self.__pending_projects: list[Project] = []
+        # История изменений для запросов "на дату" (включается явно)
+        self.__history: Optional[TemporalStore] = None
 
     def _validate_unique_employee_id(self, value: int) -> None:
         """Проверка уникальности ID сотрудника"""
         CompanyValidator.validate_positive_integer(value, "ID сотрудника")
-        if value in [e.id for e in self.get_all_employees()]:
+        if value in self.__employee_index:
             raise DuplicateIdError(f"Уже cуществует сотрудник с ID: {value}!")
 
+    def attach_observer(self, observer: ICompanyObserver) -> None:
+        """Подписывает наблюдателя на изменения состава компании"""
+        if observer not in self.__observers:
+            self.__observers.append(observer)
+
+    def detach_observer(self, observer: ICompanyObserver) -> None:
+        """Отписывает наблюдателя от изменений состава компании"""
+        if observer in self.__observers:
+            self.__observers.remove(observer)
+
+    def _notify(self, event: str, *args) -> None:
+        """Вызывает обработчик события у всех наблюдателей компании"""
+        for observer in list(self.__observers):
+            getattr(observer, event)(self, *args)
+
+    @property
+    def version(self) -> int:
+        """Возвращает номер версии состава компании"""
+        return self.__version
+
+    @property
+    def salary_index(self) -> SalaryIndex:
+        """Возвращает индекс сотрудников, упорядоченный по зарплате"""
+        return self.__salary_index
+
+    @property
+    def skill_index(self) -> SkillIndex:
+        """Возвращает инвертированный индекс навыков разработчиков"""
+        return self.__skill_index
+
+    @property
+    def history(self) -> Optional[TemporalStore]:
+        """Возвращает историю изменений (None, если она не включена)"""
+        return self.__history
+
+    def enable_history(self, clock=None) -> TemporalStore:
+        """
+        Включает запись истории для запросов "на дату" (параметр as_of).
+
+        История начинается с текущего состояния компании.
+
+        :param clock: Источник текущего времени в секундах (по умолчанию time.time)
+        """
+        if self.__history is None:
+            self.__history = TemporalStore(clock)
+            self.__history.capture(self)
+        return self.__history
+
+    def _require_history(self) -> TemporalStore:
+        """Возвращает историю или сообщает, что запросы на дату недоступны"""
+        if self.__history is None:
+            raise ValueError("История не включена: вызовите enable_history()!")
+        return self.__history
+
+    def _track_employee(self, employee: Employee) -> None:
+        """Учитывает сотрудника в индексе и фонде оплаты труда"""
+        self.__employee_index[employee.id] = employee
+        salary = employee.calculate_salary()
+        self.__total_monthly_cost += salary
+        self.__salary_index.add(employee, salary)
+        self.__skill_index.add(employee)
+        employee.attach_observer(self)
+
+    def _untrack_employee(self, employee: Employee) -> None:
+        """Исключает сотрудника из индекса и фонда оплаты труда"""
+        del self.__employee_index[employee.id]
+        self.__salary_index.remove(employee.id)
+        self.__skill_index.remove(employee.id)
+        employee.detach_observer(self)
+        if self.__employee_index:
+            self.__total_monthly_cost -= employee.calculate_salary()
+        else:
+            self.__total_monthly_cost = 0.0
+
+    def _index_employee(self, employee: Employee) -> None:
+        """Добавляет сотрудника в индекс компании"""
+        self.__version += 1
+        entries = self.__employee_refs.get(employee.id)
+        if entries is None:
+            self.__employee_refs[employee.id] = [employee]
+            self._track_employee(employee)
+        else:
+            entries.append(employee)
+
+    def _unindex_employee(self, employee: Employee) -> None:
+        """Удаляет сотрудника из индекса компании"""
+        self.__version += 1
+        entries = self.__employee_refs.get(employee.id)
+        if entries is None:
+            return
+        position = _position_of(entries, employee)
+        if position is None:
+            return
+        del entries[position]
+        if not entries:
+            del self.__employee_refs[employee.id]
+            self._untrack_employee(employee)
+        elif (
+            self.__employee_index[employee.id] is employee
+            and _position_of(entries, employee) is None
+        ):
+            # В другом отделе остался другой объект с тем же ID
+            self._untrack_employee(employee)
+            self._track_employee(entries[0])
+
+    def on_salary_changed(self, employee, old_salary: float, new_salary: float) -> None:
+        """Обновляет накопленный фонд оплаты труда компании"""
+        if self.__bulk_depth:
+            return
+        self.__total_monthly_cost += new_salary - old_salary
+        self.__salary_index.update(employee.id, new_salary)
+        self.__payroll_version += 1
+
+    def on_attribute_changed(
+        self, employee, attribute: str, old_value, new_value
+    ) -> None:
+        """Обновляет индекс навыков и историю после изменения атрибута сотрудника"""
+        if self.__bulk_depth:
+            return
+        self.__attributes_version += 1
+        if attribute == "id":
+            self._reindex_employee_id(employee, old_value)
+            return
+        self.__skill_index.update(employee, attribute, old_value, new_value)
+        if self.__history is not None:
+            self.__history.record_employee(employee)
+
+    def on_employee_id_changing(self, employee, new_id: int) -> None:
+        """Проверяет, что новый ID сотрудника не занят в компании"""
+        if self.__bulk_depth:
+            return
+        other = self.__employee_index.get(new_id)
+        if other is not None and other is not employee:
+            raise DuplicateIdError(f"Уже cуществует сотрудник с ID: {new_id}!")
+
+    def _reindex_employee_id(self, employee: Employee, old_id: int) -> None:
+        """Переносит сотрудника во всех индексах компании на его новый ID"""
+        if self.__employee_index.get(old_id) is not employee:
+            return
+        new_id = employee.id
+        self.__version += 1
+        del self.__employee_index[old_id]
+        self.__employee_index[new_id] = employee
+        entries = self.__employee_refs.pop(old_id)
+        self.__employee_refs[new_id] = [e for e in entries if e is employee]
+        others = [e for e in entries if e is not employee]
+        salary = self.__salary_index.salary_of(old_id)
+        self.__salary_index.remove(old_id)
+        self.__salary_index.add(employee, salary)
+        self.__skill_index.remove(old_id)
+        self.__skill_index.add(employee)
+        if others:
+            # Объекты с прежним ID в других отделах остаются под ним
+            self.__employee_refs[old_id] = others
+            self._track_employee(others[0])
+        if self.__history is not None:
+            self.__history.change_employee_id(employee, old_id)
+
+    @property
+    def overload_threshold(self) -> int:
+        """Возвращает число проектов, начиная с которого сотрудник перегружен"""
+        return self.__overload_threshold
+
+    @overload_threshold.setter
+    def overload_threshold(self, value: int) -> None:
+        """Устанавливает порог перегрузки и пересчитывает перегруженных"""
+        CompanyValidator.validate_positive_integer(value, "Порог перегрузки")
+        self.__overload_threshold = value
+        self.__overloaded = {
+            emp_id: None
+            for emp_id, projects in self.__employee_projects.items()
+            if len(projects) >= value
+        }
+
+    def _index_team_member(self, project: Project, employee: Employee) -> None:
+        """Учитывает участие сотрудника в проекте"""
+        projects = self.__employee_projects.setdefault(employee.id, {})
+        projects[project] = None
+        if len(projects) >= self.__overload_threshold:
+            self.__overloaded[employee.id] = None
+
+    def _unindex_team_member(self, project: Project, employee_id: int) -> None:
+        """Снимает учет участия сотрудника в проекте"""
+        projects = self.__employee_projects.get(employee_id)
+        if projects is None:
+            return
+        projects.pop(project, None)
+        if len(projects) < self.__overload_threshold:
+            self.__overloaded.pop(employee_id, None)
+        if not projects:
+            del self.__employee_projects[employee_id]
+
+    def on_team_member_added(self, project, employee) -> None:
+        """Обновляет обратный индекс при добавлении сотрудника в проект"""
+        if self.__bulk_depth:
+            return
+        self.__payroll_version += 1
+        self._index_team_member(project, employee)
+        if self.__history is not None:
+            self.__history.record_team(project.project_id, project.team)
+
+    def on_team_member_removed(self, project, employee) -> None:
+        """Обновляет обратный индекс при удалении сотрудника из проекта"""
+        if self.__bulk_depth:
+            return
+        self.__payroll_version += 1
+        self._unindex_team_member(project, employee.id)
+        if self.__history is not None:
+            self.__history.record_team(project.project_id, project.team)
+
+    def on_status_changed(self, project, old_status: str, new_status: str) -> None:
+        """Переносит проект в группу нового статуса"""
+        if self.__bulk_depth:
+            return
+        self.__projects_by_status[old_status].pop(project, None)
+        self.__projects_by_status.setdefault(new_status, {})[project] = None
+
+    def on_project_id_changing(self, project, new_id: int) -> None:
+        """Проверяет уникальность нового ID проекта и обновляет реестр"""
+        if self.__bulk_depth or new_id == project.project_id:
+            return
+        if new_id in self.__projects:
+            raise DuplicateIdError(f"Уже существует проект с ID: {new_id}")
+        del self.__projects[project.project_id]
+        self.__projects[new_id] = project
+        if self.__history is not None:
+            self.__history.drop_project(project.project_id)
+            self.__history.record_team(new_id, project.team)
+
+    def on_team_member_id_changed(self, project, employee, old_id: int) -> None:
+        """Переносит участие сотрудника в проекте на его новый ID"""
+        if self.__bulk_depth:
+            return
+        self._unindex_team_member(project, old_id)
+        self._index_team_member(project, employee)
+        if self.__history is not None:
+            self.__history.record_team(project.project_id, project.team)
+
+    def get_employee_projects(self, employee_id: int) -> list[Project]:
+        """Возвращает проекты компании, в которых участвует сотрудник"""
+        return list(self.__employee_projects.get(employee_id, ()))
+
+    def get_project_load(self, employee_id: int) -> int:
+        """Возвращает число проектов компании, в которых участвует сотрудник"""
+        return len(self.__employee_projects.get(employee_id, ()))
+
+    def on_employee_added(self, department, employee) -> None:
+        """Обновляет индекс при добавлении сотрудника в отдел компании"""
+        if self.__bulk_depth:
+            return
+        self._index_employee(employee)
+        if self.__history is not None:
+            self.__history.record_employee(employee)
+            self.__history.join(employee.id, department.name)
+
+    def on_employee_removed(self, department, employee) -> None:
+        """Обновляет индекс при удалении сотрудника из отдела компании"""
+        if self.__bulk_depth:
+            return
+        self._unindex_employee(employee)
+        if self.__history is not None:
+            self.__history.leave(employee.id, department.name)
+
+    @contextmanager
+    def bulk_load(self):
+        """
+        Режим массовой загрузки компании.
+
+        Внутри блока проверки уникальности и обновление индексов откладываются,
+        а сборщик мусора приостановлен. При выходе индексы перестраиваются
+        за один проход, а все накопленные ошибки выбрасываются вместе
+        в виде BulkLoadError. Сборщик мусора включается обратно, даже если
+        перестроение индексов завершилось исключением.
+        """
+        self.__bulk_depth += 1
+        if self.__bulk_depth > 1:
+            try:
+                yield self
+            finally:
+                self.__bulk_depth -= 1
+            return
+
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        for dep in self.__departments:
+            dep._begin_bulk()
+        try:
+            yield self
+        finally:
+            self.__bulk_depth -= 1
+            try:
+                errors = self._finish_bulk()
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            self._notify("on_bulk_loaded")
+        if errors:
+            raise BulkLoadError(errors)
+
+    def _finish_bulk(self) -> list[Exception]:
+        """Перестраивает все индексы компании после массовой загрузки"""
+        errors, self.__bulk_errors = self.__bulk_errors, []
+        for dep in self.__departments:
+            errors.extend(dep._end_bulk())
+
+        for emp in self.__employee_index.values():
+            emp.detach_observer(self)
+        index: dict[int, Employee] = {}
+        refs: dict[int, list[Employee]] = {}
+        salaries: list[tuple[Employee, float]] = []
+        total = 0.0
+        for dep in self.__departments:
+            for emp in dep:
+                entries = refs.get(emp.id)
+                if entries is None:
+                    refs[emp.id] = [emp]
+                    index[emp.id] = emp
+                    salary = emp.calculate_salary()
+                    salaries.append((emp, salary))
+                    total += salary
+                    emp.attach_observer(self)
+                else:
+                    entries.append(emp)
+        self.__employee_index = index
+        self.__employee_refs = refs
+        self.__total_monthly_cost = total
+        self.__salary_index.rebuild(salaries)
+        self.__skill_index = SkillIndex(index.values())
+
+        registry: dict[int, Project] = {}
+        for proj in [*self.__projects.values(), *self.__pending_projects]:
+            other = registry.get(proj.project_id)
+            if other is None:
+                registry[proj.project_id] = proj
+            elif other is not proj:
+                proj.detach_observer(self)
+                errors.append(
+                    DuplicateIdError(f"Уже существует проект с ID: {proj.project_id}")
+                )
+        self.__pending_projects = []
+        self.__projects = registry
+
+        by_status: dict[str, dict[Project, None]] = {}
+        employee_projects: dict[int, dict[Project, None]] = {}
+        for proj in registry.values():
+            by_status.setdefault(proj.status, {})[proj] = None
+            for emp in proj.team:
+                employee_projects.setdefault(emp.id, {})[proj] = None
+        self.__projects_by_status = by_status
+        self.__employee_projects = employee_projects
+        self.__overloaded = {
+            emp_id: None
+            for emp_id, projects in employee_projects.items()
+            if len(projects) >= self.__overload_threshold
+        }
+        self.__version += 1
+        if self.__history is not None:
+            self.__history.capture(self)
+        return errors
+
     def _validate_unique_project_id(self, value: int) -> None:
         """Проверка уникальности ID проекта"""
         CompanyValidator.validate_positive_integer(value, "ID проекта")
-        if value in [p.project_id for p in self.projects]:
+        if value in self.__projects:
             raise DuplicateIdError(f"Уже существует проект с ID: {value}")
 
     @property
@@ -70,13 +504,44 @@ class Company:
         if not isinstance(value, Department):
             raise DepartmentNotFoundError()
         self.departments.append(value)
+        self.__departments_by_name.setdefault(value.name, value)
+        self.__version += 1
+        value.attach_observer(self)
+        if self.__bulk_depth:
+            value._begin_bulk()
+            return
+        for emp in value:
+            self._index_employee(emp)
+        if self.__history is not None:
+            for emp in value:
+                self.__history.record_employee(emp)
+                self.__history.join(emp.id, value.name)
+        self._notify("on_department_added", value)
 
     def _find_department(self, value: str) -> Optional[Department]:
         """Поиск отдела по имени в списке отделов компании"""
+        return self.__departments_by_name.get(value)
+
+    def _reindex_department_name(self, department: Department, name: str) -> None:
+        """Снимает отдел с имени и передает имя следующему отделу с тем же названием"""
+        if self.__departments_by_name.get(name) is not department:
+            return
+        del self.__departments_by_name[name]
         for dep in self.__departments:
-            if dep.name == value:
-                return dep
-        return None
+            if dep is not department and dep.name == name:
+                self.__departments_by_name[name] = dep
+                break
+
+    def on_department_renamed(self, department, old_name: str, new_name: str) -> None:
+        """Обновляет индекс отделов по имени"""
+        if department not in self.__departments:
+            return
+        self._reindex_department_name(department, old_name)
+        self.__departments_by_name.setdefault(new_name, department)
+        self.__payroll_version += 1
+        if self.__history is not None and not self.__bulk_depth:
+            members = [emp.id for emp in department]
+            self.__history.rename_department(old_name, new_name, members)
 
     def remove_department(self, value: str) -> None:
         """Удаление отдела по имени в списке отделов компании"""
@@ -86,6 +551,13 @@ class Company:
         if len(department) > 0:
             raise ValueError(f"Нельзя удалить отдел '{value}', в нем есть сотрудники")
         self.__departments.remove(department)
+        self._reindex_department_name(department, value)
+        self.__version += 1
+        department.detach_observer(self)
+        if self.__bulk_depth:
+            self.__bulk_errors.extend(department._end_bulk())
+            return
+        self._notify("on_department_removed", department)
 
     def get_departments(self) -> list[Department]:
         """Возвращает список отделов компании"""
@@ -94,19 +566,31 @@ class Company:
     @property
     def projects(self):
         """Возвращает список проектов компании"""
-        return self.__projects
+        return list(self.__projects.values())
 
     def add_project(self, value: Project) -> None:
         """Добавляет проект в компанию"""
-        self._validate_unique_project_id(value.project_id)
         if not isinstance(value, Project):
             raise ProjectNotFoundError()
-        self.projects.append(value)
+        if self.__bulk_depth:
+            self.__pending_projects.append(value)
+            value.attach_observer(self)
+            return
+        self._validate_unique_project_id(value.project_id)
+        self.__payroll_version += 1
+        self.__projects[value.project_id] = value
+        self.__projects_by_status.setdefault(value.status, {})[value] = None
+        value.attach_observer(self)
+        for emp in value.team:
+            self._index_team_member(value, emp)
+        if self.__history is not None:
+            self.__history.record_team(value.project_id, value.team)
+        self._notify("on_project_added", value)
 
     def _find_project(self, project_id: int) -> Optional[Project]:
         """Поиск проекта по ID"""
         CompanyValidator.validate_positive_integer(project_id, "ID проекта")
-        return next((p for p in self.projects if p.project_id == project_id), None)
+        return self.__projects.get(project_id)
 
     def get_projects(self) -> list[Project]:
         """Возвращает список проектов компании"""
@@ -119,16 +603,87 @@ class Company:
             raise ProjectNotFoundError()
         if proj.team:
             raise ValueError("Нельзя удалить проект, если над ним работает команда!")
-        self.projects.remove(proj)
+        del self.__projects[proj.project_id]
+        self.__payroll_version += 1
+        self.__projects_by_status[proj.status].pop(proj, None)
+        proj.detach_observer(self)
+        if not self.__bulk_depth:
+            if self.__history is not None:
+                self.__history.drop_project(proj.project_id)
+            self._notify("on_project_removed", proj)
 
-    def get_all_employees(self) -> list[Employee]:
-        """Возвращает список всех сотрудников компании"""
-        emp_list = []
+    def iter_all_employees(self) -> Iterator[Employee]:
+        """
+        Лениво перебирает сотрудников всех отделов без повторов по ID
+
+        Из объектов с одинаковым ID выдается тот же, что возвращает
+        find_employee_by_id: зарегистрированный в компании первым.
+        """
+        index = None if self.__bulk_depth else self.__employee_index
+        seen: set[int] = set()
         for dep in self.departments:
             for emp in dep:
-                if emp not in emp_list:
-                    emp_list.append(emp)
-        return emp_list
+                if emp.id in seen or (
+                    index is not None and index.get(emp.id) is not emp
+                ):
+                    continue
+                seen.add(emp.id)
+                yield emp
+
+    def _employees_view(self) -> tuple[Employee, ...]:
+        """Возвращает кэшированный список сотрудников текущей версии"""
+        if self.__employees_cache_version != self.__version:
+            self.__employees_cache = tuple(self.iter_all_employees())
+            self.__employees_cache_version = self.__version
+        return self.__employees_cache
+
+    def get_all_employees(self, as_of: Optional[Timestamp] = None) -> list[Employee]:
+        """
+        Возвращает список всех сотрудников компании
+
+        :param as_of: Момент времени; сотрудники восстанавливаются по истории
+        """
+        if as_of is None:
+            return list(self._employees_view())
+        return [
+            employee_from_dict(data)
+            for _, data, _ in self._require_history().iter_records(as_of)
+        ]
+
+    def sorted_employees(
+        self, by: Union[FieldSpec, Sequence[FieldSpec]] = "name"
+    ) -> list[Employee]:
+        """
+        Возвращает сотрудников компании, отсортированных по нескольким полям.
+
+        Ключи именованных полей кэшируются до изменения состава компании
+        или атрибутов ее сотрудников, поэтому повторная сортировка
+        не пересчитывает зарплаты.
+
+        :param by: Поле или список полей, например
+            ["department", "-salary", "name"]; "-" - по убыванию.
+        """
+        token = (self.__version, self.__attributes_version)
+        return sort_employees(self._employees_view(), by, self.__sort_keys, token)
+
+    def find_developers(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+        seniority: Optional[str] = None,
+        department: Optional[str] = None,
+    ) -> list[Employee]:
+        """
+        Ищет разработчиков компании по навыкам через индекс навыков.
+
+        :param all_of: Все перечисленные навыки (AND)
+        :param any_of: Хотя бы один из навыков (OR)
+        :param none_of: Ни одного из навыков (NOT)
+        :param seniority: Уровень seniority
+        :param department: Отдел сотрудника
+        """
+        return self.__skill_index.query(all_of, any_of, none_of, seniority, department)
 
     def transfer_employee(
         self,
@@ -161,27 +716,74 @@ class Company:
             if d == from_department:
                 d.remove_employee(employee.id)
 
-    def find_employee_by_id(self, employee_id: int) -> Optional[Employee]:
-        """Поиск сотрудника по ID"""
+    def find_employee_by_id(
+        self, employee_id: int, as_of: Optional[Timestamp] = None
+    ) -> Optional[Employee]:
+        """
+        Поиск сотрудника по ID
+
+        :param as_of: Момент времени; сотрудник восстанавливается по истории
+            отдельным объектом с данными на эту дату
+        """
         CompanyValidator.validate_positive_integer(employee_id, "ID сотрудника")
-        return next((e for e in self.get_all_employees() if e.id == employee_id), None)
+        if as_of is None:
+            return self.__employee_index.get(employee_id)
+        record = self._require_history().employee_record(employee_id, as_of)
+        return None if record is None else employee_from_dict(record[1])
 
-    def calculate_total_monthly_cost(self) -> float:
-        """Расчет общих месячных зарплат на затраты"""
-        total_salary = 0.0
-        for salary in self.get_all_employees():
-            s = salary.calculate_salary()
-            total_salary += s
-        return total_salary
+    def calculate_total_monthly_cost(self, as_of: Optional[Timestamp] = None) -> float:
+        """
+        Расчет общих месячных зарплат на затраты
+
+        :param as_of: Момент времени, на который считается фонд (нужна история)
+        """
+        if as_of is not None:
+            return self._require_history().total_salary(as_of)
+        if self.debug_payroll:
+            self.verify_payroll()
+        return self.__total_monthly_cost
+
+    def verify_payroll(self) -> None:
+        """Сверяет накопленные суммы зарплат компании и отделов с пересчетом"""
+        expected = sum(e.calculate_salary() for e in self.iter_all_employees())
+        if not math.isclose(
+            self.__total_monthly_cost, expected, rel_tol=1e-9, abs_tol=1e-6
+        ):
+            raise PayrollMismatchError(
+                f"Фонд оплаты труда компании: накоплено "
+                f"{self.__total_monthly_cost}, пересчет {expected}"
+            )
+        for dep in self.departments:
+            dep.verify_payroll()
+
+    def get_payroll_columns(self) -> PayrollColumns:
+        """
+        Возвращает колоночное зеркало входных данных зарплат (нужен numpy).
+
+        Зеркало перестраивается только после изменений состава или зарплат.
+        """
+        key = (self.__version, self.__payroll_version)
+        if self.__payroll_columns is None or self.__payroll_columns_key != key:
+            self.__payroll_columns = PayrollColumns.from_company(self)
+            self.__payroll_columns_key = key
+        return self.__payroll_columns
+
+    def simulate_payroll(
+        self, scenarios: Iterable[Scenario], workers: Optional[int] = None
+    ) -> list[ScenarioResult]:
+        """
+        Вычисляет сценарии изменения зарплат, не меняя сотрудников (нужен numpy).
+
+        :param scenarios: Сценарии "что если"
+        :param workers: Число процессов для параллельного расчета
+        :return: Итоги и отклонения по компании, отделам и проектам
+        """
+        engine = ScenarioEngine(self.get_payroll_columns())
+        return engine.evaluate_many(scenarios, workers)
 
     def get_projects_by_status(self, status: str) -> list[Project]:
         """Сортирует проекты по статусу"""
-        valide_projects: list[Project] = []
-        for proj in self.projects:
-            proj.validate_status(proj.status)
-            if proj.status == status:
-                valide_projects.append(proj)
-        return valide_projects
+        return list(self.__projects_by_status.get(status, ()))
 
     @staticmethod
     def _validate_path(filename: str, path: str):
@@ -196,73 +798,272 @@ class Company:
         os.makedirs(path, exist_ok=True)
         return filepath
 
-    def save_to_file(self, filename: str) -> None:
-        """Сохраняет данные отдела и сотрудников в JSON-файл."""
-        filepath = self._validate_path(filename, "data/json")
-        data = {
+    @property
+    def employees_by_id(self) -> Mapping[int, Employee]:
+        """Возвращает сотрудников отделов по ID (представление только для чтения)"""
+        return MappingProxyType(self.__employee_index)
+
+    def to_dict(self) -> dict:
+        """
+        Преобразует компанию с отделами и проектами в словарь.
+
+        Команды проектов ссылаются на сотрудников отделов по ID (team_ids),
+        полностью записываются только участники вне отделов компании.
+        """
+        employees = self.employees_by_id
+        return {
+            "format_version": self.FORMAT_VERSION,
             "name": self.name,
             "departments": [d.to_dict() for d in self.departments],
-            "projects": [p.to_dict() for p in self.projects],
+            "projects": [p.to_dict(employees) for p in self.projects],
         }
+
+    @classmethod
+    def _check_format_version(cls, version) -> None:
+        if not isinstance(version, int) or not 1 <= version <= cls.FORMAT_VERSION:
+            raise ValueError(f"Неподдерживаемая версия формата компании: {version}")
+
+    @staticmethod
+    def _employees_of(departments: Iterable[Department]) -> dict[int, Employee]:
+        """Сотрудники отделов по ID для разрешения ссылок team_ids"""
+        employees: dict[int, Employee] = {}
+        for department in departments:
+            for emp in department:
+                employees.setdefault(emp.id, emp)
+        return employees
+
+    @classmethod
+    def from_dict(cls, data: dict, trusted: bool = False) -> "Company":
+        """
+        Создание компании из словаря (в режиме массовой загрузки)
+
+        Читает и прежний формат без format_version, где участники проектов
+        записаны полностью и становятся отдельными объектами.
+
+        :param trusted: Данные из собственного снимка: поля сотрудников
+            не проверяются повторно (см. employee_from_dict)
+        """
+        cls._check_format_version(data.get("format_version", 1))
+        company = cls(data["name"])
+        departments = [Department.from_dict(d, trusted) for d in data["departments"]]
+        employees = cls._employees_of(departments)
+        with company.bulk_load():
+            for department in departments:
+                company.add_department(department)
+            for p in data["projects"]:
+                company.add_project(Project.from_dict(p, trusted, employees))
+        return company
+
+    @classmethod
+    def from_stream(cls, reader: JsonStreamReader, trusted: bool = False) -> "Company":
+        """
+        Создание компании из потока JSON по мере его разбора.
+
+        Каждый сотрудник создается сразу после чтения своей записи,
+        поэтому словари всех записей одновременно в памяти не находятся.
+        Проекты собираются после отделов, чтобы ссылки team_ids
+        разрешались при любом порядке ключей.
+
+        :param reader: Поток, следующее значение которого - словарь компании
+        :param trusted: Данные из собственного снимка (см. from_dict)
+        """
+        name = None
+        departments: list[Department] = []
+        project_records: list[tuple[dict, list[Employee]]] = []
+        for key in reader.iter_object():
+            if key == "departments":
+                for _ in reader.iter_array():
+                    fields, members = cls._read_unit(reader, "employees", trusted)
+                    department = Department.from_dict(fields, trusted)
+                    for emp in members:
+                        department.add_employee(emp)
+                    departments.append(department)
+            elif key == "projects":
+                for _ in reader.iter_array():
+                    project_records.append(cls._read_unit(reader, "team", trusted))
+            elif key == "format_version":
+                cls._check_format_version(reader.value())
+            elif key == "name":
+                name = reader.value()
+            else:
+                reader.value()
+        company = cls(name)
+        employees = cls._employees_of(departments)
+        with company.bulk_load():
+            for department in departments:
+                company.add_department(department)
+            for fields, team in project_records:
+                external = {emp.id: emp for emp in team}
+                if "team_ids" not in fields:
+                    # Прежний формат: участники прочитаны полностью
+                    fields["team_ids"] = [emp.id for emp in team]
+                project = Project.from_dict(
+                    fields, trusted, ChainMap(external, employees)
+                )
+                company.add_project(project)
+        return company
+
+    @staticmethod
+    def _read_unit(
+        reader: JsonStreamReader, members_key: str, trusted: bool
+    ) -> tuple[dict, list[Employee]]:
+        """
+        Читает словарь отдела или проекта из потока.
+
+        Сотрудники из списка members_key создаются по одному, а в словаре
+        полей этот список остается пустым.
+
+        :return: (поля для from_dict, список сотрудников)
+        """
+        fields: dict = {}
+        members: list[Employee] = []
+        for key in reader.iter_object():
+            if key == members_key:
+                for data in reader.iter_values():
+                    members.append(employee_from_dict(data, trusted))
+            else:
+                fields[key] = reader.value()
+        fields[members_key] = []
+        return fields, members
+
+    def save_to_file(
+        self, filename: str, streaming: bool = False, compact: bool = False
+    ) -> None:
+        """
+        Сохраняет данные отдела и сотрудников в JSON-файл.
+
+        :param streaming: Записывать отделы и сотрудников по одному через
+            буферизованный поток, не создавая словарь всей компании;
+            файл заменяется атомарно после успешной записи
+        :param compact: Записать без отступов и пробелов
+        """
+        filepath = self._validate_path(filename, "data/json")
+        indent = None if compact else 2
+        if streaming:
+            write_json_file(filepath, company_document(self), indent)
+            return
+        separators = (",", ":") if compact else None
         with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            json.dump(
+                self.to_dict(),
+                f,
+                ensure_ascii=False,
+                indent=indent,
+                separators=separators,
+            )
 
     @classmethod
-    def load_from_file(cls, filename: str) -> "Company":
-        """Загружает компанию из JSON-файла."""
+    def load_from_file(
+        cls,
+        filename: str,
+        streaming: bool = False,
+        on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> "Company":
+        """
+        Загружает компанию из JSON-файла.
+
+        :param streaming: Разбирать файл блоками и создавать сотрудников
+            по мере чтения, не загружая весь текст и все словари
+        :param on_progress: Вызывается при потоковой загрузке после каждого
+            прочитанного блока с числом прочитанных байт и размером файла
+        """
+        if streaming:
+            try:
+                filepath = cls._validate_path(filename, "data/json")
+                with open(filepath, "rb") as f:
+                    reader = JsonStreamReader(
+                        f, on_progress=on_progress, total=os.path.getsize(filepath)
+                    )
+                    company = cls.from_stream(reader)
+                    reader.finish()
+            except (OSError, json.JSONDecodeError) as error:
+                raise ValueError(f"Ошибка при чтении файла {filename}!") from error
+            return company
         try:
             filepath = cls._validate_path(filename, "data/json")
             with open(filepath, "r", encoding="utf-8") as f:
                 data = json.load(f)
         except:
             raise ValueError(f"Ошибка при чтении файла {filename}!")
+        return cls.from_dict(data)
 
-        company = cls(data["name"])
-        for d in data["departments"]:
-            department = Department.from_dict(d)
-            company.add_department(department)
-        for p in data["projects"]:
-            project = Project.from_dict(p)
-            company.add_project(project)
-        return company
+    def aggregate_employees(
+        self,
+        by: Union[FieldSpec, Sequence[FieldSpec]],
+        value: Optional[FieldSpec] = "salary",
+    ) -> dict:
+        """
+        Группирует сотрудников компании и считает count/sum/min/max/mean.
 
-    def get_department_stats(self) -> dict:
-        """Возвращает статистику по отделам."""
+        :param by: Поле группировки ("department", "type", "seniority",
+            любой атрибут, функция) или список полей.
+        :param value: Агрегируемое поле, по умолчанию итоговая зарплата.
+        """
+        return group_aggregate(self._employees_view(), by, value)
+
+    def get_department_stats(self, as_of: Optional[Timestamp] = None) -> dict:
+        """
+        Возвращает статистику по отделам.
+
+        :param as_of: Момент времени, на который строится статистика (нужна история)
+        """
+        if as_of is not None:
+            return self._department_stats_as_of(as_of)
         state = {}
         for d in self.departments:
+            by_type = group_aggregate(d, "type", value=None)
             state[d.name] = {
                 "employee_count": len(d),
-                "employee_types": d.get_employee_count(),
+                "employee_types": {t: s.count for t, s in by_type.items()},
                 "total_salary": d.calculate_total_salary(),
             }
         return state
 
+    def _department_stats_as_of(self, as_of: Timestamp) -> dict:
+        """Статистика по отделам на дату по версиям из истории"""
+        state: dict[str, dict] = {}
+        for salary, data, departments in self._require_history().iter_records(as_of):
+            for name in departments:
+                stats = state.setdefault(
+                    name,
+                    {"employee_count": 0, "employee_types": {}, "total_salary": 0.0},
+                )
+                stats["employee_count"] += 1
+                types = stats["employee_types"]
+                types[data["type"]] = types.get(data["type"], 0) + 1
+                stats["total_salary"] += salary
+        return state
+
     def get_project_budget_analysis(self) -> dict:
         """Возвращает анализ бюджетов проектов."""
-        analysis = {"total_budget": 0.0, "total_projects": len(self.projects)}
-        for proj in self.projects:
-            budget = proj.calculate_total_salary()
-            analysis["total_budget"] += budget
+        by_status: dict[str, AggregateStats] = group_aggregate(
+            self.__projects.values(),
+            "status",
+            value=lambda proj: proj.calculate_total_salary(self.__salary_index),
+        )
+        analysis = {
+            "total_budget": 0.0,
+            "total_projects": len(self.__projects),
+            "budget_by_status": {},
+        }
+        for status, stats in by_status.items():
+            analysis["total_budget"] += stats.total
+            analysis["budget_by_status"][status] = stats.to_dict()
         return analysis
 
     def find_overloaded_employees(self) -> list[Employee]:
         """
         Возвращает список перегруженных сотрудников, которые участвуют в нескольких проектах
         """
-        overloaded_employees = []
-        for emp in self.get_all_employees():
-            c = 0
-            for proj in self.projects:
-                if emp in proj.team:
-                    c += 1
-                if c >= 2:
-                    overloaded_employees.append(emp)
-                    break
-        return overloaded_employees
+        return [
+            self.__employee_index[emp_id]
+            for emp_id in self.__overloaded
+            if emp_id in self.__employee_index
+        ]
 
     def _find_project_by_id(self, value: int):
         CompanyValidator.validate_positive_integer(value, "ID проекта")
-        return next((p for p in self.get_projects() if p.project_id == value), None)
+        return self.__projects.get(value)
 
     def assign_employee_to_project(self, employee_id: int, project_id: int) -> bool:
         """Назначение сотрудника на проект."""
@@ -271,9 +1072,50 @@ class Company:
         project.add_team_member(employee)
         return True
 
+    def plan_staffing(
+        self, requests: Iterable[StaffingRequest], load_limit: Optional[int] = None
+    ) -> StaffingPlan:
+        """
+        Строит пакетный план назначений разработчиков по навыкам проектов.
+
+        :param requests: Запросы на укомплектование проектов
+        :param load_limit: Максимум проектов на сотрудника (по умолчанию
+            сотрудник не должен стать перегруженным)
+        """
+        return StaffingOptimizer(self, load_limit).plan(requests)
+
+    def apply_staffing(self, plan: StaffingPlan) -> None:
+        """
+        Применяет план назначений через add_team_member.
+
+        План проверяется целиком до первого назначения: если хотя бы одно
+        назначение невозможно, команды проектов не меняются. Индексы
+        обновляются инкрементально, как при обычном add_team_member.
+
+        :raises DuplicateIdError: Сотрудник уже в команде проекта
+            или назначен на один проект дважды
+        """
+        planned: dict[Project, set[int]] = {}
+        for assignment in plan.assignments:
+            project, employee = assignment.project, assignment.employee
+            if not isinstance(employee, Employee):
+                raise ValueError(
+                    "Добавляемый сотрудник должен быть из класса AbstractEmployee!"
+                )
+            ids = planned.setdefault(project, set())
+            if employee.id in ids or project.find_team_member(employee.id):
+                raise DuplicateIdError(
+                    f"Сотрудник {employee.id} уже в команде проекта "
+                    f"{project.project_id}!"
+                )
+            ids.add(employee.id)
+        for assignment in plan.assignments:
+            assignment.project.add_team_member(assignment.employee)
+
     def check_employee_availability(self, employee_id: int) -> bool:
         """Проверить доступность сотрудника (не перегружен ли)."""
-        return self.find_employee_by_id(employee_id) in self.find_overloaded_employees()
+        CompanyValidator.validate_positive_integer(employee_id, "ID сотрудника")
+        return employee_id in self.__employee_index and employee_id in self.__overloaded
 
     def export_employees_csv(self, filename: str) -> None:
         """Экспорт отчета по сотрудникам в CSV."""
@@ -285,7 +1127,7 @@ class Company:
             writer.writerow(
                 ["ID", "Имя", "Отдел", "Тип", "Базовая зарплата", "Итоговая зарплата"]
             )
-            for emp in self.get_all_employees():
+            for emp in self._employees_view():
                 writer.writerow(
                     [
                         emp.id,
@@ -314,7 +1156,7 @@ class Company:
                     "Бюджет команды",
                 ]
             )
-            for proj in self.__projects:
+            for proj in self.__projects.values():
                 writer.writerow(
                     [
                         proj.project_id,
@@ -322,6 +1164,6 @@ class Company:
                         proj.status,
                         proj.deadline,
                         proj.get_team_size(),
-                        proj.calculate_total_salary(),
+                        proj.calculate_total_salary(self.__salary_index),
                     ]
                 )
@@ -2,19 +2,107 @@
 
 from typing import Optional
 import json
+import math
 import os
 
 from .abstract_employee import AbstractEmployee
 from .employee import Employee
-from src.employees.developer import Developer
-from src.employees.manager import Manager
-from src.employees.salesperson import Salesperson
+
+# Импорт классов сотрудников регистрирует их типы для employee_from_dict
+from src.employees.developer import Developer  # noqa: F401
+from src.employees.manager import Manager  # noqa: F401
+from src.employees.salesperson import Salesperson  # noqa: F401
+from src.patterns.observer import IDepartmentObserver, IEmployeeObserver
+from src.utils.aggregation import group_aggregate
+from src.utils.exceptions import DuplicateIdError, PayrollMismatchError
+from src.utils.interning import STRING_POOL
+from src.utils.serialization import decode_employee
 from src.utils.validators import DepartmentValidator
 
 
-class Department:
+def employee_from_dict(data: dict, trusted: bool = False) -> Employee:
+    """
+    Создает сотрудника класса, указанного в поле "type" словаря.
+
+    Словарь не изменяется; повторяющиеся строки берутся из общего пула.
+
+    :param trusted: Данные заведомо корректны (собственный снимок):
+        поля не проверяются, выполняется только структурная проверка
+    """
+    return decode_employee(data, trusted)
+
+
+class MemberIndex:
+    """
+    Участники по ID в порядке добавления.
+
+    Участник хранится под порядковым номером добавления, а ID ссылается на
+    этот номер, поэтому смена ID (rekey) заменяет один ключ за O(1) и не
+    перестраивает словарь, а порядок обхода остается прежним.
+    """
+
+    __slots__ = ("__members", "__keys", "__seq_of", "__next_seq")
+
+    def __init__(self):
+        # Номер добавления -> участник и номер -> его текущий ID
+        self.__members: dict[int, AbstractEmployee] = {}
+        self.__keys: dict[int, int] = {}
+        self.__seq_of: dict[int, int] = {}
+        self.__next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self.__seq_of)
+
+    def __contains__(self, key) -> bool:
+        return key in self.__seq_of
+
+    def __iter__(self):
+        """ID участников в порядке добавления"""
+        return iter(self.__keys.values())
+
+    def __setitem__(self, key: int, member: AbstractEmployee) -> None:
+        seq = self.__seq_of.get(key)
+        if seq is None:
+            seq = self.__seq_of[key] = self.__next_seq
+            self.__next_seq += 1
+            self.__keys[seq] = key
+        self.__members[seq] = member
+
+    def __delitem__(self, key: int) -> None:
+        seq = self.__seq_of.pop(key)
+        del self.__keys[seq]
+        del self.__members[seq]
+
+    def get(self, key: int, default=None):
+        seq = self.__seq_of.get(key)
+        return default if seq is None else self.__members[seq]
+
+    def pop(self, key: int, default=None):
+        seq = self.__seq_of.pop(key, None)
+        if seq is None:
+            return default
+        del self.__keys[seq]
+        return self.__members.pop(seq)
+
+    def values(self):
+        return self.__members.values()
+
+    def items(self):
+        return zip(self.__keys.values(), self.__members.values())
+
+    def rekey(self, old_id: int, new_id: int) -> None:
+        """Переносит участника с ID old_id на new_id, не меняя его позиции"""
+        seq = self.__seq_of.pop(old_id)
+        self.__seq_of[new_id] = seq
+        self.__keys[seq] = new_id
+
+
+class Department(IEmployeeObserver):
     """Класс для управления отделом и его сотрудниками."""
 
+    # Режим отладки: сверять накопленную сумму зарплат с полным пересчетом
+    debug_payroll = False
+
     def __init__(self, name: str):
         """
         :param name: Название отдела.
@@ -23,7 +111,14 @@ class Department:
         validator.validate_name(name)
 
         self.__name = name
-        self.__employees: list[AbstractEmployee] = []
+        # Сотрудники по ID в порядке добавления и кэш для доступа по индексу
+        self.__employees = MemberIndex()
+        self.__sequence: Optional[list[AbstractEmployee]] = None
+        self.__observers: list[IDepartmentObserver] = []
+        self.__total_salary = 0.0
+        # Режим массовой загрузки: глубина вложенности и накопленные ошибки
+        self.__bulk_depth = 0
+        self.__bulk_errors: list[Exception] = []
 
     @property
     def name(self):
@@ -34,12 +129,32 @@ class Department:
     def name(self, value):
         """Установить название отдела."""
         DepartmentValidator.validate_name(value)
+        old_name = self.__name
         self.__name = value
+        if old_name != value:
+            self._notify("on_department_renamed", self, old_name, value)
 
     @property
     def employees(self):
         """Вернуть список сотрудников."""
-        return self.__employees
+        return list(self.__employees.values())
+
+    def attach_observer(self, observer: IDepartmentObserver) -> None:
+        """Подписывает наблюдателя на изменения состава отдела."""
+        if observer not in self.__observers:
+            self.__observers.append(observer)
+
+    def detach_observer(self, observer: IDepartmentObserver) -> None:
+        """Отписывает наблюдателя от изменений состава отдела."""
+        if observer in self.__observers:
+            self.__observers.remove(observer)
+
+    def _notify(self, event: str, *args) -> None:
+        """Вызывает обработчик события у всех наблюдателей, которые его поддерживают."""
+        for observer in list(self.__observers):
+            handler = getattr(observer, event, None)
+            if handler is not None:
+                handler(*args)
 
     def add_employee(self, employee: AbstractEmployee) -> None:
         """Добавляет нового сотрудника в отдел."""
@@ -47,36 +162,96 @@ class Department:
             raise ValueError(
                 "Добавляемый сотрудник должен быть из класса AbstractEmployee!"
             )
-        if employee in self.employees:
-            raise ValueError("Добавляемый сотрудник уже находится в отделе!")
-        self.employees.append(employee)
+        if employee.id in self.__employees:
+            error = ValueError("Добавляемый сотрудник уже находится в отделе!")
+            if self.__bulk_depth:
+                self.__bulk_errors.append(error)
+                return
+            raise error
+        self.__employees[employee.id] = employee
+        self.__sequence = None
+        if self.__bulk_depth:
+            return
+        self.__total_salary += employee.calculate_salary()
+        employee.attach_observer(self)
+        self._notify("on_employee_added", self, employee)
 
     def remove_employee(self, employee_id: int) -> None:
         """Удаляет сотрудника по его ID."""
-        employee = self.find_employee_by_id(employee_id)
+        employee = self.__employees.pop(employee_id, None)
         if not employee:
             raise ValueError("id сотрудника нет в списке!")
-        self.employees.remove(employee)
+        self.__sequence = None
+        employee.detach_observer(self)
+        if self.__bulk_depth:
+            return
+        if self.__employees:
+            self.__total_salary -= employee.calculate_salary()
+        else:
+            self.__total_salary = 0.0
+        self._notify("on_employee_removed", self, employee)
+
+    def on_salary_changed(self, employee, old_salary: float, new_salary: float) -> None:
+        """Обновляет накопленную сумму зарплат отдела."""
+        self.__total_salary += new_salary - old_salary
+
+    def on_employee_id_changing(self, employee, new_id: int) -> None:
+        """Отклоняет новый ID, если он уже занят другим сотрудником отдела."""
+        other = self.__employees.get(new_id)
+        if other is not None and other is not employee:
+            raise DuplicateIdError(f"Уже cуществует сотрудник с ID: {new_id}!")
+
+    def on_attribute_changed(
+        self, employee, attribute: str, old_value, new_value
+    ) -> None:
+        """Переносит сотрудника на новый ID с сохранением порядка."""
+        if attribute == "id" and self.__employees.get(old_value) is employee:
+            self.__employees.rekey(old_value, new_value)
+
+    def _begin_bulk(self) -> None:
+        """Включает режим массовой загрузки: проверки и уведомления откладываются."""
+        self.__bulk_depth += 1
+
+    def _end_bulk(self) -> list[Exception]:
+        """Завершает массовую загрузку одним проходом и возвращает ошибки."""
+        self.__bulk_depth -= 1
+        if self.__bulk_depth:
+            return []
+        total = 0.0
+        for emp in self.__employees.values():
+            total += emp.calculate_salary()
+            emp.attach_observer(self)
+        self.__total_salary = total
+        errors, self.__bulk_errors = self.__bulk_errors, []
+        return errors
 
     def get_employees(self) -> list[AbstractEmployee]:
         """Возвращает список сотрудников отдела."""
-        return self.__employees
+        return list(self.__employees.values())
 
     def calculate_total_salary(self) -> float:
         """Возвращает суммарную зарплату всех сотрудников отдела."""
-        return sum(emp.calculate_salary() for emp in self.employees)
+        if self.debug_payroll:
+            self.verify_payroll()
+        return self.__total_salary
+
+    def verify_payroll(self) -> None:
+        """Сверяет накопленную сумму зарплат с полным пересчетом."""
+        expected = sum(emp.calculate_salary() for emp in self)
+        if not math.isclose(self.__total_salary, expected, rel_tol=1e-9, abs_tol=1e-6):
+            raise PayrollMismatchError(
+                f"Сумма зарплат отдела '{self.name}': накоплено "
+                f"{self.__total_salary}, пересчет {expected}"
+            )
 
     def get_employee_count(self) -> dict[str, int]:
         """Возвращает количество сотрудников по типам."""
-        counter: dict[str, int] = {}
-        for emp in self.employees:
-            name = emp.__class__.__name__
-            counter[name] = counter.get(name, 0) + 1
-        return counter
+        by_type = group_aggregate(self, "type", value=None)
+        return {name: stats.count for name, stats in by_type.items()}
 
     def find_employee_by_id(self, employee_id: int) -> Optional[AbstractEmployee]:
         """Ищет сотрудника по ID."""
-        return next((e for e in self.employees if e.id == employee_id), None)
+        return self.__employees.get(employee_id)
 
     @staticmethod
     def validate_path_json(filename: str, path: str):
@@ -92,7 +267,7 @@ class Department:
     def to_dict(self) -> dict:
         """Преобразует объект в словарь без приватных префиксов."""
         data_department = {"name": self.name}
-        data_department["employees"] = [e.to_dict() for e in self.employees]
+        data_department["employees"] = [e.to_dict() for e in self]
         return data_department
 
     def save_to_file(self, filename: str) -> None:
@@ -100,26 +275,21 @@ class Department:
         filepath = self.validate_path_json(filename, "data/json")
         data = {
             "name": self.name,
-            "employees": [emp.to_dict() for emp in self.employees],
+            "employees": [emp.to_dict() for emp in self],
         }
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
     @classmethod
-    def from_dict(cls, data: dict) -> "Department":
+    def from_dict(cls, data: dict, trusted: bool = False) -> "Department":
         """
         Создание экземпляра Department из словаря.
+
+        :param trusted: Пропустить проверку полей сотрудников (см. employee_from_dict)
         """
-        department = cls(data["name"])
+        department = cls(STRING_POOL.intern(data["name"]))
         for emp_data in data["employees"]:
-            if "bonus" in emp_data:
-                department.add_employee(Manager.from_dict(emp_data))
-            elif "tech_stack" in emp_data:
-                department.add_employee(Developer.from_dict(emp_data))
-            elif "commission_rate" in emp_data:
-                department.add_employee(Salesperson.from_dict(emp_data))
-            else:
-                department.add_employee(Employee.from_dict(emp_data))
+            department.add_employee(employee_from_dict(emp_data, trusted))
         return department
 
     @classmethod
@@ -135,16 +305,24 @@ class Department:
 
     def __len__(self) -> int:
         """Возвращает количество сотрудников."""
-        return len(self.employees)
+        return len(self.__employees)
 
     def __getitem__(self, key) -> AbstractEmployee:
         """Позволяет обращаться к сотруднику по индексу."""
-        return self.employees[key]
+        if self.__sequence is None:
+            self.__sequence = list(self.__employees.values())
+        return self.__sequence[key]
 
     def __contains__(self, employee: AbstractEmployee) -> bool:
         """Проверяет, находится ли сотрудник в отделе."""
-        return employee in self.employees
+        if isinstance(employee, AbstractEmployee):
+            return employee.id in self.__employees
+        if isinstance(employee, int):
+            return employee in self.__employees
+        raise ValueError(
+            "Необходимо использовать аргументы из классов AbstractEmployee или int!"
+        )
 
     def __iter__(self):
         """Позволяет итерироваться по сотрудникам отдела."""
-        return iter(self.employees)
+        return iter(self.__employees.values())
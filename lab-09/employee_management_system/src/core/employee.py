@@ -1,12 +1,23 @@
 """Базовый класс Employee с инкапсуляцией данных."""
 
+from typing import Optional
+
 from src.core.abstract_employee import AbstractEmployee
+from src.patterns.observer import IEmployeeObserver
+from src.utils.serialization import codec_for, register_employee_type
 from src.utils.validators import EmployeeValidator
 
 
+@register_employee_type
 class Employee(AbstractEmployee):
     """Обычный сотрудник без дополнительных параметров."""
 
+    # Атрибуты хранятся в слотах, без __dict__ у каждого экземпляра
+    __slots__ = ("__id", "__name", "__department", "__base_salary", "__observers")
+    # Описание полей для сериализатора (см. EmployeeCodec)
+    _pooled_fields = ("department",)
+    _transient_slots = ("__observers",)
+
     def __init__(self, id: int, name: str, department: str, base_salary: float):
         """
         Инициализация базовых атрибутов сотрудника.
@@ -26,6 +37,52 @@ class Employee(AbstractEmployee):
         self.__name = name
         self.__department = department
         self.__base_salary = base_salary
+        # Кортеж вместо списка: у большинства сотрудников 0-2 наблюдателя,
+        # а пустой кортеж не занимает памяти
+        self.__observers: tuple[IEmployeeObserver, ...] = ()
+
+    def attach_observer(self, observer: IEmployeeObserver) -> None:
+        """Подписывает наблюдателя на изменения сотрудника."""
+        if observer not in self.__observers:
+            self.__observers = (*self.__observers, observer)
+
+    def detach_observer(self, observer: IEmployeeObserver) -> None:
+        """Отписывает наблюдателя от изменений сотрудника."""
+        if observer in self.__observers:
+            observers = list(self.__observers)
+            observers.remove(observer)
+            self.__observers = tuple(observers)
+
+    def _salary_before_change(self) -> Optional[float]:
+        """Запоминает зарплату перед изменением, если за сотрудником наблюдают."""
+        return self.calculate_salary() if self.__observers else None
+
+    def _notify_salary_changed(self, old_salary: Optional[float]) -> None:
+        """Сообщает наблюдателям об изменении итоговой зарплаты."""
+        if old_salary is None:
+            return
+        new_salary = self.calculate_salary()
+        if new_salary != old_salary:
+            for observer in self.__observers:
+                observer.on_salary_changed(self, old_salary, new_salary)
+
+    def _notify_attribute_changed(self, attribute: str, old_value, new_value) -> None:
+        """Сообщает наблюдателям об изменении атрибута сотрудника."""
+        if old_value == new_value:
+            return
+        for observer in self.__observers:
+            observer.on_attribute_changed(self, attribute, old_value, new_value)
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict) -> "Employee":
+        """
+        Создание сотрудника из заведомо корректного словаря без проверки полей.
+
+        Для внутренних загрузчиков (собственные снимки, массовый импорт):
+        проверяется только структура - тип и наличие полей. Словарь
+        не изменяется.
+        """
+        return codec_for(cls).decode_trusted(data)
 
     @property
     def id(self) -> int:
@@ -34,9 +91,21 @@ class Employee(AbstractEmployee):
 
     @id.setter
     def id(self, value: int) -> None:
-        """Установить ID сотрудника."""
+        """
+        Установить ID сотрудника.
+
+        Наблюдатели сначала проверяют новый ID (и могут отклонить его),
+        затем получают событие изменения атрибута "id" и переиндексируют
+        сотрудника.
+        """
         EmployeeValidator.validate_id(value)
+        old_id = self.__id
+        if value == old_id:
+            return
+        for observer in self.__observers:
+            observer.on_employee_id_changing(self, value)
         self.__id = value
+        self._notify_attribute_changed("id", old_id, value)
 
     @property
     def name(self) -> str:
@@ -47,7 +116,9 @@ class Employee(AbstractEmployee):
     def name(self, value: str) -> None:
         """Установить имя сотрудника."""
         EmployeeValidator.validate_name(value)
+        old_name = self.__name
         self.__name = value
+        self._notify_attribute_changed("name", old_name, value)
 
     @property
     def department(self) -> str:
@@ -58,7 +129,9 @@ class Employee(AbstractEmployee):
     def department(self, value: str) -> None:
         """Установить отдел сотрудника."""
         EmployeeValidator.validate_department(value)
+        old_department = self.__department
         self.__department = value
+        self._notify_attribute_changed("department", old_department, value)
 
     @property
     def base_salary(self) -> float:
@@ -69,7 +142,11 @@ class Employee(AbstractEmployee):
     def base_salary(self, value: float) -> None:
         """Установить базовую зарплату сотрудника."""
         EmployeeValidator.validate_base_salary(value)
+        old_salary = self._salary_before_change()
+        old_base = self.__base_salary
         self.__base_salary = float(value)
+        self._notify_salary_changed(old_salary)
+        self._notify_attribute_changed("base_salary", old_base, float(value))
 
     def __str__(self):
         """Возвращает строковое представление объекта сотрудника."""
@@ -117,19 +194,11 @@ class Employee(AbstractEmployee):
     @classmethod
     def from_dict(cls, data: dict) -> "Employee":
         """
-        Создание экземпляра Employee из словаря.
+        Создание экземпляра Employee (или подкласса) из словаря.
+
+        Поля проверяются конструктором; словарь не изменяется.
         """
-        if not data["type"] == cls.__name__:
-            raise ValueError("Неподходящий тип данных!")
-        del data["type"]
-
-        required_fields = ["id", "name", "department", "base_salary"]
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(
-                    f"Для создания {cls.__name__} отсутствует поле: '{field}'"
-                )
-        return cls(**data)
+        return codec_for(cls).decode(data)
 
     def calculate_salary(self):
         """Возвращает базовую зарплату."""
@@ -141,8 +210,4 @@ class Employee(AbstractEmployee):
 
     def to_dict(self):
         """Преобразует объект в словарь без приватных префиксов."""
-        data = self.__dict__
-        data_employee = {"type": self.__class__.__name__}
-        for i in data:
-            data_employee[i.split("__")[-1]] = data[i]
-        return data_employee
+        return codec_for(type(self)).encode(self)
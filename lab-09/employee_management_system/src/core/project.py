@@ -1,14 +1,12 @@
 """Класс Project (Проект) с композицией сотрудников."""
 
-from typing import Optional
+from typing import Mapping, Optional
 
 from .employee import Employee
-from .department import Department
+from .department import Department, MemberIndex, employee_from_dict
 from .abstract_employee import AbstractEmployee
-from src.employees.developer import Developer
-from src.employees.manager import Manager
-from src.employees.salesperson import Salesperson
-from src.utils.exceptions import DuplicateIdError
+from src.utils.exceptions import DuplicateIdError, EmployeeNotFoundError
+from src.utils.interning import STRING_POOL
 from src.utils.validators import ProjectValidator
 
 
@@ -22,6 +20,7 @@ class Project(Department):
         description: str,
         deadline: str,
         status: str = "planning",
+        required_skills: Optional[list[str]] = None,
     ):
         """
         Инициализация базовых атрибутов проекта
@@ -31,6 +30,7 @@ class Project(Department):
         :param description: описание проекта
         :param deadline: срок выполнения проекта
         :param status: статус проекта ("planning", "active", "completed", "cancelled")
+        :param required_skills: навыки, которые должна покрывать команда проекта
         """
         super().__init__(name)
 
@@ -40,17 +40,21 @@ class Project(Department):
         validator.validate_description(description)
         validator.validate_deadline(deadline)
         validator.validate_status(status)
+        if required_skills is None:
+            required_skills = []
+        validator.validate_required_skills(required_skills)
 
         self.__project_id = project_id
         self.__description = description
         self.__deadline = deadline
         self.__status = status
-        self.__team: list[Employee] = []
+        self.__required_skills = list(required_skills)
+        self.__team = MemberIndex()
 
     def _validate_unique_employee_id(self, value: int) -> None:
         """Проверка уникальности ID сотрудника"""
         ProjectValidator.validate_positive_integer(value, "ID сотрудника")
-        if value in [e.id for e in self.get_team()]:
+        if value in self.__team:
             raise DuplicateIdError(f"Уже cуществует сотрудник с ID: {value}!")
 
     @property
@@ -62,18 +66,19 @@ class Project(Department):
     def project_id(self, value: int):
         """Устанавливает идентификатор проекта с проверкой."""
         ProjectValidator.validate_id(value)
+        self._notify("on_project_id_changing", self, value)
         self.__project_id = value
 
     @property
     def name(self):
         """Возвращает название проекта."""
-        return self.__name
+        return Department.name.fget(self)
 
     @name.setter
     def name(self, value: str):
         """Устанавливает название проекта с проверкой."""
         ProjectValidator.validate_name(value)
-        self.__name = value
+        Department.name.fset(self, value)
 
     @property
     def description(self):
@@ -105,12 +110,26 @@ class Project(Department):
     def status(self, value: str):
         """Устанавливает статус проекта с проверкой."""
         ProjectValidator.validate_status(value)
+        old_status = self.__status
         self.__status = value
+        if old_status != value:
+            self._notify("on_status_changed", self, old_status, value)
+
+    @property
+    def required_skills(self) -> list[str]:
+        """Возвращает навыки, требуемые в проекте."""
+        return self.__required_skills.copy()
+
+    @required_skills.setter
+    def required_skills(self, value: list[str]) -> None:
+        """Устанавливает требуемые навыки проекта с проверкой."""
+        ProjectValidator.validate_required_skills(value)
+        self.__required_skills = list(value)
 
     @property
     def team(self):
         """Возвращает список сотрудников проекта."""
-        return self.__team
+        return list(self.__team.values())
 
     def add_team_member(self, employee: Employee) -> None:
         """Добавляет сотрудника в проект"""
@@ -118,34 +137,76 @@ class Project(Department):
             raise ValueError(
                 "Добавляемый сотрудник должен быть из класса AbstractEmployee!"
             )
-        if employee in self.team:
+        if employee.id in self.__team:
             raise ValueError("Добавляемый сотрудник уже находится в проекте!")
         self._validate_unique_employee_id(employee.id)
-        self.team.append(employee)
+        self.__team[employee.id] = employee
+        employee.attach_observer(self)
+        self._notify("on_team_member_added", self, employee)
 
     def find_team_member(self, employee_id: int) -> Optional[AbstractEmployee]:
         """Ищет сотрудника в проекте по id"""
         ProjectValidator.validate_positive_integer(employee_id, "ID сотрудника")
-        return next((e for e in self.team if e.id == employee_id), None)
+        return self.__team.get(employee_id)
 
     def remove_team_member(self, employee_id: int) -> None:
         """Удаляет сотрудника из отдела по id"""
         employee = self.find_team_member(employee_id)
         if not employee:
             raise ValueError("Cотрудника нет в списке!")
-        self.team.remove(employee)
+        del self.__team[employee_id]
+        if Department.find_employee_by_id(self, employee_id) is not employee:
+            employee.detach_observer(self)
+        self._notify("on_team_member_removed", self, employee)
+
+    def on_salary_changed(self, employee, old_salary: float, new_salary: float) -> None:
+        """Учитывает зарплату только сотрудников отдела, а не участников команды"""
+        if Department.find_employee_by_id(self, employee.id) is employee:
+            super().on_salary_changed(employee, old_salary, new_salary)
+
+    def on_employee_id_changing(self, employee, new_id: int) -> None:
+        """Отклоняет новый ID, если он уже занят другим участником команды"""
+        super().on_employee_id_changing(employee, new_id)
+        other = self.__team.get(new_id)
+        if other is not None and other is not employee:
+            raise DuplicateIdError(f"Уже cуществует сотрудник с ID: {new_id}!")
+
+    def on_attribute_changed(
+        self, employee, attribute: str, old_value, new_value
+    ) -> None:
+        """Переносит участника команды на новый ID с сохранением порядка"""
+        super().on_attribute_changed(employee, attribute, old_value, new_value)
+        if attribute == "id" and self.__team.get(old_value) is employee:
+            self.__team.rekey(old_value, new_value)
+            self._notify("on_team_member_id_changed", self, employee, old_value)
 
     def get_team(self) -> list[Employee]:
         """Возвращает список команды сотрудников"""
-        return self.__team
+        return list(self.__team.values())
 
     def get_team_size(self) -> int:
         """Возвращает размер команды сотрудников"""
-        return len(self.team)
+        return len(self.__team)
 
-    def calculate_total_salary(self) -> float:
-        """Расчет суммарной зарплаты команды сотрудников"""
-        return sum(emp.calculate_salary() for emp in self.team)
+    def calculate_total_salary(self, salary_index=None) -> float:
+        """
+        Расчет суммарной зарплаты команды сотрудников
+
+        :param salary_index: Индекс зарплат (SalaryIndex), из которого берутся
+            уже рассчитанные зарплаты; сотрудники, которых нет в индексе,
+            рассчитываются напрямую
+        """
+        total = 0.0
+        if salary_index is None:
+            for emp in self.__team.values():
+                total += emp.calculate_salary()
+            return total
+        for emp_id, emp in self.__team.items():
+            if salary_index.get(emp_id) is emp:
+                total += salary_index.salary_of(emp_id)
+            else:
+                total += emp.calculate_salary()
+        return total
 
     def get_project_info(self) -> str:
         """Возвращает полную информацию о проекте"""
@@ -159,43 +220,72 @@ class Project(Department):
         )
         return info
 
-    def to_dict(self):
-        """Преобразует объект в словарь без приватных префиксов."""
-        data = self.__dict__
-        data_project = {}
-        for i in data:
-            value = i[1:].split("__")[-1]
-            if value == "deadline":
-                data_project[value] = str(data[i])
-            elif value == "team":
-                data_project[value] = [e.to_dict() for e in data[i]]
-            else:
-                data_project[value] = data[i]
-        return data_project
+    def to_dict(self, employees: Optional[Mapping[int, Employee]] = None):
+        """
+        Преобразует объект в словарь без приватных префиксов.
+
+        :param employees: Сотрудники компании по ID. Если заданы, команда
+            записывается списком ID (team_ids), а полностью в team попадают
+            только участники, которых нет среди этих сотрудников
+        """
+        data = {
+            "name": self.name,
+            "employees": [e.to_dict() for e in self.employees],
+            "project_id": self.__project_id,
+            "description": self.__description,
+            "deadline": str(self.__deadline),
+            "status": self.__status,
+            "required_skills": self.__required_skills.copy(),
+        }
+        team = self.__team.values()
+        if employees is None:
+            data["team"] = [e.to_dict() for e in team]
+        else:
+            data["team_ids"] = list(self.__team)
+            data["team"] = [e.to_dict() for e in team if employees.get(e.id) is not e]
+        return data
 
     def change_status(self, new_status: str) -> None:
         """Изменяет статус проекта"""
         self.status = new_status
 
     @classmethod
-    def from_dict(cls, data: dict):
+    def from_dict(
+        cls,
+        data: dict,
+        trusted: bool = False,
+        employees: Optional[Mapping[int, Employee]] = None,
+    ):
         """
         Создание экземпляра Project из словаря.
+
+        :param trusted: Пропустить проверку полей участников (см. employee_from_dict)
+        :param employees: Сотрудники компании по ID, на которых ссылается
+            team_ids; участники из team создаются заново
+        :raises EmployeeNotFoundError: Участник из team_ids не найден
         """
         project = Project(
             data["project_id"],
             data["name"],
             data["description"],
             data["deadline"],
-            data["status"],
+            STRING_POOL.intern(data["status"]),
+            STRING_POOL.intern_list(data.get("required_skills", [])),
         )
-        for emp_data in data["team"]:
-            if "bonus" in emp_data:
-                project.add_team_member(Manager.from_dict(emp_data))
-            elif "tech_stack" in emp_data:
-                project.add_team_member(Developer.from_dict(emp_data))
-            elif "commission_rate" in emp_data:
-                project.add_team_member(Salesperson.from_dict(emp_data))
-            else:
-                project.add_team_member(Employee.from_dict(emp_data))
+        team = [employee_from_dict(emp_data, trusted) for emp_data in data["team"]]
+        if "team_ids" not in data:
+            # Прежний формат: все участники записаны полностью
+            for emp in team:
+                project.add_team_member(emp)
+            return project
+        external = {emp.id: emp for emp in team}
+        for employee_id in data["team_ids"]:
+            emp = external.get(employee_id)
+            if emp is None and employees is not None:
+                emp = employees.get(employee_id)
+            if emp is None:
+                raise EmployeeNotFoundError(
+                    f"Участник проекта с ID {employee_id} не найден!"
+                )
+            project.add_team_member(emp)
         return project
@@ -1,12 +1,21 @@
 """Класс Developer (Разработчик)."""
 
 from src.core.employee import Employee
+from src.utils.serialization import register_employee_type
 from src.utils.validators import EmployeeValidator
 
+# Коэффициенты зарплаты по уровню seniority
+SENIORITY_COEFFICIENTS = {"junior": 1.0, "middle": 1.5, "senior": 2.0}
 
+
+@register_employee_type
 class Developer(Employee):
     """Разработчик с уровнем seniority и стеком технологий."""
 
+    __slots__ = ("__tech_stack", "__seniority_level")
+    _pooled_fields = ("seniority_level",)
+    _pooled_lists = ("tech_stack",)
+
     def __init__(
         self,
         id: int,
@@ -39,6 +48,14 @@ class Developer(Employee):
         """Получить стек технологий."""
         return self.__tech_stack.copy()
 
+    @tech_stack.setter
+    def tech_stack(self, value: list[str]) -> None:
+        """Установить стек технологий."""
+        EmployeeValidator.validate_tech_stack(value)
+        old_stack = self.__tech_stack
+        self.__tech_stack = list(value)
+        self._notify_attribute_changed("tech_stack", old_stack, self.__tech_stack)
+
     @property
     def seniority_level(self) -> str:
         """Получить уровень seniority."""
@@ -48,7 +65,11 @@ class Developer(Employee):
     def seniority_level(self, value: str) -> None:
         """Установить уровень seniority."""
         EmployeeValidator.validate_seniority_level(value)
+        old_salary = self._salary_before_change()
+        old_level = self.__seniority_level
         self.__seniority_level = value
+        self._notify_salary_changed(old_salary)
+        self._notify_attribute_changed("seniority_level", old_level, value)
 
     def __str__(self):
         """Возвращает строковое представление разработчика."""
@@ -58,31 +79,9 @@ class Developer(Employee):
         """Позволяет итерироваться по стеку технологий."""
         return iter(self.tech_stack)
 
-    @classmethod
-    def from_dict(cls, data: dict) -> Employee:
-        """Создаёт объект Developer из словаря."""
-        if not data["type"] == cls.__name__:
-            raise ValueError("Неподходящий тип данных!")
-        del data["type"]
-        required_fields = [
-            "id",
-            "name",
-            "department",
-            "base_salary",
-            "tech_stack",
-            "seniority_level",
-        ]
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(
-                    f"Для создания {cls.__name__} отсутствует поле: '{field}'"
-                )
-        return cls(**data)
-
     def calculate_salary(self):
         """Вычисляет зарплату в зависимости от уровня seniority."""
-        coef = {"junior": 1.0, "middle": 1.5, "senior": 2.0}
-        return self.base_salary * coef.get(self.__seniority_level)
+        return self.base_salary * SENIORITY_COEFFICIENTS[self.__seniority_level]
 
     def add_skill(self, new_skill: str) -> None:
         """Добавляет новую технологию в стек."""
@@ -90,4 +89,4 @@ class Developer(Employee):
             raise ValueError("Технология стека должна быть строкой!")
         if not new_skill.strip():
             raise ValueError("Технология стека не может быть пустой строкой!")
-        self.tech_stack.append(new_skill)
+        self.tech_stack = [*self.__tech_stack, new_skill]
@@ -1,12 +1,16 @@
 """Класс Manager (Менеджер)."""
 
 from src.core.employee import Employee
+from src.utils.serialization import register_employee_type
 from src.utils.validators import EmployeeValidator
 
 
+@register_employee_type
 class Manager(Employee):
     """Менеджер с бонусом."""
 
+    __slots__ = ("__bonus",)
+
     def __init__(
         self, id: int, name: str, department: str, base_salary: float, bonus: float
     ):
@@ -34,21 +38,11 @@ class Manager(Employee):
     def bonus(self, value: float) -> None:
         """Установить бонус с проверкой."""
         EmployeeValidator.validate_bonus(value)
+        old_salary = self._salary_before_change()
+        old_bonus = self.__bonus
         self.__bonus = value
-
-    @classmethod
-    def from_dict(cls, data: dict) -> Employee:
-        """Создаёт объект Manager из словаря."""
-        if not data["type"] == cls.__name__:
-            raise ValueError("Неподходящий тип данных!")
-        del data["type"]
-        required_fields = ["id", "name", "department", "base_salary", "bonus"]
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(
-                    f"Для создания {cls.__name__} отсутствует поле: '{field}'"
-                )
-        return cls(**data)
+        self._notify_salary_changed(old_salary)
+        self._notify_attribute_changed("bonus", old_bonus, value)
 
     def __str__(self):
         """Возвращает строковое представление менеджера."""
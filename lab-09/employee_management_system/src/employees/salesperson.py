@@ -1,12 +1,16 @@
 """Класс Salesperson (Продавец)."""
 
 from src.core.employee import Employee
+from src.utils.serialization import register_employee_type
 from src.utils.validators import EmployeeValidator
 
 
+@register_employee_type
 class Salesperson(Employee):
     """Продавец с комиссией и объемом продаж."""
 
+    __slots__ = ("__commission_rate", "__sales_volume")
+
     def __init__(
         self,
         id: int,
@@ -43,7 +47,11 @@ class Salesperson(Employee):
     def commission_rate(self, value: float) -> None:
         """Установить процент комиссии."""
         EmployeeValidator.validate_commission_rate(value)
+        old_salary = self._salary_before_change()
+        old_rate = self.__commission_rate
         self.__commission_rate = float(value)
+        self._notify_salary_changed(old_salary)
+        self._notify_attribute_changed("commission_rate", old_rate, float(value))
 
     @property
     def sales_volume(self) -> float:
@@ -54,33 +62,16 @@ class Salesperson(Employee):
     def sales_volume(self, value: float) -> None:
         """Установить объем продаж."""
         EmployeeValidator.validate_sales_volume(value)
+        old_salary = self._salary_before_change()
+        old_volume = self.__sales_volume
         self.__sales_volume = float(value)
+        self._notify_salary_changed(old_salary)
+        self._notify_attribute_changed("sales_volume", old_volume, float(value))
 
     def __str__(self):
         """Возвращает строковое представление продавца."""
         return f"Продавец [id: {self.id}, имя: {self.name}, отдел: {self.department}, базовая зарплата: {self.base_salary}, процент комиссии: {self.commission_rate}, объем продаж: {self.sales_volume}]"
 
-    @classmethod
-    def from_dict(cls, data: dict) -> Employee:
-        """Создаёт объект Salesperson из словаря."""
-        if not data["type"] == cls.__name__:
-            raise ValueError("Неподходящий тип данных!")
-        del data["type"]
-        required_fields = [
-            "id",
-            "name",
-            "department",
-            "base_salary",
-            "commission_rate",
-            "sales_volume",
-        ]
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(
-                    f"Для создания {cls.__name__} отсутствует поле: '{field}'"
-                )
-        return cls(**data)
-
     def calculate_salary(self):
         """Вычисляет итоговую зарплату продавца."""
         return self.base_salary + (self.sales_volume * self.commission_rate)
@@ -6,6 +6,7 @@ from src.core.abstract_employee import AbstractEmployee
 from src.employees.developer import Developer
 from src.employees.manager import Manager
 from src.employees.salesperson import Salesperson
+from src.utils.interning import intern_employee_data
 
 
 class EmployeeFactory(ABC):
@@ -35,6 +36,7 @@ class ManagerFactory(EmployeeFactory):
     @classmethod
     def create_employee(cls, **kwargs) -> Manager:
         cls._check_params(["bonus"], kwargs)
+        intern_employee_data(kwargs)
 
         return Manager(
             id=kwargs["id"],
@@ -51,6 +53,7 @@ class DeveloperFactory(EmployeeFactory):
     @classmethod
     def create_employee(cls, **kwargs) -> Developer:
         cls._check_params(["tech_stack", "seniority_level"], kwargs)
+        intern_employee_data(kwargs)
 
         return Developer(
             id=kwargs["id"],
@@ -68,6 +71,7 @@ class SalespersonFactory(EmployeeFactory):
     @classmethod
     def create_employee(cls, **kwargs) -> Salesperson:
         cls._check_params(["commission_rate", "sales_volume"], kwargs)
+        intern_employee_data(kwargs)
 
         return Salesperson(
             id=kwargs["id"],
@@ -7,6 +7,7 @@ from src.core.employee import Employee
 from src.employees.manager import Manager
 from src.employees.developer import Developer
 from src.employees.salesperson import Salesperson
+from src.utils.interning import STRING_POOL
 
 
 class EmployeeBuilder:
@@ -90,6 +91,8 @@ class EmployeeBuilder:
             raise ValueError("Необходимо ввести базовую зарплату сотрудника!")
 
         employee_type = self._employee_type or "employee"
+        # Отдел и навыки повторяются у многих сотрудников: берем общие строки
+        self._department = STRING_POOL.intern(self._department)
 
         if employee_type == "manager":
             if self._bonus is None:
@@ -106,6 +109,8 @@ class EmployeeBuilder:
                 self._tech_stack = []
             if self._seniority_level is None:
                 self._seniority_level = "junior"
+            self._tech_stack = STRING_POOL.intern_list(self._tech_stack)
+            self._seniority_level = STRING_POOL.intern(self._seniority_level)
             return Developer(
                 id=self._id,
                 name=self._name,
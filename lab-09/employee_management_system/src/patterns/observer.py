@@ -0,0 +1,69 @@
+"""Observer паттерн - уведомления об изменениях в отделах, проектах и у сотрудников."""
+
+from abc import ABC
+
+
+class IDepartmentObserver(ABC):
+    """Абстрактный класс. Наблюдатель за составом отдела."""
+
+    def on_employee_added(self, department, employee) -> None:
+        """Вызывается после добавления сотрудника в отдел."""
+
+    def on_employee_removed(self, department, employee) -> None:
+        """Вызывается после удаления сотрудника из отдела."""
+
+    def on_department_renamed(self, department, old_name: str, new_name: str) -> None:
+        """Вызывается после переименования отдела."""
+
+
+class IProjectObserver(ABC):
+    """Абстрактный класс. Наблюдатель за командой проекта."""
+
+    def on_team_member_added(self, project, employee) -> None:
+        """Вызывается после добавления сотрудника в команду проекта."""
+
+    def on_team_member_removed(self, project, employee) -> None:
+        """Вызывается после удаления сотрудника из команды проекта."""
+
+    def on_status_changed(self, project, old_status: str, new_status: str) -> None:
+        """Вызывается после изменения статуса проекта."""
+
+    def on_project_id_changing(self, project, new_id: int) -> None:
+        """Вызывается перед изменением ID проекта; может отклонить изменение."""
+
+    def on_team_member_id_changed(self, project, employee, old_id: int) -> None:
+        """Вызывается после изменения ID участника команды проекта."""
+
+
+class IEmployeeObserver(ABC):
+    """Абстрактный класс. Наблюдатель за изменениями сотрудника."""
+
+    def on_salary_changed(self, employee, old_salary: float, new_salary: float) -> None:
+        """Вызывается после изменения итоговой зарплаты сотрудника."""
+
+    def on_attribute_changed(
+        self, employee, attribute: str, old_value, new_value
+    ) -> None:
+        """Вызывается после изменения атрибута сотрудника (имя, отдел, зарплата, ...)."""
+
+    def on_employee_id_changing(self, employee, new_id: int) -> None:
+        """Вызывается перед изменением ID сотрудника; может отклонить изменение."""
+
+
+class ICompanyObserver(ABC):
+    """Абстрактный класс. Наблюдатель за составом компании."""
+
+    def on_department_added(self, company, department) -> None:
+        """Вызывается после добавления отдела в компанию."""
+
+    def on_department_removed(self, company, department) -> None:
+        """Вызывается после удаления отдела из компании."""
+
+    def on_project_added(self, company, project) -> None:
+        """Вызывается после добавления проекта в компанию."""
+
+    def on_project_removed(self, company, project) -> None:
+        """Вызывается после удаления проекта из компании."""
+
+    def on_bulk_loaded(self, company) -> None:
+        """Вызывается после завершения массовой загрузки компании."""
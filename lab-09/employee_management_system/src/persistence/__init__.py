@@ -0,0 +1,3 @@
+"""
+Persistence package - журнал изменений и снимки состояния компании
+"""
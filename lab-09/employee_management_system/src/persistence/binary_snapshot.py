@@ -0,0 +1,506 @@
+"""Двоичный снимок компании с колонками фиксированной ширины, открываемый через mmap."""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterator, Optional
+
+try:
+    import numpy as np
+except ImportError:  # numpy - необязательная зависимость
+    np = None
+
+from src.analytics.columnar import (
+    SENIORITY_LEVELS,
+    TYPE_CODES,
+    TYPE_DEVELOPER,
+    TYPE_MANAGER,
+    TYPE_SALESPERSON,
+)
+from src.core.company import Company
+from src.core.department import Department, employee_from_dict
+from src.core.employee import Employee
+from src.core.project import Project
+from src.employees.developer import SENIORITY_COEFFICIENTS
+from src.utils.exceptions import DuplicateIdError
+
+MAGIC = b"EMSSNAP\0"
+VERSION = 1
+
+# magic, версия, резерв и счетчики: строки сотрудников, сотрудники отделов,
+# строки таблицы строк, элементы стеков, отделы, членства в отделах,
+# проекты, навыки проектов, места в командах, название компании, размер текста
+_HEADER = struct.Struct("<8sHHIIIIIIIIIIQ")
+_COUNTS = (
+    "rows",
+    "company_rows",
+    "strings",
+    "tech",
+    "departments",
+    "members",
+    "projects",
+    "skills",
+    "team",
+    "company_name",
+    "text",
+)
+
+# Секции файла: (имя, тип элементов array/memoryview, счетчик длины)
+_SECTIONS = (
+    ("string_offsets", "Q", "strings+1"),
+    ("ids", "q", "rows"),
+    ("base_salary", "d", "rows"),
+    ("bonus", "d", "rows"),
+    ("commission_rate", "d", "rows"),
+    ("sales_volume", "d", "rows"),
+    ("name", "I", "rows"),
+    ("department", "I", "rows"),
+    ("tech_start", "I", "rows"),
+    ("tech_count", "I", "rows"),
+    ("type_code", "B", "rows"),
+    ("seniority", "b", "rows"),
+    ("in_company", "B", "rows"),
+    ("tech", "I", "tech"),
+    ("department_name", "I", "departments"),
+    ("member_start", "I", "departments"),
+    ("member_count", "I", "departments"),
+    ("members", "I", "members"),
+    ("project_id", "q", "projects"),
+    ("project_name", "I", "projects"),
+    ("description", "I", "projects"),
+    ("deadline", "I", "projects"),
+    ("status", "I", "projects"),
+    ("skill_start", "I", "projects"),
+    ("skill_count", "I", "projects"),
+    ("team_start", "I", "projects"),
+    ("team_count", "I", "projects"),
+    ("skills", "I", "skills"),
+    ("team", "I", "team"),
+    ("text", "B", "text"),
+)
+
+# Колонки сотрудников, доступные через MappedCompany.column
+EMPLOYEE_COLUMNS = (
+    "ids",
+    "base_salary",
+    "bonus",
+    "commission_rate",
+    "sales_volume",
+    "type_code",
+    "seniority",
+    "in_company",
+)
+
+TYPE_NAMES = {code: cls.__name__ for cls, code in TYPE_CODES.items()}
+_COEFFICIENTS = tuple(SENIORITY_COEFFICIENTS[level] for level in SENIORITY_LEVELS)
+
+
+def _layout(counts: dict) -> tuple[dict[str, tuple[int, str, int]], int]:
+    """
+    Смещения секций после заголовка, каждая выровнена по 8 байт.
+
+    :return: ({имя: (смещение, тип, число элементов)}, размер файла)
+    """
+    sections = {}
+    offset = _HEADER.size
+    for name, code, count_key in _SECTIONS:
+        offset = -(-offset // 8) * 8
+        count = counts["strings"] + 1 if count_key == "strings+1" else counts[count_key]
+        sections[name] = (offset, code, count)
+        offset += count * array(code).itemsize
+    return sections, offset
+
+
+def _require_little_endian() -> None:
+    if sys.byteorder != "little":
+        raise RuntimeError("Двоичный снимок поддерживается только на little-endian!")
+
+
+class _StringTable:
+    """Таблица различных строк снимка: строка -> номер."""
+
+    def __init__(self):
+        self.__index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.__index)
+
+    def add(self, value: str) -> int:
+        index = self.__index.get(value)
+        if index is None:
+            index = self.__index[value] = len(self.__index)
+        return index
+
+    def encode(self) -> tuple[array, bytes]:
+        """Возвращает смещения строк и общий текст в UTF-8"""
+        offsets = array("Q", [0])
+        chunks = []
+        position = 0
+        for value in self.__index:
+            data = value.encode("utf-8")
+            chunks.append(data)
+            position += len(data)
+            offsets.append(position)
+        return offsets, b"".join(chunks)
+
+
+def write_binary_snapshot(company: Company, path: str) -> None:
+    """
+    Записывает компанию в двоичный снимок.
+
+    Строки сотрудников упорядочены по ID, поэтому колонка ids служит
+    индексом ID -> строка. Участники проектов вне отделов компании
+    записываются отдельными строками с признаком in_company = 0.
+    Файл заменяется атомарно.
+
+    :raises ValueError: Сотрудник класса, которого нет среди TYPE_CODES
+    :raises DuplicateIdError: Разные сотрудники отделов с одинаковым ID
+    """
+    _require_little_endian()
+    employees = []
+    by_id = {}
+    for department in company.departments:
+        for emp in department:
+            known = by_id.setdefault(emp.id, emp)
+            if known is not emp:
+                raise DuplicateIdError(
+                    f"Сотрудник с ID {emp.id} записан в отделах разными объектами!"
+                )
+            if len(by_id) > len(employees):
+                employees.append((emp, True))
+    seen = {id(emp) for emp, _ in employees}
+    for project in company.projects:
+        for emp in project.team:
+            if id(emp) not in seen:
+                seen.add(id(emp))
+                employees.append((emp, False))
+    employees.sort(key=lambda item: (item[0].id, not item[1]))
+    row_of = {id(emp): row for row, (emp, _) in enumerate(employees)}
+
+    strings = _StringTable()
+    columns = {name: array(code) for name, code, _ in _SECTIONS}
+    for emp, in_company in employees:
+        code = TYPE_CODES.get(type(emp))
+        if code is None:
+            raise ValueError(
+                f"Класс {type(emp).__name__} не поддерживается двоичным снимком!"
+            )
+        columns["ids"].append(emp.id)
+        columns["type_code"].append(code)
+        columns["in_company"].append(in_company)
+        columns["name"].append(strings.add(emp.name))
+        columns["department"].append(strings.add(emp.department))
+        columns["base_salary"].append(emp.base_salary)
+        columns["bonus"].append(emp.bonus if code == TYPE_MANAGER else 0.0)
+        columns["tech_start"].append(len(columns["tech"]))
+        if code == TYPE_DEVELOPER:
+            columns["seniority"].append(SENIORITY_LEVELS.index(emp.seniority_level))
+            columns["tech"].extend(strings.add(skill) for skill in emp.tech_stack)
+        else:
+            columns["seniority"].append(-1)
+        columns["tech_count"].append(len(columns["tech"]) - columns["tech_start"][-1])
+        is_sales = code == TYPE_SALESPERSON
+        columns["commission_rate"].append(emp.commission_rate if is_sales else 0.0)
+        columns["sales_volume"].append(emp.sales_volume if is_sales else 0.0)
+
+    for department in company.departments:
+        columns["department_name"].append(strings.add(department.name))
+        columns["member_start"].append(len(columns["members"]))
+        columns["members"].extend(row_of[id(emp)] for emp in department)
+        columns["member_count"].append(
+            len(columns["members"]) - columns["member_start"][-1]
+        )
+    for project in company.projects:
+        columns["project_id"].append(project.project_id)
+        columns["project_name"].append(strings.add(project.name))
+        columns["description"].append(strings.add(project.description))
+        columns["deadline"].append(strings.add(str(project.deadline)))
+        columns["status"].append(strings.add(project.status))
+        columns["skill_start"].append(len(columns["skills"]))
+        columns["skills"].extend(strings.add(s) for s in project.required_skills)
+        columns["skill_count"].append(len(project.required_skills))
+        team = project.team
+        columns["team_start"].append(len(columns["team"]))
+        columns["team"].extend(row_of[id(emp)] for emp in team)
+        columns["team_count"].append(len(team))
+
+    company_name = strings.add(company.name)
+    columns["string_offsets"], text = strings.encode()
+    columns["text"] = array("B", text)
+    counts = {
+        "rows": len(employees),
+        "company_rows": sum(1 for _, in_company in employees if in_company),
+        "strings": len(strings),
+        "tech": len(columns["tech"]),
+        "departments": len(columns["department_name"]),
+        "members": len(columns["members"]),
+        "projects": len(columns["project_id"]),
+        "skills": len(columns["skills"]),
+        "team": len(columns["team"]),
+        "company_name": company_name,
+        "text": len(text),
+    }
+    sections, _ = _layout(counts)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, *(counts[name] for name in _COUNTS)))
+        for name, _, _ in _SECTIONS:
+            f.write(b"\0" * (sections[name][0] - f.tell()))
+            columns[name].tofile(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class MappedCompany:
+    """
+    Компания из двоичного снимка, отображенного в память только для чтения.
+
+    При открытии читается лишь заголовок: колонки остаются в файле
+    и читаются страницами по мере обращения. Поиск по ID - бинарный поиск
+    по упорядоченной колонке ids; объект сотрудника создается только
+    для найденной строки. Проходы по колонкам (фонд оплаты труда)
+    не создают объектов сотрудников.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Путь к файлу, записанному write_binary_snapshot
+        :raises ValueError: Файл не является снимком поддерживаемой версии
+        """
+        _require_little_endian()
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise ValueError("Файл не является двоичным снимком компании!")
+            self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, _, *values = _HEADER.unpack_from(self.__mmap)
+            if magic != MAGIC:
+                raise ValueError("Файл не является двоичным снимком компании!")
+            if version != VERSION:
+                raise ValueError(f"Неподдерживаемая версия снимка: {version}")
+            self.__counts = dict(zip(_COUNTS, values))
+            sections, size = _layout(self.__counts)
+            if len(self.__mmap) < size:
+                raise ValueError("Двоичный снимок поврежден: файл обрезан!")
+        except BaseException:
+            self.__mmap.close()
+            raise
+        self.__view = view = memoryview(self.__mmap)
+        self.__columns = {
+            name: view[offset : offset + count * array(code).itemsize].cast(code)
+            for name, (offset, code, count) in sections.items()
+        }
+        self.__strings: dict[int, str] = {}
+
+    def close(self) -> None:
+        """Освобождает представления колонок и отображение файла"""
+        for column in self.__columns.values():
+            column.release()
+        self.__columns = {}
+        self.__view.release()
+        self.__mmap.close()
+
+    def __enter__(self) -> "MappedCompany":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _string(self, index: int) -> str:
+        """Строка таблицы по номеру (декодированные строки кэшируются)"""
+        value = self.__strings.get(index)
+        if value is None:
+            offsets = self.__columns["string_offsets"]
+            text = self.__columns["text"]
+            value = bytes(text[offsets[index] : offsets[index + 1]]).decode("utf-8")
+            self.__strings[index] = value
+        return value
+
+    @property
+    def name(self) -> str:
+        """Возвращает название компании"""
+        return self._string(self.__counts["company_name"])
+
+    def __len__(self) -> int:
+        """Возвращает число сотрудников отделов компании"""
+        return self.__counts["company_rows"]
+
+    def __contains__(self, employee_id: int) -> bool:
+        return self._row_of(employee_id) is not None
+
+    def column(self, name: str) -> memoryview:
+        """
+        Возвращает колонку сотрудников без копирования (строки по возрастанию ID).
+
+        :param name: Одна из EMPLOYEE_COLUMNS
+        """
+        if name not in EMPLOYEE_COLUMNS:
+            raise ValueError(f"Неизвестная колонка сотрудников: {name}")
+        return self.__columns[name]
+
+    def _row_of(self, employee_id: int, in_company: bool = True) -> Optional[int]:
+        """Номер строки сотрудника отделов (или любого участника) по ID"""
+        ids = self.__columns["ids"]
+        row = bisect_left(ids, employee_id)
+        if row == len(ids) or ids[row] != employee_id:
+            return None
+        if in_company and not self.__columns["in_company"][row]:
+            return None
+        return row
+
+    def _record(self, row: int) -> dict:
+        """Данные строки в формате to_dict сотрудника"""
+        c = self.__columns
+        code = c["type_code"][row]
+        record = {
+            "type": TYPE_NAMES[code],
+            "id": c["ids"][row],
+            "name": self._string(c["name"][row]),
+            "department": self._string(c["department"][row]),
+            "base_salary": c["base_salary"][row],
+        }
+        if code == TYPE_MANAGER:
+            record["bonus"] = c["bonus"][row]
+        elif code == TYPE_DEVELOPER:
+            start = c["tech_start"][row]
+            tech = c["tech"][start : start + c["tech_count"][row]]
+            record["tech_stack"] = [self._string(index) for index in tech]
+            record["seniority_level"] = SENIORITY_LEVELS[c["seniority"][row]]
+        elif code == TYPE_SALESPERSON:
+            record["commission_rate"] = c["commission_rate"][row]
+            record["sales_volume"] = c["sales_volume"][row]
+        return record
+
+    def employee_record(self, employee_id: int) -> Optional[dict]:
+        """Возвращает данные сотрудника отделов по ID без создания объекта"""
+        row = self._row_of(employee_id)
+        return None if row is None else self._record(row)
+
+    def find_employee_by_id(self, employee_id: int) -> Optional[Employee]:
+        """Создает объект сотрудника отделов по ID (None - не найден)"""
+        record = self.employee_record(employee_id)
+        return None if record is None else employee_from_dict(record, trusted=True)
+
+    def _iter_salaries(self) -> Iterator[float]:
+        """Перебирает итоговые зарплаты строк по колонкам без объектов"""
+        c = self.__columns
+        rows = zip(
+            c["type_code"],
+            c["base_salary"],
+            c["bonus"],
+            c["seniority"],
+            c["commission_rate"],
+            c["sales_volume"],
+        )
+        for code, base, bonus, level, rate, volume in rows:
+            if code == TYPE_MANAGER:
+                yield base + bonus
+            elif code == TYPE_DEVELOPER:
+                yield base * _COEFFICIENTS[level]
+            elif code == TYPE_SALESPERSON:
+                yield base + volume * rate
+            else:
+                yield base
+
+    def salaries(self):
+        """
+        Итоговые зарплаты всех строк, вычисленные по колонкам.
+
+        С numpy - массив, построенный поверх отображения без копирования
+        входных колонок; без numpy - список.
+        """
+        if np is None:
+            return list(self._iter_salaries())
+        c = self.__columns
+        seniority = np.asarray(c["seniority"])
+        coefficient = np.where(
+            seniority >= 0, np.asarray(_COEFFICIENTS)[np.maximum(seniority, 0)], 1.0
+        )
+        # Бонус, комиссия и объем продаж записаны нулями у остальных типов,
+        # поэтому формула совпадает с calculate_salary() для каждого типа
+        base, bonus = np.asarray(c["base_salary"]), np.asarray(c["bonus"])
+        volume, rate = np.asarray(c["sales_volume"]), np.asarray(c["commission_rate"])
+        return (base + bonus) * coefficient + volume * rate
+
+    def calculate_total_monthly_cost(self) -> float:
+        """Возвращает фонд оплаты труда сотрудников отделов"""
+        salaries = self.salaries()
+        in_company = self.__columns["in_company"]
+        if np is not None:
+            return float(np.sum(salaries[np.asarray(in_company, dtype=bool)]))
+        return sum(s for s, flag in zip(salaries, in_company) if flag)
+
+    @property
+    def departments(self) -> list[str]:
+        """Возвращает названия отделов"""
+        return [self._string(i) for i in self.__columns["department_name"]]
+
+    def _group(self, kind: str, index: int) -> memoryview:
+        c = self.__columns
+        start = c[f"{kind}_start"][index]
+        source = "members" if kind == "member" else "team"
+        return c[source][start : start + c[f"{kind}_count"][index]]
+
+    def department_totals(self) -> dict[str, float]:
+        """Возвращает суммы зарплат по отделам"""
+        salaries = self.salaries()
+        totals: dict[str, float] = {}
+        for index, name in enumerate(self.departments):
+            rows = self._group("member", index)
+            if np is not None:
+                total = float(np.sum(salaries[np.asarray(rows)]))
+            else:
+                total = sum(salaries[row] for row in rows)
+            totals[name] = totals.get(name, 0.0) + total
+        return totals
+
+    def department_employee_ids(self, name: str) -> list[int]:
+        """Возвращает ID сотрудников отдела (пустой список - отдела нет)"""
+        ids = self.__columns["ids"]
+        for index, department in enumerate(self.departments):
+            if department == name:
+                return [ids[row] for row in self._group("member", index)]
+        return []
+
+    def project_team_ids(self, project_id: int) -> Optional[list[int]]:
+        """Возвращает ID участников проекта (None - проекта нет)"""
+        ids = self.__columns["ids"]
+        for index, value in enumerate(self.__columns["project_id"]):
+            if value == project_id:
+                return [ids[row] for row in self._group("team", index)]
+        return None
+
+    def to_company(self) -> Company:
+        """Создает полную компанию со всеми объектами (в режиме массовой загрузки)"""
+        c = self.__columns
+        employees = [
+            employee_from_dict(self._record(row), trusted=True)
+            for row in range(self.__counts["rows"])
+        ]
+        company = Company(self.name)
+        with company.bulk_load():
+            for index, name in enumerate(self.departments):
+                department = Department(name)
+                for row in self._group("member", index):
+                    department.add_employee(employees[row])
+                company.add_department(department)
+            for index in range(self.__counts["projects"]):
+                start = c["skill_start"][index]
+                skills = c["skills"][start : start + c["skill_count"][index]]
+                project = Project(
+                    c["project_id"][index],
+                    self._string(c["project_name"][index]),
+                    self._string(c["description"][index]),
+                    self._string(c["deadline"][index]),
+                    self._string(c["status"][index]),
+                    [self._string(i) for i in skills],
+                )
+                for row in self._group("team", index):
+                    project.add_team_member(employees[row])
+                company.add_project(project)
+        return company
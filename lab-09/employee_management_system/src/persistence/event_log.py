@@ -0,0 +1,195 @@
+"""Журнал событий: JSON-строки с последовательными номерами и пакетным fsync."""
+
+import json
+import os
+import threading
+import time
+from typing import Iterator, Optional
+
+from src.utils.exceptions import EventLogError
+
+
+class EventLog:
+    """
+    Файл событий, в который записи только дописываются.
+
+    Каждое событие - одна строка JSON с полями seq (номер) и type.
+    Строка сразу передается ОС (построчная буферизация), поэтому события
+    не теряются при выходе процесса без close(). fsync выполняется
+    пакетами: после sync_every событий или не позднее чем через
+    sync_interval секунд после первого несинхронизированного события -
+    по таймеру, даже если новых событий нет. Оборванная при сбое последняя
+    строка отбрасывается при открытии журнала; повреждение в середине
+    журнала считается ошибкой.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sync_every: int = 100,
+        sync_interval: float = 1.0,
+        start_seq: int = 0,
+    ):
+        """
+        :param path: Путь к файлу журнала
+        :param sync_every: Число событий между вызовами fsync
+        :param sync_interval: Максимальное время (с) между вызовами fsync
+        :param start_seq: Номер, после которого продолжается нумерация
+            (номер последнего события, вошедшего в снимок)
+        """
+        if not isinstance(sync_every, int) or sync_every <= 0:
+            raise ValueError("Размер пакета fsync должен быть положительным числом!")
+        self.__path = path
+        self.__sync_every = sync_every
+        self.__sync_interval = sync_interval
+        self.__last_seq = max(self._recover(), start_seq)
+        self.__file = open(path, "a", encoding="utf-8", buffering=1)
+        self.__pending = 0
+        self.__last_sync = time.monotonic()
+        # Таймер fsync для последнего неполного пакета; доступ к файлу
+        # из потока таймера защищен блокировкой
+        self.__lock = threading.Lock()
+        self.__timer: Optional[threading.Timer] = None
+
+    @property
+    def path(self) -> str:
+        """Возвращает путь к файлу журнала"""
+        return self.__path
+
+    @property
+    def last_seq(self) -> int:
+        """Возвращает номер последнего записанного события"""
+        return self.__last_seq
+
+    def _recover(self) -> int:
+        """
+        Обрезает оборванную последнюю строку и возвращает номер последнего события.
+
+        :raises EventLogError: Поврежденная строка в середине журнала
+        """
+        if not os.path.exists(self.__path):
+            return 0
+        last_seq = 0
+        valid_size = 0
+        with open(self.__path, "rb") as f:
+            for number, line in enumerate(f, 1):
+                # Без перевода строки может оказаться только оборванная запись
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    last_seq = json.loads(line)["seq"]
+                except (ValueError, KeyError, TypeError):
+                    raise EventLogError(
+                        f"Поврежденная строка журнала {self.__path}:{number}"
+                    ) from None
+                valid_size += len(line)
+        if valid_size != os.path.getsize(self.__path):
+            with open(self.__path, "r+b") as f:
+                f.truncate(valid_size)
+        return last_seq
+
+    def append(self, event_type: str, **payload) -> int:
+        """
+        Дописывает событие в журнал.
+
+        :param event_type: Тип события
+        :param payload: Данные события (сериализуемые в JSON)
+        :return: Номер события
+        """
+        with self.__lock:
+            self.__last_seq += 1
+            event = {"seq": self.__last_seq, "type": event_type, **payload}
+            self.__file.write(
+                json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
+            )
+            self.__pending += 1
+            elapsed = time.monotonic() - self.__last_sync
+            if self.__pending >= self.__sync_every or elapsed >= self.__sync_interval:
+                self._sync()
+            elif self.__timer is None:
+                self._start_timer(self.__sync_interval - elapsed)
+            return self.__last_seq
+
+    def _start_timer(self, delay: float) -> None:
+        """Планирует fsync неполного пакета через delay секунд"""
+        self.__timer = threading.Timer(delay, self._sync_pending)
+        self.__timer.daemon = True
+        self.__timer.start()
+
+    def _sync_pending(self) -> None:
+        """Обработчик таймера: записывает на диск события, ждущие fsync"""
+        with self.__lock:
+            self.__timer = None
+            if self.__pending and not self.__file.closed:
+                self._sync()
+
+    def _sync(self) -> None:
+        """fsync журнала; вызывается под блокировкой"""
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+        self.__pending = 0
+        self.__last_sync = time.monotonic()
+
+    @property
+    def pending(self) -> int:
+        """Возвращает число событий, еще не записанных на диск через fsync"""
+        return self.__pending
+
+    def sync(self) -> None:
+        """Сбрасывает буфер и принудительно записывает журнал на диск"""
+        with self.__lock:
+            self._sync()
+
+    def reset(self) -> None:
+        """Очищает журнал после сохранения снимка; нумерация продолжается"""
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            self.__file.close()
+            with open(self.__path, "w", encoding="utf-8") as f:
+                f.flush()
+                os.fsync(f.fileno())
+            self.__file = open(self.__path, "a", encoding="utf-8", buffering=1)
+            self.__pending = 0
+
+    def close(self) -> None:
+        """Записывает накопленные события и закрывает файл"""
+        with self.__lock:
+            if self.__file.closed:
+                return
+            self._sync()
+            self.__file.close()
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @staticmethod
+    def read(path: str, after_seq: int = 0) -> Iterator[dict]:
+        """
+        Читает события журнала с номером больше after_seq.
+
+        Оборванная последняя строка пропускается, повреждение в середине
+        журнала считается ошибкой.
+        """
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                # Без перевода строки может оказаться только оборванная запись
+                if not line.endswith("\n"):
+                    return
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    raise EventLogError(
+                        f"Поврежденная строка журнала {path}:{number}"
+                    ) from None
+                if event["seq"] > after_seq:
+                    yield event
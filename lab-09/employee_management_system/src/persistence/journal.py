@@ -0,0 +1,403 @@
+"""Запись изменений компании в журнал, воспроизведение и уплотнение в снимок."""
+
+import os
+from typing import Callable, Optional
+
+from src.core.company import Company
+from src.core.department import Department, employee_from_dict
+from src.core.employee import Employee
+from src.core.project import Project
+from src.patterns.observer import (
+    ICompanyObserver,
+    IDepartmentObserver,
+    IEmployeeObserver,
+    IProjectObserver,
+)
+from src.persistence.event_log import EventLog
+from src.persistence.streaming import (
+    JsonStreamReader,
+    LazyObject,
+    company_document,
+    write_json_file,
+)
+from src.utils.exceptions import EventLogError
+
+# Атрибуты, изменение которых записывается как событие salary_change
+SALARY_ATTRIBUTES = frozenset(
+    {"base_salary", "bonus", "seniority_level", "commission_rate", "sales_volume"}
+)
+
+
+class CompanyJournal(
+    ICompanyObserver, IDepartmentObserver, IProjectObserver, IEmployeeObserver
+):
+    """
+    Наблюдатель, записывающий каждое изменение компании событием в журнал.
+
+    Подписывается на компанию, ее отделы, проекты и сотрудников и следит
+    за новыми объектами по мере их добавления. Перевод сотрудника между
+    отделами записывается парой событий hire и remove.
+    """
+
+    def __init__(
+        self,
+        company: Company,
+        log: EventLog,
+        on_append: Optional[Callable[[int], None]] = None,
+        on_bulk_loaded: Optional[Callable[[], None]] = None,
+    ):
+        """
+        :param company: Компания, изменения которой записываются
+        :param log: Журнал событий
+        :param on_append: Вызывается с номером каждого записанного события
+        :param on_bulk_loaded: Вызывается после массовой загрузки, которая
+            не записывается в журнал по отдельным событиям
+        """
+        self.__company = company
+        self.__log = log
+        self.__on_append = on_append
+        self.__on_bulk_loaded = on_bulk_loaded
+        self.attach()
+
+    def attach(self) -> None:
+        """Подписывается на компанию и все ее текущие объекты"""
+        self.__company.attach_observer(self)
+        for department in self.__company.departments:
+            self._watch_department(department)
+        for project in self.__company.projects:
+            self._watch_project(project)
+
+    def detach(self) -> None:
+        """Отписывается от компании и всех ее объектов"""
+        self.__company.detach_observer(self)
+        for department in self.__company.departments:
+            department.detach_observer(self)
+            for emp in department:
+                emp.detach_observer(self)
+        for project in self.__company.projects:
+            project.detach_observer(self)
+            for emp in project.team:
+                emp.detach_observer(self)
+
+    def _watch_department(self, department: Department) -> None:
+        department.attach_observer(self)
+        for emp in department:
+            emp.attach_observer(self)
+
+    def _watch_project(self, project: Project) -> None:
+        project.attach_observer(self)
+        for emp in project.team:
+            emp.attach_observer(self)
+
+    def _release(self, employee) -> None:
+        """Отписывается от сотрудника, который больше не состоит в компании"""
+        for department in self.__company.departments:
+            if department.find_employee_by_id(employee.id) is employee:
+                return
+        for project in self.__company.get_employee_projects(employee.id):
+            if project.find_team_member(employee.id) is employee:
+                return
+        employee.detach_observer(self)
+
+    def _record(self, event_type: str, **payload) -> None:
+        """Записывает событие и сообщает его номер"""
+        seq = self.__log.append(event_type, **payload)
+        if self.__on_append is not None:
+            self.__on_append(seq)
+
+    def on_department_added(self, company, department) -> None:
+        self._watch_department(department)
+        self._record("add_department", department=department.to_dict())
+
+    def on_department_removed(self, company, department) -> None:
+        department.detach_observer(self)
+        self._record("remove_department", name=department.name)
+
+    def on_project_added(self, company, project) -> None:
+        self._watch_project(project)
+        self._record(
+            "add_project", project=project.to_dict(self.__company.employees_by_id)
+        )
+
+    def on_project_removed(self, company, project) -> None:
+        project.detach_observer(self)
+        self._record("remove_project", project_id=project.project_id)
+
+    def on_bulk_loaded(self, company) -> None:
+        self.attach()
+        if self.__on_bulk_loaded is not None:
+            self.__on_bulk_loaded()
+
+    def on_employee_added(self, department, employee) -> None:
+        employee.attach_observer(self)
+        self._record("hire", department=department.name, employee=employee.to_dict())
+
+    def on_employee_removed(self, department, employee) -> None:
+        self._record("remove", department=department.name, employee_id=employee.id)
+        self._release(employee)
+
+    def on_department_renamed(self, department, old_name: str, new_name: str) -> None:
+        self._record("rename_department", old_name=old_name, new_name=new_name)
+
+    def on_attribute_changed(
+        self, employee, attribute: str, old_value, new_value
+    ) -> None:
+        event_type = "salary_change" if attribute in SALARY_ATTRIBUTES else "update"
+        # При смене ID событие адресуется сотруднику по прежнему ID
+        employee_id = old_value if attribute == "id" else employee.id
+        self._record(
+            event_type, employee_id=employee_id, attribute=attribute, value=new_value
+        )
+
+    def on_team_member_added(self, project, employee) -> None:
+        employee.attach_observer(self)
+        payload = {"project_id": project.project_id, "employee_id": employee.id}
+        if self.__company.find_employee_by_id(employee.id) is not employee:
+            # Участник вне отделов компании восстанавливается из своих данных
+            payload["employee"] = employee.to_dict()
+        self._record("assign", **payload)
+
+    def on_team_member_removed(self, project, employee) -> None:
+        self._record("unassign", project_id=project.project_id, employee_id=employee.id)
+        self._release(employee)
+
+    def on_status_changed(self, project, old_status: str, new_status: str) -> None:
+        self._record("status", project_id=project.project_id, status=new_status)
+
+    def on_project_id_changing(self, project, new_id: int) -> None:
+        self._record("project_id", project_id=project.project_id, new_id=new_id)
+
+
+def _find_employee(company: Company, employee_id: int) -> Optional[Employee]:
+    """Ищет сотрудника в отделах, а затем в командах проектов"""
+    employee = company.find_employee_by_id(employee_id)
+    if employee is not None:
+        return employee
+    for project in company.projects:
+        employee = project.find_team_member(employee_id)
+        if employee is not None:
+            return employee
+    return None
+
+
+def _require(value, message: str):
+    if value is None:
+        raise EventLogError(message)
+    return value
+
+
+def apply_event(company: Company, event: dict) -> None:
+    """
+    Применяет одно событие журнала к компании.
+
+    :raises EventLogError: Событие ссылается на несуществующий объект
+        или имеет неизвестный тип
+    """
+    kind = event["type"]
+    if kind == "add_department":
+        company.add_department(Department.from_dict(event["department"]))
+    elif kind == "remove_department":
+        company.remove_department(event["name"])
+    elif kind == "add_project":
+        company.add_project(
+            Project.from_dict(event["project"], employees=company.employees_by_id)
+        )
+    elif kind == "remove_project":
+        company.remove_project(event["project_id"])
+    elif kind == "hire":
+        department = _require(
+            company._find_department(event["department"]),
+            f"Отдел '{event['department']}' не найден (событие {event['seq']})",
+        )
+        employee = _find_employee(company, event["employee"]["id"])
+        if employee is None:
+            employee = employee_from_dict(event["employee"])
+        department.add_employee(employee)
+    elif kind == "remove":
+        department = _require(
+            company._find_department(event["department"]),
+            f"Отдел '{event['department']}' не найден (событие {event['seq']})",
+        )
+        department.remove_employee(event["employee_id"])
+    elif kind == "rename_department":
+        _require(
+            company._find_department(event["old_name"]),
+            f"Отдел '{event['old_name']}' не найден (событие {event['seq']})",
+        ).name = event["new_name"]
+    elif kind in ("salary_change", "update"):
+        employee = _require(
+            _find_employee(company, event["employee_id"]),
+            f"Сотрудник {event['employee_id']} не найден (событие {event['seq']})",
+        )
+        setattr(employee, event["attribute"], event["value"])
+    elif kind in ("assign", "unassign", "status", "project_id"):
+        project = _require(
+            company._find_project(event["project_id"]),
+            f"Проект {event['project_id']} не найден (событие {event['seq']})",
+        )
+        if kind == "assign":
+            employee = _find_employee(company, event["employee_id"])
+            if employee is None:
+                employee = employee_from_dict(
+                    _require(
+                        event.get("employee"),
+                        f"Сотрудник {event['employee_id']} не найден "
+                        f"(событие {event['seq']})",
+                    )
+                )
+            project.add_team_member(employee)
+        elif kind == "unassign":
+            project.remove_team_member(event["employee_id"])
+        elif kind == "status":
+            project.status = event["status"]
+        else:
+            project.project_id = event["new_id"]
+    else:
+        raise EventLogError(f"Неизвестный тип события: {kind}")
+
+
+class CompanyStore:
+    """
+    Хранилище компании: снимок snapshot.json и журнал events.log в каталоге.
+
+    При открытии загружается последний снимок и воспроизводится хвост
+    журнала. Каждое изменение сразу записывается в журнал; после
+    массовой загрузки журнал уплотняется в новый снимок.
+
+    Событие записывается, пока изменение еще рассылается наблюдателям
+    (индексы компании, команды проектов обновляются позже), поэтому снимок
+    по порогу compact_every не создается внутри записи события: хранилище
+    только отмечает, что уплотнение пора выполнить, а выполняет его
+    в точке, где изменение завершено - в compact_if_due(), sync() и close().
+    """
+
+    SNAPSHOT_FILE = "snapshot.json"
+    LOG_FILE = "events.log"
+
+    def __init__(
+        self,
+        directory: str,
+        name: Optional[str] = None,
+        sync_every: int = 100,
+        compact_every: int = 10_000,
+    ):
+        """
+        :param directory: Каталог хранилища (создается при необходимости)
+        :param name: Название новой компании, если снимка еще нет
+        :param sync_every: Число событий между вызовами fsync
+        :param compact_every: Число событий, после которого уплотнение
+            выполняется в ближайшей точке сброса (см. compact_if_due)
+        """
+        if not isinstance(compact_every, int) or compact_every <= 0:
+            raise ValueError("Порог уплотнения должен быть положительным числом!")
+        os.makedirs(directory, exist_ok=True)
+        self.__snapshot_path = os.path.join(directory, self.SNAPSHOT_FILE)
+        self.__log_path = os.path.join(directory, self.LOG_FILE)
+        self.__compact_every = compact_every
+        self.__compact_due = False
+
+        created = not os.path.exists(self.__snapshot_path)
+        self.__company, snapshot_seq = self._load_snapshot(name)
+        last_seq = snapshot_seq
+        for event in EventLog.read(self.__log_path, snapshot_seq):
+            apply_event(self.__company, event)
+            last_seq = event["seq"]
+        self.__snapshot_seq = snapshot_seq
+        self.__log = EventLog(self.__log_path, sync_every, start_seq=last_seq)
+        self.__journal = CompanyJournal(
+            self.__company, self.__log, self._on_append, self.compact
+        )
+        if created:
+            # Название новой компании хранится только в снимке
+            self.compact()
+
+    def _load_snapshot(self, name: Optional[str]) -> tuple[Company, int]:
+        """Загружает снимок потоково или создает пустую компанию"""
+        if not os.path.exists(self.__snapshot_path):
+            if name is None:
+                raise ValueError("Для нового хранилища нужно название компании!")
+            return Company(name), 0
+        company, last_seq = None, 0
+        with open(self.__snapshot_path, "rb") as f:
+            reader = JsonStreamReader(f)
+            for key in reader.iter_object():
+                if key == "company":
+                    # Снимок записан самим хранилищем: поля не проверяются заново
+                    company = Company.from_stream(reader, trusted=True)
+                elif key == "last_seq":
+                    last_seq = reader.value()
+                else:
+                    reader.value()
+            reader.finish()
+        if company is None:
+            raise EventLogError("В снимке нет данных компании!")
+        return company, last_seq
+
+    @property
+    def company(self) -> Company:
+        """Возвращает восстановленную компанию"""
+        return self.__company
+
+    @property
+    def last_seq(self) -> int:
+        """Возвращает номер последнего записанного события"""
+        return self.__log.last_seq
+
+    def _on_append(self, seq: int) -> None:
+        # Вызывается во время рассылки изменения: снимок здесь не пишется
+        if seq - self.__snapshot_seq >= self.__compact_every:
+            self.__compact_due = True
+
+    @property
+    def compact_due(self) -> bool:
+        """Возвращает True, если накоплено compact_every событий после снимка"""
+        return self.__compact_due
+
+    def compact_if_due(self) -> bool:
+        """
+        Уплотняет журнал, если достигнут порог compact_every.
+
+        Вызывается между изменениями компании, а не из обработчиков
+        ее событий.
+
+        :return: True, если снимок был создан
+        """
+        if not self.__compact_due:
+            return False
+        self.compact()
+        return True
+
+    def compact(self) -> None:
+        """
+        Сохраняет снимок текущего состояния и очищает журнал.
+
+        Снимок записывается потоково во временный файл и атомарно заменяет
+        прежний; при сбое до очистки журнала уже вошедшие в снимок события
+        пропускаются по номеру.
+        """
+        self.__log.sync()
+        seq = self.__log.last_seq
+        document = LazyObject(
+            [("last_seq", seq), ("company", company_document(self.__company))]
+        )
+        write_json_file(self.__snapshot_path, document, fsync=True)
+        self.__snapshot_seq = seq
+        self.__compact_due = False
+        self.__log.reset()
+
+    def sync(self) -> None:
+        """Записывает накопленные события на диск и уплотняет журнал по порогу"""
+        if not self.compact_if_due():
+            self.__log.sync()
+
+    def close(self) -> None:
+        """Уплотняет журнал по порогу, отписывается от компании и закрывает файл"""
+        self.compact_if_due()
+        self.__journal.detach()
+        self.__log.close()
+
+    def __enter__(self) -> "CompanyStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
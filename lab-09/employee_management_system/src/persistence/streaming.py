@@ -0,0 +1,333 @@
+"""Потоковые запись и чтение JSON компании без полного словаря в памяти."""
+
+import codecs
+import json
+import os
+import re
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, TextIO
+
+# Размер буфера файла при потоковой записи
+BUFFER_SIZE = 1 << 20
+# Размер блока, читаемого из файла при потоковом разборе
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Символ, которым заканчивается число в JSON
+_NUMBER_END = re.compile(r"[ \t\n\r,\]}]")
+# Разделитель элементов массива (группа пуста, если буфер закончился раньше)
+_ARRAY_DELIMITER = re.compile(r"[ \t\n\r]*([,\]])?")
+
+
+class LazyObject:
+    """JSON-объект, пары (ключ, значение) которого создаются при записи."""
+
+    __slots__ = ("pairs",)
+
+    def __init__(self, pairs: Iterable[tuple[str, object]]):
+        self.pairs = pairs
+
+
+class LazyArray:
+    """JSON-массив, элементы которого создаются по одному при записи."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: Iterable):
+        self.items = items
+
+
+class JsonStreamWriter:
+    """
+    Записывает значения с LazyObject и LazyArray в текстовый поток.
+
+    Обычные значения кодируются стандартным json целиком, поэтому в памяти
+    одновременно находится только один элемент ленивого массива. Вывод
+    совпадает с json.dump с теми же indent и ensure_ascii=False.
+    """
+
+    def __init__(self, stream: TextIO, indent: Optional[int] = None):
+        """
+        :param stream: Текстовый поток для записи
+        :param indent: Отступ как в json.dump; None - компактная запись без пробелов
+        """
+        self.__stream = stream
+        self.__indent = indent
+        separators = (",", ": ") if indent is not None else (",", ":")
+        self.__item_separator, self.__key_separator = separators
+        self.__encode = json.JSONEncoder(
+            ensure_ascii=False, indent=indent, separators=separators
+        ).encode
+
+    def _newline(self, level: int) -> str:
+        """Перевод строки и отступ уровня level (пусто при компактной записи)"""
+        if self.__indent is None:
+            return ""
+        return "\n" + " " * (self.__indent * level)
+
+    def write(self, value, level: int = 0) -> None:
+        """Записывает значение, вложенное на уровень level"""
+        if isinstance(value, LazyObject):
+            self._write_object(value.pairs, level)
+        elif isinstance(value, LazyArray):
+            self._write_array(value.items, level)
+        else:
+            text = self.__encode(value)
+            if self.__indent is not None and level:
+                text = text.replace("\n", self._newline(level))
+            self.__stream.write(text)
+
+    def _write_object(self, pairs, level: int) -> None:
+        write = self.__stream.write
+        inner = self._newline(level + 1)
+        separator = "{"
+        for key, value in pairs:
+            write(separator + inner + self.__encode(key) + self.__key_separator)
+            self.write(value, level + 1)
+            separator = self.__item_separator
+        write("{}" if separator == "{" else self._newline(level) + "}")
+
+    def _write_array(self, items, level: int) -> None:
+        write = self.__stream.write
+        inner = self._newline(level + 1)
+        separator = "["
+        for item in items:
+            write(separator + inner)
+            self.write(item, level + 1)
+            separator = self.__item_separator
+        write("[]" if separator == "[" else self._newline(level) + "]")
+
+
+def _employees(employees) -> LazyArray:
+    return LazyArray(emp.to_dict() for emp in employees)
+
+
+def _department_pairs(department):
+    """Пары словаря отдела в порядке Department.to_dict"""
+    yield "name", department.name
+    yield "employees", _employees(department)
+
+
+def _project_pairs(project, employees):
+    """Пары словаря проекта в порядке Project.to_dict(employees)"""
+    team = project.team
+    yield "name", project.name
+    yield "employees", _employees(project.employees)
+    yield "project_id", project.project_id
+    yield "description", project.description
+    yield "deadline", str(project.deadline)
+    yield "status", project.status
+    yield "required_skills", project.required_skills
+    yield "team_ids", [emp.id for emp in team]
+    yield "team", _employees(emp for emp in team if employees.get(emp.id) is not emp)
+
+
+def _company_pairs(company):
+    """Пары словаря компании в порядке Company.to_dict"""
+    employees = company.employees_by_id
+    yield "format_version", company.FORMAT_VERSION
+    yield "name", company.name
+    yield "departments", LazyArray(
+        LazyObject(_department_pairs(d)) for d in company.departments
+    )
+    yield "projects", LazyArray(
+        LazyObject(_project_pairs(p, employees)) for p in company.projects
+    )
+
+
+def company_document(company) -> LazyObject:
+    """Ленивое представление Company.to_dict для JsonStreamWriter"""
+    return LazyObject(_company_pairs(company))
+
+
+def write_json_file(
+    path: str, document, indent: Optional[int] = None, fsync: bool = False
+) -> None:
+    """
+    Записывает документ в файл через временный файл и атомарную замену.
+
+    Прерванная запись не портит прежний файл.
+
+    :param document: Значение для JsonStreamWriter (в том числе ленивое)
+    :param indent: Отступ; None - компактная запись
+    :param fsync: Сбросить данные на диск перед заменой файла
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8", buffering=BUFFER_SIZE) as f:
+            JsonStreamWriter(f, indent).write(document)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
+class JsonStreamReader:
+    """
+    Разбор JSON из двоичного потока блоками фиксированного размера.
+
+    Вызывающий код сам спускается по структуре документа: iter_object
+    перебирает ключи объекта, iter_array - элементы массива, а value
+    разбирает очередное значение целиком стандартным json. Так крупные
+    массивы разбираются по одному элементу, и в памяти находятся только
+    текущий блок текста и текущий элемент.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        chunk_size: int = CHUNK_SIZE,
+        on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+        total: Optional[int] = None,
+    ):
+        """
+        :param stream: Двоичный поток с JSON в кодировке UTF-8
+        :param chunk_size: Размер блока чтения в байтах
+        :param on_progress: Вызывается после чтения каждого блока
+            с числом прочитанных байт и общим размером total
+        :param total: Размер данных в байтах (None - неизвестен)
+        """
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("Размер блока должен быть положительным числом!")
+        self.__stream = stream
+        self.__chunk_size = chunk_size
+        self.__on_progress = on_progress
+        self.__total = total
+        self.__decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__raw_decode = json.JSONDecoder().raw_decode
+        self.__buffer = ""
+        self.__pos = 0
+        self.__eof = False
+        self.__bytes_read = 0
+
+    @property
+    def bytes_read(self) -> int:
+        """Возвращает число прочитанных из потока байт"""
+        return self.__bytes_read
+
+    def _fill(self) -> bool:
+        """Дочитывает блок в буфер; False, если поток уже закончился"""
+        if self.__eof:
+            return False
+        chunk = self.__stream.read(self.__chunk_size)
+        self.__eof = not chunk
+        self.__bytes_read += len(chunk)
+        text = self.__decoder.decode(chunk, final=self.__eof)
+        self.__buffer = self.__buffer[self.__pos :] + text
+        self.__pos = 0
+        if chunk and self.__on_progress is not None:
+            self.__on_progress(self.__bytes_read, self.__total)
+        return True
+
+    def _peek(self) -> str:
+        """Следующий значимый символ без его чтения ("" - конец данных)"""
+        while True:
+            self.__pos = _WHITESPACE.match(self.__buffer, self.__pos).end()
+            if self.__pos < len(self.__buffer):
+                return self.__buffer[self.__pos]
+            if not self._fill():
+                return ""
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.__buffer, self.__pos)
+
+    def _consume(self, char: str) -> bool:
+        """Пропускает символ char, если он следующий значимый"""
+        if self._peek() != char:
+            return False
+        self.__pos += 1
+        return True
+
+    def _expect(self, char: str) -> None:
+        if not self._consume(char):
+            raise self._error(f"Ожидался символ {char!r}")
+
+    def value(self):
+        """Разбирает следующее значение целиком"""
+        self._peek()
+        while True:
+            try:
+                value, end = self.__raw_decode(self.__buffer, self.__pos)
+            except json.JSONDecodeError:
+                # Значение может продолжаться в следующем блоке
+                if self._fill():
+                    continue
+                raise
+            if (
+                type(value) in (int, float)
+                and not _NUMBER_END.search(self.__buffer, self.__pos)
+                and self._fill()
+            ):
+                # Число на границе блока ("1e" из "1e10") тоже может продолжаться
+                continue
+            self.__pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Перебирает ключи объекта.
+
+        Значение каждого ключа должен прочитать вызывающий код
+        до перехода к следующему ключу.
+        """
+        self._expect("{")
+        if self._consume("}"):
+            return
+        while True:
+            if self._peek() != '"':
+                raise self._error("Ожидался ключ объекта")
+            key = self.value()
+            self._expect(":")
+            yield key
+            if not self._consume(","):
+                self._expect("}")
+                return
+
+    def iter_array(self) -> Iterator[int]:
+        """
+        Перебирает позиции элементов массива.
+
+        Каждый элемент должен прочитать вызывающий код
+        до перехода к следующему.
+        """
+        self._expect("[")
+        if self._consume("]"):
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if not self._consume(","):
+                self._expect("]")
+                return
+
+    def iter_values(self) -> Iterator:
+        """
+        Перебирает элементы массива, разбирая каждый целиком.
+
+        То же, что value() для каждой позиции iter_array, но с меньшими
+        накладными расходами на длинных массивах небольших записей.
+        """
+        self._expect("[")
+        if self._consume("]"):
+            return
+        while True:
+            yield self.value()
+            delimiter = _ARRAY_DELIMITER.match(self.__buffer, self.__pos)
+            if delimiter.group(1) is None:
+                # Разделитель в следующем блоке
+                if not self._consume(","):
+                    self._expect("]")
+                    return
+                continue
+            self.__pos = delimiter.end()
+            if delimiter.group(1) == "]":
+                return
+
+    def finish(self) -> None:
+        """Проверяет, что после документа нет лишних данных"""
+        if self._peek():
+            raise self._error("Лишние данные после документа")
@@ -0,0 +1,88 @@
+"""Группировка и агрегация сотрудников за один проход."""
+
+from typing import Any, Iterable, Optional, Sequence, Union
+
+from src.utils.fields import FieldSpec, field_getter
+
+
+class AggregateStats:
+    """
+    Накопленные показатели одной группы: количество, сумма, минимум, максимум.
+
+    count - число строк группы, values - число строк со значением (не None);
+    среднее считается по values.
+    """
+
+    __slots__ = ("count", "values", "total", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.values = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: Optional[float]) -> None:
+        """Учитывает очередное значение (None - только подсчет)."""
+        self.count += 1
+        if value is None:
+            return
+        self.values += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Среднее значение группы."""
+        if self.values == 0:
+            return None
+        return self.total / self.values
+
+    def to_dict(self) -> dict:
+        """Преобразует показатели в словарь."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+        }
+
+    def __repr__(self):
+        return f"AggregateStats({self.to_dict()})"
+
+
+def group_aggregate(
+    items: Iterable[Any],
+    by: Union[FieldSpec, Sequence[FieldSpec]],
+    value: Optional[FieldSpec] = "salary",
+) -> dict[Any, AggregateStats]:
+    """
+    Группирует объекты и считает count/sum/min/max/mean за один проход.
+
+    :param items: Сотрудники (или другие объекты) для агрегации.
+    :param by: Поле группировки или список полей (ключ - кортеж).
+    :param value: Агрегируемое поле; None - только подсчет количества.
+    :return: Словарь ключ группы -> показатели в порядке появления групп.
+    """
+    if isinstance(by, (list, tuple)):
+        getters = [field_getter(f) for f in by]
+
+        def key_of(item):
+            return tuple(getter(item) for getter in getters)
+
+    else:
+        key_of = field_getter(by)
+    value_of = field_getter(value) if value is not None else None
+
+    groups: dict[Any, AggregateStats] = {}
+    for item in items:
+        key = key_of(item)
+        stats = groups.get(key)
+        if stats is None:
+            stats = groups[key] = AggregateStats()
+        stats.add(value_of(item) if value_of is not None else None)
+    return groups
@@ -1,6 +1,9 @@
-"""Компараторы для сравнения сотрудников"""
+"""Компараторы и ключи сортировки для сотрудников"""
+
+from typing import Hashable, Iterable, Optional, Sequence, Union
 
 from src.core.employee import Employee
+from src.utils.fields import FieldSpec, field_getter
 
 
 def cmp_name(emp1: Employee, emp2: Employee) -> int:
@@ -10,9 +13,9 @@ def cmp_name(emp1: Employee, emp2: Employee) -> int:
 
 def cmp_salary(emp1: Employee, emp2: Employee) -> int:
     """Сравнивает сотрудников по зарплате (по убыванию)."""
-    return (emp2.calculate_salary() > emp1.calculate_salary()) - (
-        emp2.calculate_salary() < emp1.calculate_salary()
-    )
+    salary1 = emp1.calculate_salary()
+    salary2 = emp2.calculate_salary()
+    return (salary2 > salary1) - (salary2 < salary1)
 
 
 def cmp_department_and_name(emp1: Employee, emp2: Employee) -> int:
@@ -20,3 +23,121 @@ def cmp_department_and_name(emp1: Employee, emp2: Employee) -> int:
     if emp1.department == emp2.department:
         return cmp_name(emp1, emp2)
     return (emp1.department > emp2.department) - (emp1.department < emp2.department)
+
+
+def key_name(emp: Employee) -> str:
+    """Ключ сортировки по имени (эквивалент cmp_name)."""
+    return emp.name
+
+
+def key_salary_desc(emp: Employee) -> float:
+    """Ключ сортировки по зарплате по убыванию (эквивалент cmp_salary)."""
+    return -emp.calculate_salary()
+
+
+def key_department_and_name(emp: Employee) -> tuple[str, str]:
+    """Ключ сортировки по отделу и имени (эквивалент cmp_department_and_name)."""
+    return emp.department, emp.name
+
+
+def _parse_sort_field(field: FieldSpec) -> tuple[FieldSpec, bool]:
+    """Разбирает поле сортировки: префикс "-" означает порядок по убыванию."""
+    if isinstance(field, str) and field.startswith("-"):
+        return field[1:], True
+    return field, False
+
+
+def _nullable(value, descending: bool = False):
+    """
+    Ключ, при котором None оказывается после всех значений.
+
+    Для поля по убыванию признак None инвертируется: проход с reverse=True
+    иначе поставил бы None первым.
+    """
+    return ((value is None) != descending, value)
+
+
+class SortKeyCache:
+    """
+    Кэш ключей сортировки для повторных сортировок одного набора сотрудников.
+
+    Значения именованных полей хранятся столбцами по имени поля, а готовые
+    ключи - по (поле, направление), по одному на сотрудника в порядке
+    последовательности. Кэш действителен, пока владелец передает тот же
+    объект последовательности и тот же токен версии
+    (см. Company.sorted_employees); иначе он очищается.
+    """
+
+    def __init__(self):
+        self.__employees: Optional[Sequence[Employee]] = None
+        self.__token: Hashable = None
+        self.__columns: dict = {}
+
+    def columns(self, employees: Sequence[Employee], token: Hashable) -> dict:
+        """Возвращает столбцы ключей, действительные для employees и token"""
+        if employees is not self.__employees or token != self.__token:
+            self.__employees = employees
+            self.__token = token
+            self.__columns = {}
+        return self.__columns
+
+
+def _key_column(
+    employees: Sequence[Employee],
+    field: FieldSpec,
+    descending: bool,
+    columns: Optional[dict],
+) -> list:
+    """Ключи поля для всех сотрудников (из кэша, если поле именованное)"""
+    if columns is None or not isinstance(field, str):
+        getter = field_getter(field)
+        return [_nullable(getter(emp), descending) for emp in employees]
+    keys = columns.get((field, descending))
+    if keys is None:
+        values = columns.get(field)
+        if values is None:
+            getter = field_getter(field)
+            values = columns[field] = [getter(emp) for emp in employees]
+        keys = columns[field, descending] = [
+            _nullable(value, descending) for value in values
+        ]
+    return keys
+
+
+def sort_employees(
+    employees: Iterable[Employee],
+    by: Union[FieldSpec, Sequence[FieldSpec]],
+    key_cache: Optional[SortKeyCache] = None,
+    token: Hashable = None,
+) -> list[Employee]:
+    """
+    Стабильная сортировка сотрудников по нескольким полям.
+
+    Значения всех полей вычисляются один раз на сотрудника, после чего
+    выполняется по одному стабильному проходу на поле, начиная с последнего.
+    None оказывается в конце при любом направлении сортировки.
+
+    :param employees: Сотрудники для сортировки.
+    :param by: Поле или список полей ("department", "-salary", "name", ...);
+        префикс "-" задает порядок по убыванию.
+    :param key_cache: Кэш ключей между вызовами; employees должна быть
+        той же последовательностью, пока token не изменился.
+    :param token: Версия данных сотрудников для key_cache.
+    :return: Новый отсортированный список.
+    """
+    fields = list(by) if isinstance(by, (list, tuple)) else [by]
+    if not fields:
+        raise ValueError("Нужно указать хотя бы одно поле сортировки!")
+    parsed = [_parse_sort_field(field) for field in fields]
+    if not isinstance(employees, Sequence):
+        employees = list(employees)
+    columns = None if key_cache is None else key_cache.columns(employees, token)
+    keys = [
+        _key_column(employees, field, descending, columns)
+        for field, descending in parsed
+    ]
+
+    order = list(range(len(employees)))
+    for position in reversed(range(len(parsed))):
+        order.sort(key=keys[position].__getitem__, reverse=parsed[position][1])
+    return [employees[i] for i in order]
@@ -31,7 +31,7 @@ class ProjectNotFoundError(BaseCompanyException):
     default_message = "Ошибка: Проект не найден!"
 
 
-class InvalidStatusError(BaseCompanyException):
+class InvalidStatusError(BaseCompanyException, ValueError):
     """Исключение: Неверный формат статуса проекта"""
 
     default_message = "Ошибка: Неверный формат статуса проекта!"
@@ -41,3 +41,29 @@ class DuplicateIdError(BaseCompanyException):
     """Исключение: Идентификатор уже существует"""
 
     default_message = "Ошибка: Идентификатор уже существует!"
+
+
+class PayrollMismatchError(BaseCompanyException):
+    """Исключение: Накопленный фонд оплаты труда не совпадает с пересчетом"""
+
+    default_message = "Ошибка: Накопленная сумма зарплат не совпадает с пересчетом!"
+
+
+class BulkLoadError(BaseCompanyException):
+    """Исключение: Ошибки, накопленные за время массовой загрузки"""
+
+    default_message = "Ошибка: Массовая загрузка завершилась с ошибками!"
+
+    def __init__(self, errors=None):
+        self.errors = list(errors or [])
+        message = self.default_message
+        if self.errors:
+            details = "; ".join(str(e) for e in self.errors[:10])
+            message = f"{message} ({len(self.errors)}): {details}"
+        super().__init__(message)
+
+
+class EventLogError(BaseCompanyException):
+    """Исключение: Журнал событий поврежден или событие нельзя применить"""
+
+    default_message = "Ошибка: Не удалось применить событие журнала!"
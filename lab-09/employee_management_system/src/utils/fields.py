@@ -0,0 +1,43 @@
+"""Доступ к полям сотрудников по имени для группировок и сортировок."""
+
+from typing import Any, Callable, Union
+
+FieldSpec = Union[str, Callable[[Any], Any]]
+
+
+def _salary(item) -> float:
+    """Итоговая зарплата сотрудника."""
+    return item.calculate_salary()
+
+
+def _type_name(item) -> str:
+    """Название класса сотрудника."""
+    return item.__class__.__name__
+
+
+def _seniority(item):
+    """Уровень seniority разработчика (None для остальных)."""
+    return getattr(item, "seniority_level", None)
+
+
+SPECIAL_FIELDS: dict[str, Callable[[Any], Any]] = {
+    "salary": _salary,
+    "type": _type_name,
+    "seniority": _seniority,
+}
+
+
+def field_getter(field: FieldSpec) -> Callable[[Any], Any]:
+    """
+    Возвращает функцию, читающую поле объекта.
+
+    :param field: Имя атрибута, специальное поле ("salary", "type",
+        "seniority") или готовая функция.
+    """
+    if callable(field):
+        return field
+    if not isinstance(field, str) or not field.strip():
+        raise ValueError("Поле должно быть непустой строкой или функцией!")
+    if field in SPECIAL_FIELDS:
+        return SPECIAL_FIELDS[field]
+    return lambda item: getattr(item, field, None)
@@ -0,0 +1,207 @@
+"""Версионная история сотрудников, отделов и проектов для запросов "на дату"."""
+
+import time
+from bisect import bisect_right
+from datetime import datetime
+from typing import Callable, Iterator, Optional, Union
+
+Timestamp = Union[float, int, datetime]
+
+
+def to_timestamp(value: Timestamp) -> float:
+    """Приводит момент времени (число секунд или datetime) к числу секунд"""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError("Момент времени должен быть числом или datetime!")
+    return float(value)
+
+
+class VersionHistory:
+    """
+    Версии одного значения: параллельные массивы моментов и значений.
+
+    Моменты не убывают, поэтому значение на дату находится бинарным поиском.
+    Повтор прежнего значения не создает новой версии, а запись в тот же
+    момент заменяет последнюю версию.
+    """
+
+    __slots__ = ("times", "values")
+
+    def __init__(self):
+        self.times: list[float] = []
+        self.values: list = []
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def current(self):
+        """Возвращает последнее записанное значение (None, если версий нет)"""
+        return self.values[-1] if self.values else None
+
+    def record(self, moment: float, value) -> None:
+        """Записывает значение, действующее начиная с момента moment"""
+        if self.values and self.values[-1] == value:
+            return
+        if self.times and self.times[-1] >= moment:
+            # Часы не идут назад: запись в тот же момент заменяет версию
+            self.values[-1] = value
+            if len(self.values) > 1 and self.values[-2] == value:
+                self.times.pop()
+                self.values.pop()
+            return
+        self.times.append(moment)
+        self.values.append(value)
+
+    def at(self, moment: float):
+        """Возвращает значение, действовавшее в момент moment (None - еще не было)"""
+        position = bisect_right(self.times, moment)
+        return self.values[position - 1] if position else None
+
+
+class TemporalStore:
+    """
+    История входных данных зарплат и членства в отделах и проектах.
+
+    Для каждого сотрудника хранятся версии его данных (to_dict и итоговая
+    зарплата) и версии набора отделов, в которых он состоит; для каждого
+    проекта - версии состава команды. Запрос "на дату" ищет нужную версию
+    каждого объекта бинарным поиском, не воспроизводя историю целиком.
+    Хранилище заполняется компанией (см. Company.enable_history).
+    """
+
+    def __init__(self, clock: Optional[Callable[[], float]] = None):
+        """
+        :param clock: Источник текущего времени в секундах (по умолчанию time.time)
+        """
+        self.__clock = clock if clock is not None else time.time
+        self.__records: dict[int, VersionHistory] = {}
+        self.__memberships: dict[int, VersionHistory] = {}
+        self.__teams: dict[int, VersionHistory] = {}
+
+    def now(self) -> float:
+        """Возвращает текущий момент по часам хранилища"""
+        return float(self.__clock())
+
+    @staticmethod
+    def _history(histories: dict[int, VersionHistory], key: int) -> VersionHistory:
+        history = histories.get(key)
+        if history is None:
+            history = histories[key] = VersionHistory()
+        return history
+
+    def record_employee(self, employee) -> None:
+        """Записывает текущие данные и итоговую зарплату сотрудника"""
+        record = (employee.calculate_salary(), employee.to_dict())
+        self._history(self.__records, employee.id).record(self.now(), record)
+
+    def join(self, employee_id: int, department: str) -> None:
+        """Записывает вступление сотрудника в отдел"""
+        history = self._history(self.__memberships, employee_id)
+        current = history.current or ()
+        history.record(self.now(), tuple(sorted((*current, department))))
+
+    def leave(self, employee_id: int, department: str) -> None:
+        """Записывает уход сотрудника из отдела"""
+        history = self.__memberships.get(employee_id)
+        if history is None or not history.current:
+            return
+        names = list(history.current)
+        if department in names:
+            names.remove(department)
+            history.record(self.now(), tuple(names))
+
+    def change_employee_id(self, employee, old_id: int) -> None:
+        """Переносит текущее членство сотрудника в отделах на его новый ID"""
+        history = self.__memberships.get(old_id)
+        departments = None if history is None else history.current
+        if departments:
+            moment = self.now()
+            history.record(moment, ())
+            self._history(self.__memberships, employee.id).record(moment, departments)
+        self.record_employee(employee)
+
+    def rename_department(self, old_name: str, new_name: str, members) -> None:
+        """Переносит членство сотрудников отдела на новое название"""
+        for employee_id in members:
+            self.leave(employee_id, old_name)
+            self.join(employee_id, new_name)
+
+    def record_team(self, project_id: int, team) -> None:
+        """Записывает состав команды проекта"""
+        members = tuple(sorted(emp.id for emp in team))
+        self._history(self.__teams, project_id).record(self.now(), members)
+
+    def drop_project(self, project_id: int) -> None:
+        """Записывает удаление проекта из компании"""
+        history = self.__teams.get(project_id)
+        if history is not None:
+            history.record(self.now(), None)
+
+    def capture(self, company) -> None:
+        """
+        Записывает полное текущее состояние компании.
+
+        Используется при включении истории и после массовой загрузки:
+        неизменившиеся объекты новых версий не получают.
+        """
+        memberships: dict[int, list[str]] = {}
+        for department in company.departments:
+            for emp in department:
+                memberships.setdefault(emp.id, []).append(department.name)
+        moment = self.now()
+        for emp in company.iter_all_employees():
+            record = (emp.calculate_salary(), emp.to_dict())
+            self._history(self.__records, emp.id).record(moment, record)
+        for employee_id in memberships.keys() | self.__memberships.keys():
+            names = tuple(sorted(memberships.get(employee_id, ())))
+            self._history(self.__memberships, employee_id).record(moment, names)
+        projects = {proj.project_id: proj for proj in company.projects}
+        for project_id in projects.keys() | self.__teams.keys():
+            proj = projects.get(project_id)
+            team = None if proj is None else tuple(sorted(e.id for e in proj.team))
+            self._history(self.__teams, project_id).record(moment, team)
+
+    def departments_of(self, employee_id: int, as_of: Timestamp) -> tuple[str, ...]:
+        """Возвращает отделы, в которых сотрудник состоял на дату"""
+        history = self.__memberships.get(employee_id)
+        if history is None:
+            return ()
+        return history.at(to_timestamp(as_of)) or ()
+
+    def employee_record(
+        self, employee_id: int, as_of: Timestamp
+    ) -> Optional[tuple[float, dict]]:
+        """
+        Возвращает (зарплата, данные) сотрудника на дату.
+
+        None, если на эту дату сотрудник не состоял ни в одном отделе.
+        """
+        if not self.departments_of(employee_id, as_of):
+            return None
+        history = self.__records.get(employee_id)
+        return None if history is None else history.at(to_timestamp(as_of))
+
+    def iter_records(self, as_of: Timestamp) -> Iterator[tuple[float, dict, tuple]]:
+        """Перебирает (зарплата, данные, отделы) сотрудников компании на дату"""
+        moment = to_timestamp(as_of)
+        for employee_id, history in self.__memberships.items():
+            departments = history.at(moment)
+            if not departments:
+                continue
+            record = self.__records[employee_id].at(moment)
+            if record is not None:
+                yield record[0], record[1], departments
+
+    def total_salary(self, as_of: Timestamp) -> float:
+        """Возвращает фонд оплаты труда компании на дату"""
+        total = 0.0
+        for salary, _, _ in self.iter_records(as_of):
+            total += salary
+        return total
+
+    def team(self, project_id: int, as_of: Timestamp) -> Optional[tuple[int, ...]]:
+        """Возвращает ID участников проекта на дату (None - проекта не было)"""
+        history = self.__teams.get(project_id)
+        return None if history is None else history.at(to_timestamp(as_of))
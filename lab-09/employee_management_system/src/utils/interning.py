@@ -0,0 +1,96 @@
+"""Пул строк (flyweight) для часто повторяющихся значений: отделы, навыки, статусы."""
+
+import sys
+from typing import Iterable, Optional
+
+# Поля сотрудника с небольшим числом различных значений
+INTERNED_EMPLOYEE_FIELDS = ("department", "seniority_level")
+
+
+class StringPool:
+    """
+    Пул строк: равные строки заменяются одним общим экземпляром.
+
+    В пул стоит помещать только значения с небольшим числом вариантов
+    (названия отделов, технологии, статусы), так как строки из пула
+    не освобождаются до вызова clear().
+    """
+
+    def __init__(self):
+        self.__strings: dict[str, str] = {}
+        self.__hits = 0
+        self.__saved_bytes = 0
+        # Отключение нужно только для сравнительных замеров памяти
+        self.enabled = True
+
+    def __len__(self) -> int:
+        return len(self.__strings)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self.__strings
+
+    def intern(self, value: str) -> str:
+        """Возвращает общий экземпляр строки, равной value"""
+        if not self.enabled or type(value) is not str:
+            return value
+        shared = self.__strings.setdefault(value, value)
+        if shared is not value:
+            self.__hits += 1
+            self.__saved_bytes += sys.getsizeof(value)
+        return shared
+
+    def intern_list(self, values: list[str]) -> list[str]:
+        """
+        Возвращает новый список с общими экземплярами строк.
+
+        Значение, не являющееся списком, возвращается как есть,
+        чтобы его отклонил валидатор вызывающего кода.
+        """
+        if not isinstance(values, list):
+            return values
+        return [self.intern(value) for value in values]
+
+    def intern_fields(self, data: dict, fields: Iterable[str]) -> dict:
+        """Заменяет строки в указанных полях словаря на общие экземпляры"""
+        for field in fields:
+            value = data.get(field)
+            if type(value) is str:
+                data[field] = self.intern(value)
+        return data
+
+    def stats(self) -> dict:
+        """
+        Возвращает отчет о работе пула.
+
+        :return: Словарь с числом уникальных строк (unique), числом замен
+            дубликатов (hits) и оценкой освобожденной памяти (saved_bytes)
+        """
+        return {
+            "unique": len(self.__strings),
+            "hits": self.__hits,
+            "saved_bytes": self.__saved_bytes,
+        }
+
+    def clear(self) -> None:
+        """Очищает пул и статистику"""
+        self.__strings.clear()
+        self.__hits = 0
+        self.__saved_bytes = 0
+
+
+# Общий пул, которым пользуются десериализация, фабрики и EmployeeBuilder
+STRING_POOL = StringPool()
+
+
+def intern_employee_data(data: dict, pool: Optional[StringPool] = None) -> dict:
+    """
+    Заменяет повторяющиеся строки в данных сотрудника на общие экземпляры.
+
+    Изменяет и возвращает тот же словарь: отдел, уровень seniority
+    и технологии стека.
+    """
+    pool = STRING_POOL if pool is None else pool
+    pool.intern_fields(data, INTERNED_EMPLOYEE_FIELDS)
+    if "tech_stack" in data:
+        data["tech_stack"] = pool.intern_list(data["tech_stack"])
+    return data
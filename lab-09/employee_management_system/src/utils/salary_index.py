@@ -0,0 +1,206 @@
+"""Упорядоченный по зарплате индекс сотрудников."""
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate
+from typing import Iterable, Iterator, Optional
+
+from src.core.employee import Employee
+
+
+class SalaryIndex:
+    """
+    Вторичный индекс сотрудников, упорядоченный по итоговой зарплате.
+
+    Записи (зарплата, id) хранятся в отсортированных блоках ограниченного
+    размера, поэтому вставка и удаление сдвигают лишь один блок, а поиск
+    позиции, ранга и диапазона выполняется двоичным поиском.
+    При равной зарплате порядок определяется ID сотрудника.
+    """
+
+    LOAD = 512
+
+    def __init__(self, employees: Iterable[Employee] = ()):
+        """
+        Инициализация индекса
+
+        :param employees: Сотрудники для начального заполнения индекса
+        """
+        self.__buckets: list[list[tuple[float, int]]] = []
+        self.__maxes: list[tuple[float, int]] = []
+        self.__offsets: Optional[list[int]] = None
+        self.__salaries: dict[int, float] = {}
+        self.__employees: dict[int, Employee] = {}
+        self.rebuild((emp, emp.calculate_salary()) for emp in employees)
+
+    def rebuild(self, entries: Iterable[tuple[Employee, float]]) -> None:
+        """Полностью перестраивает индекс из пар (сотрудник, зарплата)"""
+        self.__salaries = {}
+        self.__employees = {}
+        for emp, salary in entries:
+            self.__salaries[emp.id] = salary
+            self.__employees[emp.id] = emp
+        ordered = sorted((s, emp_id) for emp_id, s in self.__salaries.items())
+        self.__buckets = [
+            ordered[i : i + self.LOAD] for i in range(0, len(ordered), self.LOAD)
+        ]
+        self.__maxes = [bucket[-1] for bucket in self.__buckets]
+        self.__offsets = None
+
+    def __len__(self) -> int:
+        return len(self.__salaries)
+
+    def __contains__(self, employee_id: int) -> bool:
+        return employee_id in self.__salaries
+
+    def __iter__(self) -> Iterator[Employee]:
+        """Перебирает сотрудников по возрастанию зарплаты"""
+        for bucket in self.__buckets:
+            for _, emp_id in bucket:
+                yield self.__employees[emp_id]
+
+    def get(self, employee_id: int) -> Optional[Employee]:
+        """Возвращает сотрудника из индекса по ID (None, если его нет)"""
+        return self.__employees.get(employee_id)
+
+    def salary_of(self, employee_id: int) -> Optional[float]:
+        """Возвращает зарплату сотрудника из индекса (None, если его нет)"""
+        return self.__salaries.get(employee_id)
+
+    def add(self, employee: Employee, salary: Optional[float] = None) -> None:
+        """Добавляет сотрудника или заменяет запись с тем же ID"""
+        if employee.id in self.__salaries:
+            self.remove(employee.id)
+        if salary is None:
+            salary = employee.calculate_salary()
+        self.__salaries[employee.id] = salary
+        self.__employees[employee.id] = employee
+        self._insert((salary, employee.id))
+
+    def remove(self, employee_id: int) -> None:
+        """Удаляет сотрудника из индекса"""
+        salary = self.__salaries.pop(employee_id, None)
+        if salary is None:
+            raise KeyError(employee_id)
+        del self.__employees[employee_id]
+        self._delete((salary, employee_id))
+
+    def update(self, employee_id: int, salary: float) -> None:
+        """Переставляет сотрудника в соответствии с новой зарплатой"""
+        old = self.__salaries.get(employee_id)
+        if old is None:
+            raise KeyError(employee_id)
+        if old == salary:
+            return
+        self._delete((old, employee_id))
+        self.__salaries[employee_id] = salary
+        self._insert((salary, employee_id))
+
+    def _insert(self, entry: tuple[float, int]) -> None:
+        """Вставляет запись в подходящий блок, разделяя переполненный блок"""
+        self.__offsets = None
+        if not self.__buckets:
+            self.__buckets.append([entry])
+            self.__maxes.append(entry)
+            return
+        pos = bisect_left(self.__maxes, entry)
+        if pos == len(self.__buckets):
+            pos -= 1
+        bucket = self.__buckets[pos]
+        insort(bucket, entry)
+        self.__maxes[pos] = bucket[-1]
+        if len(bucket) > 2 * self.LOAD:
+            self.__buckets.insert(pos + 1, bucket[self.LOAD :])
+            del bucket[self.LOAD :]
+            self.__maxes.insert(pos, bucket[-1])
+
+    def _delete(self, entry: tuple[float, int]) -> None:
+        """Удаляет запись, убирая опустевший блок"""
+        self.__offsets = None
+        pos = bisect_left(self.__maxes, entry)
+        bucket = self.__buckets[pos]
+        del bucket[bisect_left(bucket, entry)]
+        if bucket:
+            self.__maxes[pos] = bucket[-1]
+        else:
+            del self.__buckets[pos]
+            del self.__maxes[pos]
+
+    def _bucket_offsets(self) -> list[int]:
+        """Возвращает позиции начала блоков (пересчитываются после изменений)"""
+        if self.__offsets is None:
+            self.__offsets = [0, *accumulate(len(b) for b in self.__buckets)]
+        return self.__offsets
+
+    def _position(self, entry: tuple[float, int], right: bool = False) -> int:
+        """Позиция записи в порядке возрастания зарплаты"""
+        pos = bisect_left(self.__maxes, entry)
+        if pos == len(self.__buckets):
+            return len(self)
+        search = bisect_right if right else bisect_left
+        return self._bucket_offsets()[pos] + search(self.__buckets[pos], entry)
+
+    def _entry_at(self, position: int) -> tuple[float, int]:
+        """Запись на заданной позиции в порядке возрастания зарплаты"""
+        offsets = self._bucket_offsets()
+        pos = bisect_right(offsets, position) - 1
+        return self.__buckets[pos][position - offsets[pos]]
+
+    def _slice(self, start: int, stop: int) -> list[Employee]:
+        """Сотрудники на позициях [start, stop) по возрастанию зарплаты"""
+        result: list[Employee] = []
+        if start >= stop:
+            return result
+        offsets = self._bucket_offsets()
+        pos = bisect_right(offsets, start) - 1
+        index = start - offsets[pos]
+        while len(result) < stop - start:
+            bucket = self.__buckets[pos]
+            take = bucket[index : index + stop - start - len(result)]
+            result.extend(self.__employees[emp_id] for _, emp_id in take)
+            pos += 1
+            index = 0
+        return result
+
+    def bottom_k(self, k: int) -> list[Employee]:
+        """Возвращает k сотрудников с наименьшей зарплатой (по возрастанию)"""
+        if k < 0:
+            raise ValueError("Количество сотрудников не может быть отрицательным!")
+        return self._slice(0, min(k, len(self)))
+
+    def top_k(self, k: int) -> list[Employee]:
+        """Возвращает k сотрудников с наибольшей зарплатой (по убыванию)"""
+        if k < 0:
+            raise ValueError("Количество сотрудников не может быть отрицательным!")
+        size = len(self)
+        result = self._slice(size - min(k, size), size)
+        result.reverse()
+        return result
+
+    def range(self, low: float, high: float) -> list[Employee]:
+        """Возвращает сотрудников с зарплатой в отрезке [low, high]"""
+        if low > high:
+            return []
+        start = self._position((low, -math.inf))
+        stop = self._position((high, math.inf), right=True)
+        return self._slice(start, stop)
+
+    def rank(self, employee_id: int) -> int:
+        """Возвращает место сотрудника по зарплате (1 - самая высокая)"""
+        salary = self.__salaries.get(employee_id)
+        if salary is None:
+            raise KeyError(employee_id)
+        return len(self) - self._position((salary, employee_id))
+
+    def percentile(self, percent: float) -> float:
+        """
+        Возвращает зарплату на заданном процентиле (метод ближайшего ранга).
+
+        :param percent: Процентиль от 0 до 100
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("Процентиль должен быть в диапазоне от 0 до 100!")
+        if not self.__salaries:
+            raise ValueError("Индекс зарплат пуст!")
+        position = max(math.ceil(percent / 100 * len(self)) - 1, 0)
+        return self._entry_at(position)[0]
@@ -0,0 +1,165 @@
+"""Скомпилированные сериализаторы сотрудников и таблица типов для декодирования."""
+
+import inspect
+from typing import Callable, Optional
+
+from src.utils.interning import STRING_POOL
+
+# Классы сотрудников по значению поля "type"
+EMPLOYEE_TYPES: dict[str, type] = {}
+
+
+def register_employee_type(cls: type) -> type:
+    """Декоратор: регистрирует класс сотрудника для декодирования по полю "type"."""
+    EMPLOYEE_TYPES[cls.__name__] = cls
+    return cls
+
+
+def _attribute(cls: type, slot: str) -> str:
+    """Имя атрибута слота с учетом искажения приватных имен (__x -> _Cls__x)"""
+    if slot.startswith("__") and not slot.endswith("__"):
+        return f"_{cls.__name__.lstrip('_')}{slot}"
+    return slot
+
+
+def _merged(cls: type, name: str) -> set[str]:
+    """Объединяет кортежи-описания полей name по всей иерархии класса"""
+    merged: set[str] = set()
+    for klass in cls.__mro__:
+        merged.update(klass.__dict__.get(name, ()))
+    return merged
+
+
+class EmployeeCodec:
+    """
+    Сериализатор одного класса сотрудника, сгенерированный один раз.
+
+    По слотам иерархии класса создаются функции с прямым доступом
+    к атрибутам: encode строит словарь одним литералом, decode проверяет
+    поля через конструктор, decode_trusted заполняет слоты без проверки.
+    Ни одна из функций не изменяет переданный словарь.
+
+    Классы описывают особые поля атрибутами:
+    _pooled_fields - строки из пула (отдел, уровень), _pooled_lists -
+    списки строк (копируются и берутся из пула), _transient_slots -
+    служебные слоты вне словаря (при доверенной загрузке пустой кортеж).
+    """
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        pooled = _merged(cls, "_pooled_fields")
+        lists = _merged(cls, "_pooled_lists")
+        transient = _merged(cls, "_transient_slots")
+
+        # (ключ словаря, атрибут) в порядке иерархии от базового класса
+        fields: list[tuple[str, str]] = []
+        transient_attributes: list[str] = []
+        for klass in reversed(cls.__mro__):
+            for slot in klass.__dict__.get("__slots__", ()):
+                if slot.endswith("__") and slot.startswith("__"):
+                    continue
+                attribute = _attribute(klass, slot)
+                if slot in transient:
+                    transient_attributes.append(attribute)
+                else:
+                    fields.append((attribute.split("__")[-1], attribute))
+        self.fields = tuple(key for key, _ in fields)
+        has_dict = cls.__dictoffset__ != 0
+        name = cls.__name__
+
+        def read(key: str) -> str:
+            value = f"data[{key!r}]"
+            if key in lists:
+                return f"intern_list({value})"
+            if key in pooled:
+                return f"intern({value})"
+            return value
+
+        encode = ["def encode(self):", f"    data = {{'type': {name!r},"]
+        for key, attribute in fields:
+            value = f"self.{attribute}"
+            encode.append(
+                f"        {key!r}: {'list(' + value + ')' if key in lists else value},"
+            )
+        encode.append("    }")
+        if has_dict:
+            # Атрибуты подклассов без __slots__
+            encode.append("    for key, value in self.__dict__.items():")
+            encode.append("        data[key.split('__')[-1]] = value")
+        encode.append("    return data")
+
+        positional, keywords = [], []
+        for p in inspect.signature(cls).parameters.values():
+            if p.kind == p.POSITIONAL_OR_KEYWORD:
+                positional.append(p.name)
+            elif p.kind == p.KEYWORD_ONLY:
+                keywords.append(p.name)
+        parameters = positional + keywords
+        arguments = positional + [f"{p}={p}" for p in keywords]
+        check = [
+            f"    if data.get('type') != {name!r}:",
+            "        raise ValueError('Неподходящий тип данных!')",
+            "    try:",
+        ]
+        missing = [
+            "    except KeyError as error:",
+            "        raise ValueError(",
+            f"            'Для создания {name} отсутствует поле: ' + repr(error.args[0])",
+            "        ) from None",
+        ]
+        decode = ["def decode(data):", *check]
+        decode += [f"        {p} = {read(p)}" for p in parameters]
+        decode += missing
+        decode.append(f"    return cls({', '.join(arguments)})")
+
+        if has_dict:
+            decode_trusted = ["def decode_trusted(data):", "    return decode(data)"]
+        else:
+            decode_trusted = ["def decode_trusted(data):", *check]
+            decode_trusted.append("        employee = new(cls)")
+            decode_trusted += [
+                f"        employee.{attribute} = {read(key)}"
+                for key, attribute in fields
+            ]
+            decode_trusted += [
+                f"        employee.{a} = ()" for a in transient_attributes
+            ]
+            decode_trusted += missing
+            decode_trusted.append("    return employee")
+
+        namespace = {
+            "cls": cls,
+            "new": object.__new__,
+            "intern": STRING_POOL.intern,
+            "intern_list": STRING_POOL.intern_list,
+        }
+        source = "\n".join([*encode, *decode, *decode_trusted])
+        exec(compile(source, f"<codec {name}>", "exec"), namespace)
+        self.encode: Callable[[object], dict] = namespace["encode"]
+        self.decode: Callable[[dict], object] = namespace["decode"]
+        self.decode_trusted: Callable[[dict], object] = namespace["decode_trusted"]
+
+
+_CODECS: dict[type, EmployeeCodec] = {}
+
+
+def codec_for(cls: type) -> EmployeeCodec:
+    """Возвращает сериализатор класса, создавая его при первом обращении"""
+    codec = _CODECS.get(cls)
+    if codec is None:
+        codec = _CODECS[cls] = EmployeeCodec(cls)
+    return codec
+
+
+def decode_employee(data: dict, trusted: bool = False):
+    """
+    Создает сотрудника класса, указанного в поле "type".
+
+    :param trusted: Заполнить поля без проверки (собственные снимки)
+    :raises ValueError: Неизвестный тип или отсутствующее поле
+    """
+    cls: Optional[type] = EMPLOYEE_TYPES.get(data.get("type"))
+    if cls is None:
+        raise ValueError(f"Неизвестный тип сотрудника: {data.get('type')!r}")
+    codec = codec_for(cls)
+    return codec.decode_trusted(data) if trusted else codec.decode(data)
@@ -0,0 +1,160 @@
+"""Инвертированный индекс навыков разработчиков."""
+
+from typing import Iterable, Optional
+
+from src.core.employee import Employee
+
+
+def normalize_skill(skill: str) -> str:
+    """Приводит название технологии к единому виду ("  Python " -> "python")."""
+    if not isinstance(skill, str) or not skill.strip():
+        raise ValueError("Технология должна быть непустой строкой!")
+    return skill.strip().casefold()
+
+
+class SkillIndex:
+    """
+    Инвертированный индекс: навык -> ID разработчиков.
+
+    Дополнительно хранит группы по уровню seniority и отделу, чтобы фильтры
+    сочетались с навыками через пересечения множеств без полного перебора.
+    Учитываются только сотрудники со стеком технологий (tech_stack).
+    """
+
+    def __init__(self, employees: Iterable[Employee] = ()):
+        """
+        Инициализация индекса
+
+        :param employees: Сотрудники для начального заполнения индекса
+        """
+        self.__by_skill: dict[str, set[int]] = {}
+        self.__by_seniority: dict[str, set[int]] = {}
+        self.__by_department: dict[str, set[int]] = {}
+        self.__skills: dict[int, frozenset[str]] = {}
+        self.__employees: dict[int, Employee] = {}
+        for emp in employees:
+            self.add(emp)
+
+    def __len__(self) -> int:
+        return len(self.__employees)
+
+    def __contains__(self, employee_id: int) -> bool:
+        return employee_id in self.__employees
+
+    @staticmethod
+    def _link(groups: dict[str, set[int]], key, employee_id: int) -> None:
+        """Добавляет ID в группу"""
+        groups.setdefault(key, set()).add(employee_id)
+
+    @staticmethod
+    def _unlink(groups: dict[str, set[int]], key, employee_id: int) -> None:
+        """Удаляет ID из группы, убирая опустевшую группу"""
+        members = groups.get(key)
+        if members is None:
+            return
+        members.discard(employee_id)
+        if not members:
+            del groups[key]
+
+    def add(self, employee: Employee) -> None:
+        """Добавляет разработчика в индекс (остальные сотрудники пропускаются)"""
+        stack = getattr(employee, "tech_stack", None)
+        if stack is None:
+            return
+        if employee.id in self.__employees:
+            self.remove(employee.id)
+        skills = frozenset(normalize_skill(skill) for skill in stack)
+        self.__employees[employee.id] = employee
+        self.__skills[employee.id] = skills
+        for skill in skills:
+            self._link(self.__by_skill, skill, employee.id)
+        self._link(self.__by_seniority, employee.seniority_level, employee.id)
+        self._link(self.__by_department, employee.department, employee.id)
+
+    def remove(self, employee_id: int) -> None:
+        """Удаляет разработчика из индекса (если он там есть)"""
+        employee = self.__employees.pop(employee_id, None)
+        if employee is None:
+            return
+        for skill in self.__skills.pop(employee_id):
+            self._unlink(self.__by_skill, skill, employee_id)
+        self._unlink(self.__by_seniority, employee.seniority_level, employee_id)
+        self._unlink(self.__by_department, employee.department, employee_id)
+
+    def update(self, employee: Employee, attribute: str, old_value, new_value) -> None:
+        """Обновляет индекс после изменения атрибута разработчика"""
+        if self.__employees.get(employee.id) is not employee:
+            return
+        if attribute == "tech_stack":
+            skills = frozenset(normalize_skill(skill) for skill in new_value)
+            old_skills = self.__skills[employee.id]
+            for skill in old_skills - skills:
+                self._unlink(self.__by_skill, skill, employee.id)
+            for skill in skills - old_skills:
+                self._link(self.__by_skill, skill, employee.id)
+            self.__skills[employee.id] = skills
+        elif attribute == "seniority_level":
+            self._unlink(self.__by_seniority, old_value, employee.id)
+            self._link(self.__by_seniority, new_value, employee.id)
+        elif attribute == "department":
+            self._unlink(self.__by_department, old_value, employee.id)
+            self._link(self.__by_department, new_value, employee.id)
+
+    def skills(self) -> list[str]:
+        """Возвращает все известные индексу навыки"""
+        return sorted(self.__by_skill)
+
+    def skill_count(self, skill: str) -> int:
+        """Возвращает число разработчиков, владеющих навыком"""
+        return len(self.__by_skill.get(normalize_skill(skill), ()))
+
+    def query_ids(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+        seniority: Optional[str] = None,
+        department: Optional[str] = None,
+    ) -> set[int]:
+        """
+        Возвращает ID разработчиков, удовлетворяющих условию.
+
+        :param all_of: Навыки, которыми нужно владеть одновременно (AND)
+        :param any_of: Навыки, хотя бы одним из которых нужно владеть (OR)
+        :param none_of: Навыки, которых не должно быть (NOT)
+        :param seniority: Требуемый уровень seniority
+        :param department: Требуемый отдел
+        """
+        candidates: list[set[int]] = []
+        for skill in all_of:
+            candidates.append(self.__by_skill.get(normalize_skill(skill), set()))
+        any_skills = [normalize_skill(skill) for skill in any_of]
+        if any_skills:
+            candidates.append(
+                set().union(*(self.__by_skill.get(s, ()) for s in any_skills))
+            )
+        if seniority is not None:
+            candidates.append(self.__by_seniority.get(seniority, set()))
+        if department is not None:
+            candidates.append(self.__by_department.get(department, set()))
+
+        if candidates:
+            candidates.sort(key=len)
+            result = set(candidates[0]).intersection(*candidates[1:])
+        else:
+            result = set(self.__employees)
+        for skill in none_of:
+            result -= self.__by_skill.get(normalize_skill(skill), set())
+        return result
+
+    def query(
+        self,
+        all_of: Iterable[str] = (),
+        any_of: Iterable[str] = (),
+        none_of: Iterable[str] = (),
+        seniority: Optional[str] = None,
+        department: Optional[str] = None,
+    ) -> list[Employee]:
+        """Возвращает разработчиков по условию query_ids, упорядоченных по ID"""
+        ids = self.query_ids(all_of, any_of, none_of, seniority, department)
+        return [self.__employees[i] for i in sorted(ids)]
@@ -7,6 +7,8 @@ SRP: Каждый валидатор отвечает только за вали
 from datetime import datetime
 from typing import Any
 
+from src.utils.exceptions import InvalidStatusError
+
 
 class BaseValidator:
     """Базовый класс для всех валидаторов."""
@@ -155,9 +157,18 @@ class ProjectValidator(BaseValidator):
         valid_statuses = {"planning", "active", "completed", "cancelled"}
         normalized = ProjectValidator.validate_not_empty_string(value, "Статус проекта")
         if normalized not in valid_statuses:
-            raise ValueError(f"Статус должен быть одним из: {valid_statuses}")
+            raise InvalidStatusError(f"Статус должен быть одним из: {valid_statuses}")
         return normalized
 
+    @staticmethod
+    def validate_required_skills(value: list) -> list:
+        """Валидирует список требуемых навыков проекта."""
+        if not isinstance(value, list):
+            raise ValueError("Требуемые навыки должны быть списком!")
+        if not all(isinstance(item, str) and item.strip() for item in value):
+            raise ValueError("Требуемый навык должен быть непустой строкой!")
+        return [skill.strip() for skill in value]
+
 
 class CompanyValidator(BaseValidator):
     """Валидатор для компании."""
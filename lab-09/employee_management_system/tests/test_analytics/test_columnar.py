@@ -0,0 +1,89 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.core.project import Project
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
+
+
+def running_sum(employees):
+    total = 0.0
+    for emp in employees:
+        total += emp.calculate_salary()
+    return total
+
+
+def make_company():
+    company = Company("TechCorp")
+    dev = Department("Development")
+    sales = Department("Sales")
+    employees = [
+        Employee(1, "Base", "DEV", 4000.3),
+        Manager(2, "Manager", "DEV", 5000.1, 1000.7),
+        Developer(3, "Dev", "DEV", 5000.9, ["Python"], "middle"),
+        Salesperson(4, "Sales", "SAL", 3000.2, 0.13, 50000.7),
+    ]
+    for emp in employees[:3]:
+        dev.add_employee(emp)
+    sales.add_employee(employees[3])
+    company.add_department(dev)
+    company.add_department(sales)
+    project = Project(1, "P1", "Desc", "2024-12-31", "active")
+    company.add_project(project)
+    project.add_team_member(employees[2])
+    project.add_team_member(employees[3])
+    return company, employees, project
+
+
+class TestPayrollColumns:
+    def test_salaries_match_object_path_exactly(self):
+        company, employees, _ = make_company()
+
+        columns = company.get_payroll_columns()
+
+        assert columns.salaries().tolist() == [e.calculate_salary() for e in employees]
+
+    def test_group_totals_match_object_path(self):
+        company, employees, project = make_company()
+
+        columns = company.get_payroll_columns()
+
+        assert columns.total() == company.calculate_total_monthly_cost()
+        assert columns.total() == running_sum(employees)
+        assert columns.department_totals() == {
+            d.name: d.calculate_total_salary() for d in company.get_departments()
+        }
+        assert columns.project_totals() == {1: project.calculate_total_salary()}
+
+    def test_columns_rebuilt_after_salary_change(self):
+        company, employees, _ = make_company()
+        first = company.get_payroll_columns()
+        assert company.get_payroll_columns() is first
+
+        employees[2].seniority_level = "senior"
+
+        columns = company.get_payroll_columns()
+        assert columns is not first
+        assert columns.salaries()[2] == employees[2].calculate_salary()
+
+    def test_project_only_member_excluded_from_total(self):
+        company = Company("TechCorp")
+        dept = Department("Development")
+        dept.add_employee(Employee(1, "Staff", "DEV", 1000.0))
+        company.add_department(dept)
+        project = Project(1, "P1", "Desc", "2024-12-31", "active")
+        company.add_project(project)
+        project.add_team_member(company.find_employee_by_id(1))
+        project.add_team_member(Employee(2, "Contractor", "EXT", 500.0))
+
+        columns = company.get_payroll_columns()
+
+        assert len(columns) == 2 and columns.company_rows == 1
+        assert columns.total() == company.calculate_total_monthly_cost() == 1000.0
+        assert columns.project_totals() == {1: 1500.0}
+        assert columns.department_totals() == {"Development": 1000.0}
@@ -0,0 +1,80 @@
+import pytest
+
+from src.analytics.coverage import SkillCoverage, SkillVocabulary
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.core.project import Project
+from src.employees.developer import Developer
+
+
+@pytest.fixture
+def developers():
+    return [
+        Developer(1, "Alice", "DEV", 5000.0, ["Python"], "senior"),
+        Developer(2, "Bob", "DEV", 4000.0, ["Kafka", "SQL"], "middle"),
+        Developer(3, "Carol", "DEV", 4500.0, ["Go", "Kafka", "Docker"], "senior"),
+        Developer(4, "Dave", "DEV", 3000.0, ["sql"], "junior"),
+        Developer(5, "Eve", "DEV", 3000.0, ["Kafka", "SQL"], "junior"),
+    ]
+
+
+@pytest.fixture
+def project(developers):
+    project = Project(
+        1, "Pipeline", "Desc", "2024-12-31", "active", ["Python", "Kafka", "SQL", "Go"]
+    )
+    project.add_team_member(developers[0])
+    return project
+
+
+class TestSkillVocabulary:
+    def test_encode_decode(self):
+        vocabulary = SkillVocabulary(["Python", "Kafka"])
+
+        mask = vocabulary.encode([" kafka", "SQL"])
+
+        assert mask == 0b110
+        assert vocabulary.decode(mask) == ["kafka", "sql"]
+        assert "PYTHON" in vocabulary
+        assert len(vocabulary) == 3
+
+
+class TestSkillCoverage:
+    def test_coverage_and_missing(self, developers, project):
+        coverage = SkillCoverage(developers + [Employee(9, "Ivan", "IT", 100.0)])
+
+        assert len(coverage) == 5
+        assert coverage.coverage(project) == {
+            "required": ["python", "kafka", "sql", "go"],
+            "covered": ["python"],
+            "missing": ["kafka", "sql", "go"],
+            "ratio": 0.25,
+        }
+        assert coverage.missing_skills(project) == ["kafka", "sql", "go"]
+
+    def test_marginal_gain_and_ranking(self, developers, project):
+        coverage = SkillCoverage(developers)
+
+        assert coverage.marginal_gain(project, developers[2]) == 2
+        assert coverage.marginal_gain(project, developers[0]) == 0
+        ranked = coverage.rank_candidates(project)
+        assert [(d.id, gain) for d, gain in ranked] == [(2, 2), (3, 2), (5, 2), (4, 1)]
+        assert [d.id for d, _ in coverage.rank_candidates(project, limit=2)] == [2, 3]
+
+    def test_fully_covered_project_has_no_candidates(self, developers, project):
+        project.required_skills = ["Python"]
+
+        assert SkillCoverage(developers).rank_candidates(project) == []
+        assert SkillCoverage(developers).coverage(project)["ratio"] == 1.0
+
+    def test_from_company(self, developers, project):
+        company = Company("TechCorp")
+        dept = Department("DEV")
+        for dev in developers:
+            dept.add_employee(dev)
+        company.add_department(dept)
+
+        coverage = SkillCoverage.from_company(company)
+
+        assert coverage.rank_candidates(project, limit=1)[0][0] is developers[1]
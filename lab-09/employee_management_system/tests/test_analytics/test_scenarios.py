@@ -0,0 +1,133 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.analytics.scenarios import Adjustment, Scenario, ScenarioEngine
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.core.project import Project
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
+
+
+@pytest.fixture
+def company():
+    company = Company("TechCorp")
+    dev = Department("Development")
+    sales = Department("Sales")
+    for emp in [
+        Employee(1, "Base", "DEV", 4000.0),
+        Manager(2, "Manager", "DEV", 5000.0, 1000.0),
+        Developer(3, "Senior", "DEV", 5000.0, ["Python"], "senior"),
+        Developer(4, "Junior", "DEV", 3000.0, ["Python"], "junior"),
+    ]:
+        dev.add_employee(emp)
+    sales.add_employee(Salesperson(5, "Sales", "SAL", 3000.0, 0.1, 20000.0))
+    company.add_department(dev)
+    company.add_department(sales)
+    project = Project(1, "P1", "Desc", "2024-12-31", "active")
+    company.add_project(project)
+    project.add_team_member(dev.find_employee_by_id(3))
+    project.add_team_member(sales.find_employee_by_id(5))
+    return company
+
+
+def finance_scenarios():
+    return [
+        Scenario(
+            "seniors +5%",
+            [Adjustment("base_salary", "scale", 1.05, seniority="senior")],
+        ),
+        Scenario("manager bonus +3%", [Adjustment("bonus", "scale", 1.03)]),
+        Scenario("commission 7%", [Adjustment("commission_rate", "set", 0.07)]),
+        Scenario(
+            "sales dept +100",
+            [Adjustment("base_salary", "add", 100.0, department="Sales")],
+        ),
+    ]
+
+
+class TestAdjustment:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"column": "name", "operation": "scale", "value": 1.0},
+            {"column": "bonus", "operation": "pow", "value": 1.0},
+            {"column": "bonus", "operation": "add", "value": "1"},
+            {"column": "bonus", "operation": "add", "value": 1, "employee_type": "CEO"},
+            {"column": "bonus", "operation": "add", "value": 1, "seniority": "lead"},
+        ],
+    )
+    def test_invalid_adjustments(self, kwargs):
+        with pytest.raises(ValueError):
+            Adjustment(**kwargs)
+
+    def test_scenario_round_trip(self):
+        scenario = finance_scenarios()[0]
+
+        restored = Scenario.from_dict(scenario.to_dict())
+
+        assert restored.to_dict() == scenario.to_dict()
+
+
+class TestScenarioEngine:
+    def test_results_match_mutated_model(self, company):
+        results = company.simulate_payroll(finance_scenarios())
+
+        assert [r.delta for r in results] == pytest.approx([500.0, 30.0, -600.0, 100.0])
+        assert results[0].department_deltas == pytest.approx(
+            {"Development": 500.0, "Sales": 0.0}
+        )
+        assert results[2].project_deltas == pytest.approx({1: -600.0})
+
+        senior = company.find_employee_by_id(3)
+        senior.base_salary = 5250.0
+        assert results[0].total == company.calculate_total_monthly_cost()
+        assert (
+            results[0].project_totals[1]
+            == company.get_project_budget_analysis()["total_budget"]
+        )
+
+    def test_live_model_and_snapshot_untouched(self, company):
+        columns = company.get_payroll_columns()
+        before = columns.salaries().copy()
+
+        company.simulate_payroll(finance_scenarios())
+
+        assert company.find_employee_by_id(2).bonus == 1000.0
+        assert (columns.salaries() == before).all()
+        assert company.calculate_total_monthly_cost() == 28000.0
+
+    def test_bonus_only_applies_to_managers(self, company):
+        engine = ScenarioEngine(company.get_payroll_columns())
+
+        result = engine.evaluate(Scenario("bonus", [Adjustment("bonus", "add", 500.0)]))
+
+        assert result.delta == 500.0
+        assert engine.baseline.total == 28000.0
+
+    def test_process_pool_matches_in_process(self, company):
+        scenarios = finance_scenarios()
+
+        local = company.simulate_payroll(scenarios)
+        pooled = company.simulate_payroll(scenarios, workers=2)
+
+        assert [r.to_dict() for r in pooled] == [r.to_dict() for r in local]
+
+    def test_project_only_member_not_in_company_total(self, company):
+        project = company.get_projects()[0]
+        project.add_team_member(Employee(9, "Contractor", "EXT", 2000.0))
+        engine = ScenarioEngine(company.get_payroll_columns())
+
+        result = engine.evaluate(
+            Scenario(
+                "employees +100",
+                [Adjustment("base_salary", "add", 100.0, employee_type="Employee")],
+            )
+        )
+
+        assert engine.baseline.total == company.calculate_total_monthly_cost()
+        assert result.delta == pytest.approx(100.0)
+        assert result.project_deltas == pytest.approx({1: 100.0})
@@ -0,0 +1,141 @@
+import pytest
+
+from src.analytics.staffing import (
+    Assignment,
+    StaffingOptimizer,
+    StaffingPlan,
+    StaffingRequest,
+)
+from src.core.company import Company
+from src.core.department import Department
+from src.core.project import Project
+from src.employees.developer import Developer
+from src.patterns.observer import ICompanyObserver
+from src.utils.exceptions import DuplicateIdError
+
+
+@pytest.fixture
+def company():
+    company = Company("TechCorp")
+    dept = Department("DEV")
+    for dev in [
+        Developer(1, "Alice", "DEV", 5000.0, ["Python", "Kafka"], "junior"),
+        Developer(2, "Bob", "DEV", 3000.0, ["Python", "Kafka"], "junior"),
+        Developer(3, "Carol", "DEV", 4000.0, ["SQL"], "junior"),
+        Developer(4, "Dave", "DEV", 2000.0, ["Go"], "junior"),
+        Developer(5, "Eve", "DEV", 9000.0, ["Python", "Kafka", "SQL"], "junior"),
+    ]:
+        dept.add_employee(dev)
+    company.add_department(dept)
+    return company
+
+
+def make_project(project_id, skills):
+    return Project(project_id, f"P{project_id}", "Desc", "2030-12-31", "active", skills)
+
+
+class TestStaffingRequest:
+    def test_validation(self, company):
+        with pytest.raises(ValueError):
+            StaffingRequest("not a project")
+        with pytest.raises(ValueError):
+            StaffingRequest(make_project(1, []), budget=-1)
+        with pytest.raises(ValueError):
+            StaffingRequest(make_project(1, []), max_members=0)
+
+
+class TestStaffingOptimizer:
+    def test_greedy_prefers_gain_then_cost(self, company):
+        project = make_project(1, ["Python", "Kafka", "SQL"])
+
+        plan = company.plan_staffing([StaffingRequest(project)])
+
+        assert [a.employee.id for a in plan.assignments] == [5]
+        assert plan.objective == 3
+        assert plan.missing == {1: []}
+        assert plan.runtime >= 0
+
+    def test_budget_and_member_limits(self, company):
+        project = make_project(1, ["Python", "Kafka", "SQL", "Go"])
+
+        plan = company.plan_staffing(
+            [StaffingRequest(project, budget=7000.0, max_members=2)]
+        )
+
+        assert [a.employee.id for a in plan.assignments] == [2, 4]
+        assert plan.total_cost == 5000.0
+        assert plan.missing == {1: ["sql"]}
+
+    def test_load_limit_is_shared_between_projects(self, company):
+        first = make_project(1, ["Python", "Kafka"])
+        second = make_project(2, ["Python", "Kafka"])
+
+        plan = company.plan_staffing(
+            [StaffingRequest(first), StaffingRequest(second)], load_limit=1
+        )
+
+        chosen = {a.project.project_id: a.employee.id for a in plan.assignments}
+        assert sorted(chosen.values()) == [1, 2]
+
+    def test_default_limit_respects_overload_threshold(self, company):
+        busy = make_project(9, ["Go"])
+        company.add_project(busy)
+        busy.add_team_member(company.find_employee_by_id(4))
+        project = make_project(1, ["Go"])
+
+        plan = StaffingOptimizer(company).plan([StaffingRequest(project)])
+
+        assert plan.assignments == []
+        assert plan.missing == {1: ["go"]}
+
+    def test_apply_adds_team_members_in_batch(self, company):
+        project = make_project(1, ["Python", "Kafka", "SQL"])
+        company.add_project(project)
+        plan = company.plan_staffing([StaffingRequest(project, max_members=2)])
+
+        company.apply_staffing(plan)
+
+        assert [e.id for e in project.team] == [5]
+        assert company.get_project_load(5) == 1
+        assert plan.to_dict()["assignments"][0]["project_id"] == 1
+
+    def test_apply_is_incremental(self, company):
+        class BulkWatcher(ICompanyObserver):
+            loads = 0
+
+            def on_bulk_loaded(self, company):
+                self.loads += 1
+
+        watcher = BulkWatcher()
+        company.attach_observer(watcher)
+        project = make_project(1, ["Python", "Kafka", "SQL"])
+        company.add_project(project)
+        version = company.version
+
+        company.apply_staffing(company.plan_staffing([StaffingRequest(project)]))
+
+        assert watcher.loads == 0
+        assert company.version == version
+        assert company.get_employee_projects(5) == [project]
+
+    def test_invalid_plan_changes_nothing(self, company):
+        first, second = make_project(1, ["Go"]), make_project(2, ["SQL"])
+        company.add_project(first)
+        company.add_project(second)
+        dave = company.find_employee_by_id(4)
+        carol = company.find_employee_by_id(3)
+        plan = StaffingPlan(
+            [
+                Assignment(carol, second, 1, carol.calculate_salary()),
+                Assignment(dave, first, 1, dave.calculate_salary()),
+                Assignment(dave, first, 1, dave.calculate_salary()),
+            ],
+            {},
+            0.0,
+        )
+
+        with pytest.raises(DuplicateIdError):
+            company.apply_staffing(plan)
+
+        assert first.team == [] and second.team == []
+        assert company.get_project_load(3) == 0
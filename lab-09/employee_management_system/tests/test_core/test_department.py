@@ -1,9 +1,11 @@
 import pytest
 
 from src.core.employee import Employee
-from src.core.department import Department
+from src.core.department import Department, MemberIndex
+from src.core.project import Project
 from src.employees.developer import Developer
 from src.employees.manager import Manager
+from src.utils.exceptions import DuplicateIdError
 
 
 class TestDepartmentBasic:
@@ -131,6 +133,31 @@ class TestSerialization:
         assert new_emp.department == emp.department
         assert new_emp.base_salary == emp.base_salary
 
+    def test_trusted_from_dict_matches_checked(self):
+        dept = Department("IT")
+        dept.add_employee(Employee(1, "John", "IT", 5000.0))
+        dept.add_employee(Manager(2, "Ann", "IT", 6000.0, 500.0))
+        dept.add_employee(Developer(3, "Bob", "IT", 4000.0, ["Go"], "middle"))
+        data = dept.to_dict()
+
+        trusted = Department.from_dict(data, trusted=True)
+
+        assert data == dept.to_dict()
+        assert trusted.to_dict() == dept.to_dict()
+        assert trusted.calculate_total_salary() == dept.calculate_total_salary()
+
+    def test_trusted_from_dict_checks_structure(self):
+        with pytest.raises(ValueError):
+            Department.from_dict(
+                {"name": "IT", "employees": [{"type": "Intern", "id": 1}]},
+                trusted=True,
+            )
+        with pytest.raises(ValueError):
+            Department.from_dict(
+                {"name": "IT", "employees": [{"type": "Manager", "id": 1}]},
+                trusted=True,
+            )
+
 
 class TestSorting:
     def test_sorting_by_name_and_salary(self):
@@ -145,3 +172,86 @@ class TestSorting:
 
         sorted_by_salary = sorted(employees, key=lambda e: e.calculate_salary())
         assert sorted_by_salary[0].calculate_salary() == 5000.0
+
+
+class TestDepartmentHashedMembership:
+    def test_order_preserved_after_removal(self):
+        dept = Department("IT")
+        employees = [Employee(i, f"Emp{i}", "IT", 5000.0) for i in range(1, 5)]
+        for emp in employees:
+            dept.add_employee(emp)
+
+        dept.remove_employee(2)
+
+        assert [e.id for e in dept] == [1, 3, 4]
+        assert dept[1] is employees[2]
+        assert dept[-1] is employees[3]
+        assert [e.id for e in dept[:2]] == [1, 3]
+
+    def test_contains_by_employee_and_id(self):
+        dept = Department("IT")
+        emp = Employee(1, "John", "IT", 5000.0)
+        dept.add_employee(emp)
+
+        assert emp in dept
+        assert Employee(1, "Copy", "IT", 1.0) in dept
+        assert 1 in dept
+        assert 2 not in dept
+
+    def test_id_change_rekeys_department(self):
+        dept = Department("IT")
+        employees = [Employee(i, f"Emp{i}", "IT", 5000.0) for i in range(1, 4)]
+        for emp in employees:
+            dept.add_employee(emp)
+
+        employees[0].id = 5
+
+        assert 5 in dept and 1 not in dept
+        assert dept.find_employee_by_id(5) is employees[0]
+        assert [e.id for e in dept] == [5, 2, 3]
+        dept.remove_employee(5)
+        assert [e.id for e in dept] == [2, 3]
+        assert dept.calculate_total_salary() == 10000.0
+
+    def test_member_index_rekey_keeps_position(self):
+        index = MemberIndex()
+        members = [Employee(i, f"Emp{i}", "IT", 5000.0) for i in range(1, 4)]
+        for emp in members:
+            index[emp.id] = emp
+
+        index.rekey(1, 9)
+        index[1] = Employee(1, "New", "IT", 1.0)
+
+        assert list(index) == [9, 2, 3, 1]
+        assert index.get(9) is members[0] and 1 in index
+        assert [key for key, _ in index.items()] == list(index)
+        del index[2]
+        assert index.pop(2) is None
+        assert list(index) == [9, 3, 1]
+        assert list(index.values())[:2] == [members[0], members[2]]
+
+    def test_id_change_to_taken_id_rejected(self):
+        dept = Department("IT")
+        first, second = Employee(1, "A", "IT", 1.0), Employee(2, "B", "IT", 1.0)
+        dept.add_employee(first)
+        dept.add_employee(second)
+
+        with pytest.raises(DuplicateIdError):
+            first.id = 2
+        assert first.id == 1
+        assert dept.find_employee_by_id(1) is first
+
+    def test_id_change_rekeys_project_team(self):
+        project = Project(1, "AI", "Описание", "2030-12-31")
+        emp = Employee(1, "John", "IT", 5000.0)
+        project.add_team_member(emp)
+        project.add_team_member(Employee(2, "Jane", "IT", 5000.0))
+
+        emp.id = 7
+
+        assert project.find_team_member(7) is emp
+        assert project.find_team_member(1) is None
+        with pytest.raises(DuplicateIdError):
+            emp.id = 2
+        project.remove_team_member(7)
+        assert [e.id for e in project.team] == [2]
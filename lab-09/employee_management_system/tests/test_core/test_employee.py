@@ -1,6 +1,9 @@
 import pytest
 
 from src.core.employee import Employee
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
 
 
 class TestEmployeeCreation:
@@ -61,3 +64,94 @@ class TestEmployeeMethods:
         salary = emp.calculate_salary()
 
         assert salary == 5000.0
+
+
+class TestEmployeeSlots:
+    @pytest.mark.parametrize(
+        "emp",
+        [
+            Employee(1, "Alice", "IT", 5000.0),
+            Manager(2, "Bob", "IT", 5000.0, 1000.0),
+            Developer(3, "Carol", "IT", 5000.0, ["Python"], "senior"),
+            Salesperson(4, "Dan", "IT", 5000.0, 0.1, 1000.0),
+        ],
+    )
+    def test_no_instance_dict_and_round_trip(self, emp):
+        assert not hasattr(emp, "__dict__")
+        with pytest.raises(AttributeError):
+            emp.extra = 1
+        data = emp.to_dict()
+        assert list(data)[:5] == ["type", "id", "name", "department", "base_salary"]
+        assert type(emp).from_dict(dict(data)).to_dict() == data
+
+    def test_to_dict_includes_subclass_attributes(self):
+        class Intern(Employee):
+            def __init__(self, *args, mentor):
+                super().__init__(*args)
+                self.mentor = mentor
+
+        data = Intern(1, "Alice", "IT", 1000.0, mentor="Bob").to_dict()
+        assert data == {
+            "type": "Intern",
+            "id": 1,
+            "name": "Alice",
+            "department": "IT",
+            "base_salary": 1000.0,
+            "mentor": "Bob",
+        }
+
+    def test_observers_attach_and_detach(self):
+        emp = Employee(1, "Alice", "IT", 5000.0)
+        calls = []
+
+        class Observer:
+            def on_salary_changed(self, employee, old, new):
+                calls.append((old, new))
+
+            def on_attribute_changed(self, employee, attribute, old, new):
+                pass
+
+        observer = Observer()
+        emp.attach_observer(observer)
+        emp.attach_observer(observer)
+        emp.base_salary = 6000.0
+        emp.detach_observer(observer)
+        emp.base_salary = 7000.0
+        assert calls == [(5000.0, 6000.0)]
+
+
+class TestTrustedConstruction:
+    def test_skips_field_validation(self):
+        emp = Employee.from_trusted_dict(
+            {
+                "type": "Employee",
+                "id": 1,
+                "name": "",
+                "department": "IT",
+                "base_salary": -1,
+            }
+        )
+        assert emp.name == ""
+        assert emp.base_salary == -1
+
+    def test_does_not_mutate_or_alias_input(self):
+        data = Developer(1, "A", "IT", 1000.0, ["Go"], "senior").to_dict()
+        emp = Developer.from_trusted_dict(data)
+        assert data["type"] == "Developer"
+        emp.add_skill("Rust")
+        assert data["tech_stack"] == ["Go"]
+        assert emp.calculate_salary() == 2000.0
+
+    def test_structural_check(self):
+        with pytest.raises(ValueError):
+            Manager.from_trusted_dict({"type": "Employee", "id": 1})
+        with pytest.raises(ValueError, match="bonus"):
+            Manager.from_trusted_dict(
+                {
+                    "type": "Manager",
+                    "id": 1,
+                    "name": "A",
+                    "department": "IT",
+                    "base_salary": 1.0,
+                }
+            )
@@ -7,7 +7,13 @@ from src.core.company import Company
 from src.employees.developer import Developer
 from src.employees.manager import Manager
 from src.employees.salesperson import Salesperson
-from src.utils.exceptions import DuplicateIdError, InvalidStatusError
+from src.utils.exceptions import (
+    BulkLoadError,
+    EmployeeNotFoundError,
+    DuplicateIdError,
+    InvalidStatusError,
+    PayrollMismatchError,
+)
 
 
 class TestProject:
@@ -39,6 +45,23 @@ class TestProject:
 
         assert total == expected
 
+    def test_required_skills_round_trip(self):
+        project = Project(
+            1,
+            "AI Platform",
+            "Разработка AI системы",
+            "2024-12-31",
+            "planning",
+            ["Python"],
+        )
+        project.required_skills = ["Python", "Kafka"]
+
+        restored = Project.from_dict(project.to_dict())
+
+        assert restored.required_skills == ["Python", "Kafka"]
+        with pytest.raises(ValueError):
+            project.required_skills = ["Python", " "]
+
     @pytest.mark.parametrize("invalid_status", ["invalid", "done", "in_progress"])
     def test_project_invalid_status_raises_error(self, invalid_status):
         with pytest.raises(InvalidStatusError):
@@ -144,3 +167,429 @@ class TestComplexCompanyStructure:
         assert len(company.get_all_employees()) == 3
         assert ai_project.get_team_size() == 2
         assert web_project.get_team_size() == 1
+
+
+class TestCompanyEmployeeIndex:
+    def test_index_follows_department_changes(self):
+        company = Company("TechCorp")
+        dept = Department("Development")
+        company.add_department(dept)
+        emp = Employee(1, "John", "DEV", 5000.0)
+
+        dept.add_employee(emp)
+        assert company.find_employee_by_id(1) is emp
+
+        dept.remove_employee(1)
+        assert company.find_employee_by_id(1) is None
+
+    def test_index_after_transfer(self):
+        company = Company("TechCorp")
+        dev = Department("Development")
+        qa = Department("QA")
+        emp = Employee(1, "John", "DEV", 5000.0)
+        dev.add_employee(emp)
+        company.add_department(dev)
+        company.add_department(qa)
+
+        company.transfer_employee(emp, dev, qa)
+
+        assert company.find_employee_by_id(1) is emp
+        assert emp in qa
+        assert emp not in dev
+
+    def test_unique_employee_id_check_uses_index(self):
+        company = Company("TechCorp")
+        dept = Department("Development")
+        dept.add_employee(Employee(1, "John", "DEV", 5000.0))
+        company.add_department(dept)
+
+        with pytest.raises(DuplicateIdError):
+            company._validate_unique_employee_id(1)
+        company._validate_unique_employee_id(2)
+
+    def test_index_switches_to_remaining_object_with_same_id(self):
+        company = Company("TechCorp")
+        dev, qa = Department("Development"), Department("QA")
+        first = Employee(1, "John", "DEV", 5000.0)
+        second = Employee(1, "John", "QA", 4000.0)
+        dev.add_employee(first)
+        qa.add_employee(second)
+        qa.add_employee(Employee(2, "Jane", "QA", 6000.0))
+        company.add_department(dev)
+        company.add_department(qa)
+        assert company.find_employee_by_id(1) is first
+
+        dev.remove_employee(1)
+        assert company.find_employee_by_id(1) is second
+        assert company.calculate_total_monthly_cost() == 10000.0
+        qa.remove_employee(1)
+        assert company.find_employee_by_id(1) is None
+        assert company.calculate_total_monthly_cost() == 6000.0
+
+    def test_lookup_and_iteration_agree_on_duplicate_ids(self):
+        company = Company("TechCorp")
+        dev, qa = Department("Development"), Department("QA")
+        company.add_department(dev)
+        company.add_department(qa)
+        first = Manager(1, "Anna", "QA", 5000.0, 500.0)
+        second = Manager(1, "Boris", "DEV", 6000.0, 600.0)
+        qa.add_employee(first)
+        dev.add_employee(second)
+
+        assert company.find_employee_by_id(1) is first
+        assert list(company.iter_all_employees()) == [first]
+        assert company.get_all_employees()[0] is first
+
+        qa.remove_employee(1)
+        assert company.find_employee_by_id(1) is second
+        assert list(company.iter_all_employees()) == [second]
+
+    def test_index_follows_id_change(self):
+        company = Company("TechCorp")
+        dev, qa = Department("Development"), Department("QA")
+        emp = Developer(1, "John", "DEV", 5000.0, ["Python"], "senior")
+        dev.add_employee(emp)
+        qa.add_employee(emp)
+        dev.add_employee(Employee(2, "Jane", "DEV", 6000.0))
+        company.add_department(dev)
+        company.add_department(qa)
+        project = Project(1, "AI", "Desc", "2030-12-31")
+        company.add_project(project)
+        company.assign_employee_to_project(1, 1)
+
+        emp.id = 5
+
+        assert company.find_employee_by_id(1) is None
+        assert company.find_employee_by_id(5) is emp
+        assert company.salary_index.get(5) is emp and 1 not in company.salary_index
+        assert 5 in company.skill_index and 1 not in company.skill_index
+        assert company.get_employee_projects(5) == [project]
+        assert company.get_employee_projects(1) == []
+        with pytest.raises(DuplicateIdError):
+            emp.id = 2
+        assert emp.id == 5
+
+        dev.remove_employee(5)
+        assert company.find_employee_by_id(5) is emp
+        qa.remove_employee(5)
+        assert company.find_employee_by_id(5) is None
+        assert company.calculate_total_monthly_cost() == 6000.0
+
+
+class TestCompanyEmployeeIteration:
+    def test_iter_all_employees_dedupes_by_id(self):
+        company = Company("TechCorp")
+        dev = Department("Development")
+        qa = Department("QA")
+        emp = Employee(1, "John", "DEV", 5000.0)
+        dev.add_employee(emp)
+        dev.add_employee(Employee(2, "Jane", "DEV", 6000.0))
+        qa.add_employee(emp)
+        company.add_department(dev)
+        company.add_department(qa)
+
+        ids = [e.id for e in company.iter_all_employees()]
+
+        assert ids == [1, 2]
+
+    def test_cached_view_invalidated_by_version(self):
+        company = Company("TechCorp")
+        dept = Department("Development")
+        company.add_department(dept)
+        dept.add_employee(Employee(1, "John", "DEV", 5000.0))
+        version = company.version
+
+        assert len(company.get_all_employees()) == 1
+
+        dept.add_employee(Employee(2, "Jane", "DEV", 6000.0))
+
+        assert company.version > version
+        assert len(company.get_all_employees()) == 2
+
+
+class TestIncrementalPayroll:
+    def test_totals_follow_salary_setters(self):
+        company = Company("TechCorp")
+        dept = Department("Development")
+        company.add_department(dept)
+        manager = Manager(1, "Alice", "DEV", 7000.0, 2000.0)
+        developer = Developer(2, "Bob", "DEV", 5000.0, ["Python"], "junior")
+        salesperson = Salesperson(3, "Charlie", "SAL", 4000.0, 0.1, 10000.0)
+        for emp in (manager, developer, salesperson):
+            dept.add_employee(emp)
+
+        manager.bonus = 3000.0
+        manager.base_salary = 8000.0
+        developer.seniority_level = "senior"
+        salesperson.sales_volume = 20000.0
+        salesperson.commission_rate = 0.2
+
+        expected = 8000.0 + 3000.0 + 10000.0 + 4000.0 + 0.2 * 20000.0
+        assert company.calculate_total_monthly_cost() == pytest.approx(expected)
+        assert dept.calculate_total_salary() == pytest.approx(expected)
+        company.verify_payroll()
+
+    def test_totals_after_remove_and_transfer(self):
+        company = Company("TechCorp")
+        dev = Department("Development")
+        qa = Department("QA")
+        emp1 = Employee(1, "John", "DEV", 5000.0)
+        emp2 = Employee(2, "Jane", "DEV", 6000.0)
+        dev.add_employee(emp1)
+        dev.add_employee(emp2)
+        company.add_department(dev)
+        company.add_department(qa)
+
+        company.transfer_employee(emp1, dev, qa)
+        assert dev.calculate_total_salary() == 6000.0
+        assert qa.calculate_total_salary() == 5000.0
+        assert company.calculate_total_monthly_cost() == 11000.0
+
+        dev.remove_employee(2)
+        assert company.calculate_total_monthly_cost() == 5000.0
+
+        emp2.base_salary = 9000.0
+        assert company.calculate_total_monthly_cost() == 5000.0
+
+    def test_debug_mode_detects_mismatch(self):
+        company = Company("TechCorp")
+        dept = Department("Development")
+        company.add_department(dept)
+        emp = Employee(1, "John", "DEV", 5000.0)
+        dept.add_employee(emp)
+        emp.detach_observer(company)
+        emp.base_salary = 6000.0
+        company.debug_payroll = True
+
+        with pytest.raises(PayrollMismatchError):
+            company.calculate_total_monthly_cost()
+
+
+class TestProjectMembershipIndex:
+    def _company(self, threshold=2):
+        company = Company("TechCorp", overload_threshold=threshold)
+        dept = Department("Development")
+        self.emp = Employee(1, "John", "DEV", 5000.0)
+        dept.add_employee(self.emp)
+        company.add_department(dept)
+        self.projects = [
+            Project(i, f"P{i}", "Desc", "2024-12-31", "planning") for i in (1, 2, 3)
+        ]
+        for proj in self.projects:
+            company.add_project(proj)
+        return company
+
+    def test_overload_follows_team_changes(self):
+        company = self._company()
+
+        company.assign_employee_to_project(1, 1)
+        assert company.find_overloaded_employees() == []
+        assert company.check_employee_availability(1) is False
+
+        company.assign_employee_to_project(1, 2)
+        assert company.find_overloaded_employees() == [self.emp]
+        assert company.get_project_load(1) == 2
+        assert company.check_employee_availability(1) is True
+
+        self.projects[0].remove_team_member(1)
+        assert company.find_overloaded_employees() == []
+        assert company.get_employee_projects(1) == [self.projects[1]]
+
+    def test_configurable_threshold(self):
+        company = self._company(threshold=3)
+        for proj in self.projects[:2]:
+            proj.add_team_member(self.emp)
+
+        assert company.find_overloaded_employees() == []
+
+        company.overload_threshold = 2
+        assert company.find_overloaded_employees() == [self.emp]
+
+
+class TestProjectRegistry:
+    def test_status_buckets_follow_status_changes(self):
+        company = Company("TechCorp")
+        p1 = Project(1, "P1", "Desc", "2024-12-31", "planning")
+        p2 = Project(2, "P2", "Desc", "2024-12-31", "active")
+        company.add_project(p1)
+        company.add_project(p2)
+
+        assert company.get_projects_by_status("planning") == [p1]
+
+        p1.change_status("active")
+        p2.status = "completed"
+
+        assert company.get_projects_by_status("planning") == []
+        assert company.get_projects_by_status("active") == [p1]
+        assert company.get_projects_by_status("completed") == [p2]
+
+    def test_project_id_change_rekeys_registry(self):
+        company = Company("TechCorp")
+        p1 = Project(1, "P1", "Desc", "2024-12-31", "planning")
+        p2 = Project(2, "P2", "Desc", "2024-12-31", "planning")
+        company.add_project(p1)
+        company.add_project(p2)
+
+        p1.project_id = 10
+        assert company._find_project(10) is p1
+        assert company._find_project(1) is None
+
+        with pytest.raises(DuplicateIdError):
+            p1.project_id = 2
+        assert p1.project_id == 10
+
+    def test_remove_project_clears_registry(self):
+        company = Company("TechCorp")
+        p1 = Project(1, "P1", "Desc", "2024-12-31", "planning")
+        company.add_project(p1)
+
+        company.remove_project(1)
+
+        assert company.get_projects() == []
+        assert company.get_projects_by_status("planning") == []
+
+
+class TestDepartmentNameIndex:
+    def test_find_department_follows_rename(self):
+        company = Company("TechCorp")
+        dept = Department("Development")
+        company.add_department(dept)
+
+        dept.name = "R&D"
+
+        assert company._find_department("R&D") is dept
+        assert company._find_department("Development") is None
+
+    def test_duplicate_names_resolve_to_first_remaining(self):
+        company = Company("TechCorp")
+        first = Department("QA")
+        second = Department("QA")
+        company.add_department(first)
+        company.add_department(second)
+
+        company.remove_department("QA")
+
+        assert company.get_departments() == [second]
+        assert company._find_department("QA") is second
+
+
+class TestBulkLoad:
+    def test_indexes_rebuilt_on_exit(self):
+        company = Company("TechCorp")
+        dev = Department("Development")
+        emp1 = Employee(1, "John", "DEV", 5000.0)
+        emp2 = Employee(2, "Jane", "DEV", 6000.0)
+        project = Project(1, "P1", "Desc", "2024-12-31", "active")
+
+        with company.bulk_load():
+            company.add_department(dev)
+            dev.add_employee(emp1)
+            dev.add_employee(emp2)
+            company.add_project(project)
+            project.add_team_member(emp1)
+
+        assert company.find_employee_by_id(2) is emp2
+        assert company.calculate_total_monthly_cost() == 11000.0
+        assert dev.calculate_total_salary() == 11000.0
+        assert company.get_projects_by_status("active") == [project]
+        assert company.get_employee_projects(1) == [project]
+
+        emp2.base_salary = 7000.0
+        assert company.calculate_total_monthly_cost() == 12000.0
+
+    def test_errors_reported_together(self):
+        company = Company("TechCorp")
+        dev = Department("Development")
+
+        with pytest.raises(BulkLoadError) as exc_info:
+            with company.bulk_load():
+                company.add_department(dev)
+                dev.add_employee(Employee(1, "John", "DEV", 5000.0))
+                dev.add_employee(Employee(1, "Copy", "DEV", 5000.0))
+                company.add_project(Project(1, "P1", "Desc", "2024-12-31"))
+                company.add_project(Project(1, "P2", "Desc", "2024-12-31"))
+
+        assert len(exc_info.value.errors) == 2
+        assert len(company.get_projects()) == 1
+        assert company.find_employee_by_id(1).name == "John"
+
+    def test_gc_restored_after_load(self):
+        import gc
+
+        company = Company("TechCorp")
+        with company.bulk_load():
+            assert not gc.isenabled()
+        assert gc.isenabled()
+
+    def test_gc_restored_when_rebuild_fails(self, monkeypatch):
+        import gc
+
+        company = Company("TechCorp")
+
+        def broken():
+            raise RuntimeError("сбой")
+
+        monkeypatch.setattr(company, "_finish_bulk", broken)
+        with pytest.raises(RuntimeError):
+            with company.bulk_load():
+                pass
+        assert gc.isenabled()
+
+
+class TestSnapshotFormat:
+    def make_company(self):
+        company = Company("TechCorp")
+        dev = Department("Development")
+        dev.add_employee(Developer(1, "John", "DEV", 5000.0, ["Python"], "senior"))
+        dev.add_employee(Manager(2, "Alice", "DEV", 7000.0, 1000.0))
+        company.add_department(dev)
+        project = Project(1, "P1", "Desc", "2030-12-31", "active")
+        company.add_project(project)
+        project.add_team_member(dev[1])
+        project.add_team_member(Employee(9, "Guest", "EXT", 3000.0))
+        project.add_team_member(dev[0])
+        return company
+
+    def test_team_stored_by_id(self):
+        data = self.make_company().to_dict()
+        project = data["projects"][0]
+
+        assert data["format_version"] == Company.FORMAT_VERSION
+        assert project["team_ids"] == [2, 9, 1]
+        assert [emp["id"] for emp in project["team"]] == [9]
+
+    def test_team_members_resolved_to_department_objects(self):
+        company = Company.from_dict(self.make_company().to_dict())
+        project = company.get_projects()[0]
+
+        assert [emp.id for emp in project.team] == [2, 9, 1]
+        assert project.team[0] is company.find_employee_by_id(2)
+        assert project.team[2] is company.find_employee_by_id(1)
+        assert company.find_employee_by_id(9) is None
+        assert company.get_employee_projects(1) == [project]
+
+    def test_legacy_format_still_readable(self):
+        source = self.make_company()
+        legacy = {
+            "name": source.name,
+            "departments": [d.to_dict() for d in source.departments],
+            "projects": [p.to_dict() for p in source.projects],
+        }
+        assert "team_ids" not in legacy["projects"][0]
+
+        company = Company.from_dict(legacy)
+        project = company.get_projects()[0]
+
+        expected = [emp.to_dict() for emp in source.get_projects()[0].team]
+        assert [emp.to_dict() for emp in project.team] == expected
+
+    def test_unknown_team_id_and_version_rejected(self):
+        data = self.make_company().to_dict()
+        data["projects"][0]["team_ids"].append(42)
+        with pytest.raises(EmployeeNotFoundError):
+            Company.from_dict(data)
+
+        data = self.make_company().to_dict()
+        data["format_version"] = Company.FORMAT_VERSION + 1
+        with pytest.raises(ValueError, match="версия формата"):
+            Company.from_dict(data)
@@ -0,0 +1,144 @@
+import pytest
+
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.core.project import Project
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
+from src.persistence import binary_snapshot
+from src.persistence.binary_snapshot import MappedCompany, write_binary_snapshot
+from src.utils.exceptions import DuplicateIdError
+
+
+def make_company():
+    company = Company("Тест")
+    dev = Department("Разработка")
+    dev.add_employee(Developer(7, "Анна", "DEV", 5000.0, ["Python", "Go"], "senior"))
+    dev.add_employee(Manager(2, "Борис", "DEV", 7000.0, 1000.0))
+    sales = Department("Sales")
+    sales.add_employee(Salesperson(3, "Вера", "SAL", 4000.0, 0.1, 20000.0))
+    sales.add_employee(Employee(5, "Глеб", "SAL", 3000))
+    company.add_department(dev)
+    company.add_department(sales)
+    company.add_department(Department("Пустой"))
+    project = Project(1, "AI", "Описание", "2030-12-31", "active", ["Python"])
+    company.add_project(project)
+    project.add_team_member(dev[0])
+    project.add_team_member(Employee(9, "Гость", "EXT", 1500.0))
+    company.add_project(Project(2, "Empty", "Без команды", "2031-01-01"))
+    return company
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    company = make_company()
+    path = str(tmp_path / "company.snap")
+    write_binary_snapshot(company, path)
+    with MappedCompany(path) as mapped:
+        yield company, mapped
+
+
+class TestMappedCompany:
+    def test_lookup_by_id(self, snapshot):
+        company, mapped = snapshot
+        assert mapped.name == "Тест"
+        assert len(mapped) == 4
+        for employee_id in (2, 3, 5, 7):
+            found = mapped.find_employee_by_id(employee_id)
+            expected = company.find_employee_by_id(employee_id)
+            assert type(found) is type(expected)
+            assert found.to_dict() == expected.to_dict()
+            assert employee_id in mapped
+        # Участник проекта вне отделов не считается сотрудником компании
+        assert mapped.find_employee_by_id(9) is None
+        assert mapped.employee_record(4) is None
+        assert 100 not in mapped
+
+    def test_column_scans(self, snapshot):
+        company, mapped = snapshot
+        assert list(mapped.column("ids")) == [2, 3, 5, 7, 9]
+        assert list(mapped.column("in_company")) == [1, 1, 1, 1, 0]
+        assert mapped.calculate_total_monthly_cost() == pytest.approx(
+            company.calculate_total_monthly_cost()
+        )
+        assert mapped.department_totals() == pytest.approx(
+            {d.name: d.calculate_total_salary() for d in company.departments}
+        )
+        with pytest.raises(ValueError):
+            mapped.column("name")
+
+    def test_scans_without_numpy(self, snapshot, monkeypatch):
+        company, mapped = snapshot
+        monkeypatch.setattr(binary_snapshot, "np", None)
+        assert mapped.calculate_total_monthly_cost() == pytest.approx(
+            company.calculate_total_monthly_cost()
+        )
+        assert mapped.department_totals()["Sales"] == pytest.approx(9000.0)
+
+    def test_groups(self, snapshot):
+        _, mapped = snapshot
+        assert mapped.departments == ["Разработка", "Sales", "Пустой"]
+        assert mapped.department_employee_ids("Разработка") == [7, 2]
+        assert mapped.department_employee_ids("Пустой") == []
+        assert mapped.project_team_ids(1) == [7, 9]
+        assert mapped.project_team_ids(2) == []
+        assert mapped.project_team_ids(3) is None
+
+    def test_to_company_round_trip(self, snapshot):
+        company, mapped = snapshot
+        loaded = mapped.to_company()
+        assert loaded.to_dict() == company.to_dict()
+        project = loaded.get_projects()[0]
+        assert project.team[0] is loaded.find_employee_by_id(7)
+
+
+class TestSnapshotFile:
+    def test_rejects_foreign_and_truncated_files(self, tmp_path):
+        path = tmp_path / "other.snap"
+        path.write_bytes(b"not a snapshot at all" * 4)
+        with pytest.raises(ValueError, match="не является"):
+            MappedCompany(str(path))
+
+        write_binary_snapshot(make_company(), str(path))
+        path.write_bytes(path.read_bytes()[:-10])
+        with pytest.raises(ValueError, match="обрезан"):
+            MappedCompany(str(path))
+
+    def test_unsupported_employee_class(self, tmp_path):
+        class Intern(Employee):
+            __slots__ = ()
+
+        company = Company("Тест")
+        department = Department("Стажеры")
+        department.add_employee(Intern(1, "Дина", "INT", 1000.0))
+        company.add_department(department)
+        with pytest.raises(ValueError, match="Intern"):
+            write_binary_snapshot(company, str(tmp_path / "company.snap"))
+
+    def test_duplicate_ids_across_departments(self, tmp_path):
+        company = Company("Тест")
+        first, second = Department("A"), Department("B")
+        first.add_employee(Manager(1, "Олег", "A", 5000.0, 500.0))
+        second.add_employee(Manager(1, "Петр", "B", 6000.0, 600.0))
+        company.add_department(first)
+        company.add_department(second)
+        path = tmp_path / "company.snap"
+        with pytest.raises(DuplicateIdError, match="ID 1"):
+            write_binary_snapshot(company, str(path))
+        assert not path.exists()
+
+    def test_shared_employee_in_two_departments(self, tmp_path):
+        company = Company("Тест")
+        shared = Manager(1, "Олег", "A", 5000.0, 500.0)
+        first, second = Department("A"), Department("B")
+        first.add_employee(shared)
+        second.add_employee(shared)
+        company.add_department(first)
+        company.add_department(second)
+        path = str(tmp_path / "company.snap")
+        write_binary_snapshot(company, path)
+        with MappedCompany(path) as mapped:
+            assert len(mapped) == 1
+            assert mapped.department_totals() == {"A": 5500.0, "B": 5500.0}
@@ -0,0 +1,216 @@
+import json
+import time
+
+import pytest
+
+from src.core.company import Company
+from src.core.department import Department
+from src.core.project import Project
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.persistence.event_log import EventLog
+from src.persistence.journal import CompanyStore, apply_event
+from src.utils.exceptions import EventLogError
+
+
+def make_project(project_id, status="planning"):
+    return Project(project_id, f"P{project_id}", "Desc", "2030-12-31", status)
+
+
+class TestEventLog:
+    def test_append_and_read(self, tmp_path):
+        path = str(tmp_path / "events.log")
+        with EventLog(path, sync_every=2) as log:
+            assert log.append("hire", employee_id=1) == 1
+            assert log.append("remove", employee_id=1) == 2
+        events = list(EventLog.read(path))
+        assert [e["seq"] for e in events] == [1, 2]
+        assert events[0] == {"seq": 1, "type": "hire", "employee_id": 1}
+        assert [e["seq"] for e in EventLog.read(path, after_seq=1)] == [2]
+
+    def test_torn_tail_is_dropped(self, tmp_path):
+        path = tmp_path / "events.log"
+        with EventLog(str(path)) as log:
+            log.append("hire", employee_id=1)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"seq":2,"type":"hi')
+        assert [e["seq"] for e in EventLog.read(str(path))] == [1]
+        with EventLog(str(path)) as log:
+            assert log.last_seq == 1
+            assert log.append("hire", employee_id=2) == 2
+        assert [e["seq"] for e in EventLog.read(str(path))] == [1, 2]
+
+    def test_corrupt_line_raises(self, tmp_path):
+        path = tmp_path / "events.log"
+        path.write_text('{"seq":1,"type":"hire"}\nnot json\n', encoding="utf-8")
+        with pytest.raises(EventLogError):
+            list(EventLog.read(str(path)))
+
+    def test_corrupt_middle_line_rejected_on_open(self, tmp_path):
+        path = tmp_path / "events.log"
+        text = '{"seq":1,"type":"hire"}\nnot json\n{"seq":3,"type":"hire"}\n'
+        path.write_text(text, encoding="utf-8")
+        with pytest.raises(EventLogError, match=":2"):
+            EventLog(str(path))
+        assert path.read_text(encoding="utf-8") == text
+
+    def test_last_batch_synced_without_close(self, tmp_path):
+        path = tmp_path / "events.log"
+        log = EventLog(str(path), sync_every=100, sync_interval=0.05)
+        try:
+            log.append("hire", employee_id=1)
+            # Строка сразу видна в файле, fsync выполняет таймер
+            assert [e["seq"] for e in EventLog.read(str(path))] == [1]
+            deadline = time.monotonic() + 5.0
+            while log.pending and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert log.pending == 0
+        finally:
+            log.close()
+
+    def test_reset_keeps_numbering(self, tmp_path):
+        path = str(tmp_path / "events.log")
+        with EventLog(path) as log:
+            log.append("hire")
+            log.append("hire")
+            log.reset()
+            assert list(EventLog.read(path)) == []
+            assert log.append("hire") == 3
+
+    def test_validation(self, tmp_path):
+        with pytest.raises(ValueError):
+            EventLog(str(tmp_path / "events.log"), sync_every=0)
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    return str(tmp_path / "store")
+
+
+def populate(company):
+    dev = Department("DEV")
+    dev.add_employee(Developer(1, "Alice", "DEV", 5000.0, ["Python"], "junior"))
+    company.add_department(dev)
+    company.add_department(Department("OPS"))
+    dev.add_employee(Manager(2, "Bob", "DEV", 7000.0, 1000.0))
+    project = make_project(10)
+    company.add_project(project)
+    project.add_team_member(company.find_employee_by_id(1))
+    project.status = "active"
+    company.find_employee_by_id(1).base_salary = 5500.0
+    company.find_employee_by_id(1).add_skill("Go")
+    company.find_employee_by_id(2).bonus = 1500.0
+    company.transfer_employee(
+        company.find_employee_by_id(2), dev, company._find_department("OPS")
+    )
+
+
+class TestCompanyStore:
+    def test_replay_restores_state(self, store_dir):
+        with CompanyStore(store_dir, "TechCorp") as store:
+            populate(store.company)
+            expected = store.company.to_dict()
+            assert store.last_seq > 0
+        with CompanyStore(store_dir) as store:
+            assert store.company.to_dict() == expected
+            assert store.company.find_employee_by_id(2).department == "DEV"
+            project = store.company._find_project(10)
+            assert project.team[0] is store.company.find_employee_by_id(1)
+
+    def test_replay_id_change(self, store_dir):
+        with CompanyStore(store_dir, "TechCorp") as store:
+            populate(store.company)
+            store.company.find_employee_by_id(1).id = 3
+            expected = store.company.to_dict()
+        with CompanyStore(store_dir) as store:
+            assert store.company.to_dict() == expected
+            assert store.company.find_employee_by_id(1) is None
+            assert store.company.get_employee_projects(3)[0].project_id == 10
+
+    def test_fired_employee_edits_not_logged(self, store_dir):
+        with CompanyStore(store_dir, "TechCorp") as store:
+            populate(store.company)
+            project = store.company._find_project(10)
+            alice = store.company.find_employee_by_id(1)
+            project.remove_team_member(1)
+            store.company._find_department("DEV").remove_employee(1)
+            seq = store.last_seq
+            alice.base_salary = 9000.0
+            alice.id = 99
+            assert store.last_seq == seq
+            expected = store.company.to_dict()
+        with CompanyStore(store_dir) as store:
+            assert store.company.to_dict() == expected
+            assert store.company.find_employee_by_id(1) is None
+
+    def test_compaction_waits_for_mutation_to_finish(self, store_dir):
+        with CompanyStore(store_dir, "TechCorp", compact_every=1) as store:
+            populate(store.company)
+            store.company.find_employee_by_id(1).id = 7
+            assert store.compact_due
+            assert store.compact_if_due()
+            with open(f"{store_dir}/snapshot.json", encoding="utf-8") as f:
+                project = json.load(f)["company"]["projects"][0]
+            assert project["team_ids"] == [7]
+            assert project["team"] == []
+            store.company.find_employee_by_id(7).id = 8
+            expected = store.company.to_dict()
+        with CompanyStore(store_dir) as store:
+            assert store.company.to_dict() == expected
+            project = store.company._find_project(10)
+            assert project.team[0] is store.company.find_employee_by_id(8)
+
+    def test_new_store_requires_name(self, store_dir):
+        with pytest.raises(ValueError):
+            CompanyStore(store_dir)
+
+    def test_compaction_folds_log_into_snapshot(self, store_dir):
+        with CompanyStore(store_dir, "TechCorp", compact_every=5) as store:
+            populate(store.company)
+            seq = store.last_seq
+            expected = store.company.to_dict()
+        with open(f"{store_dir}/snapshot.json", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        assert 0 < snapshot["last_seq"] <= seq
+        assert all(
+            e["seq"] > snapshot["last_seq"]
+            for e in EventLog.read(f"{store_dir}/events.log")
+        )
+        with CompanyStore(store_dir) as store:
+            assert store.company.to_dict() == expected
+            assert store.last_seq == seq
+            store.company.find_employee_by_id(1).base_salary = 6000.0
+            assert store.last_seq == seq + 1
+
+    def test_manual_compact_and_continue(self, store_dir):
+        with CompanyStore(store_dir, "TechCorp") as store:
+            populate(store.company)
+            store.compact()
+            assert list(EventLog.read(f"{store_dir}/events.log")) == []
+            project = store.company._find_project(10)
+            project.remove_team_member(1)
+            store.company.remove_project(10)
+            expected = store.company.to_dict()
+        with CompanyStore(store_dir) as store:
+            assert store.company.to_dict() == expected
+
+    def test_bulk_load_is_snapshotted(self, store_dir):
+        with CompanyStore(store_dir, "TechCorp") as store:
+            company = store.company
+            with company.bulk_load():
+                dept = Department("DEV")
+                dept.add_employee(Developer(1, "A", "DEV", 1000.0, ["C"], "junior"))
+                company.add_department(dept)
+            assert list(EventLog.read(f"{store_dir}/events.log")) == []
+            company.find_employee_by_id(1).base_salary = 2000.0
+        with CompanyStore(store_dir) as store:
+            assert store.company.find_employee_by_id(1).base_salary == 2000.0
+
+
+class TestApplyEvent:
+    def test_unknown_reference_raises(self):
+        company = Company("TechCorp")
+        with pytest.raises(EventLogError):
+            apply_event(company, {"seq": 1, "type": "status", "project_id": 1})
+        with pytest.raises(EventLogError):
+            apply_event(company, {"seq": 2, "type": "explode"})
@@ -0,0 +1,215 @@
+import io
+import json
+import os
+
+import pytest
+
+from src.core.company import Company
+from src.core.department import Department
+from src.core.project import Project
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
+from src.persistence.streaming import (
+    JsonStreamReader,
+    JsonStreamWriter,
+    LazyArray,
+    LazyObject,
+    company_document,
+    write_json_file,
+)
+
+
+def make_company():
+    company = Company("Тест")
+    dev = Department("Разработка")
+    dev.add_employee(Developer(1, "Анна", "DEV", 5000.0, ["Python", "Go"], "senior"))
+    dev.add_employee(Manager(2, "Борис", "DEV", 7000.0, 1000.0))
+    sales = Department("Sales")
+    sales.add_employee(Salesperson(3, "Вера", "SAL", 4000.0, 0.1, 20000.0))
+    company.add_department(dev)
+    company.add_department(sales)
+    company.add_department(Department("Пустой"))
+    project = Project(1, "AI", 'Описание "в кавычках"\nи строкой', "2030-12-31")
+    project.required_skills = ["Python"]
+    project.add_team_member(dev[0])
+    company.add_project(project)
+    company.add_project(Project(2, "Empty", "Без команды", "2031-01-01"))
+    return company
+
+
+def dump(document, indent=None) -> str:
+    stream = io.StringIO()
+    JsonStreamWriter(stream, indent).write(document)
+    return stream.getvalue()
+
+
+class TestJsonStreamWriter:
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_matches_json_dump(self, indent):
+        company = make_company()
+        separators = (",", ":") if indent is None else None
+        expected = json.dumps(
+            company.to_dict(), ensure_ascii=False, indent=indent, separators=separators
+        )
+        assert dump(company_document(company), indent) == expected
+
+    def test_empty_containers(self):
+        document = LazyObject([("a", LazyArray([])), ("b", LazyObject([]))])
+        assert dump(document, 2) == '{\n  "a": [],\n  "b": {}\n}'
+        assert dump(LazyArray(iter([1, [2]]))) == "[1,[2]]"
+
+    def test_items_are_produced_lazily(self):
+        produced = []
+
+        def items():
+            for i in range(3):
+                produced.append(i)
+                yield {"i": i}
+
+        stream = io.StringIO()
+        JsonStreamWriter(stream).write(LazyArray(items()))
+        assert produced == [0, 1, 2]
+        assert json.loads(stream.getvalue()) == [{"i": 0}, {"i": 1}, {"i": 2}]
+
+
+class TestStreamingSave:
+    def test_save_and_load_roundtrip(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        company = make_company()
+        company.save_to_file("streamed.json", streaming=True)
+        company.save_to_file("plain.json")
+        streamed = (tmp_path / "data/json/streamed.json").read_text(encoding="utf-8")
+        plain = (tmp_path / "data/json/plain.json").read_text(encoding="utf-8")
+        assert streamed == plain
+        loaded = Company.load_from_file("streamed.json")
+        assert loaded.to_dict() == company.to_dict()
+
+    def test_compact_save(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        company = make_company()
+        company.save_to_file("compact.json", streaming=True, compact=True)
+        company.save_to_file("compact_plain.json", compact=True)
+        text = (tmp_path / "data/json/compact.json").read_text(encoding="utf-8")
+        assert "\n" not in text
+        assert text == (tmp_path / "data/json/compact_plain.json").read_text(
+            encoding="utf-8"
+        )
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        path = str(tmp_path / "company.json")
+        write_json_file(path, {"version": 1})
+
+        def broken():
+            yield 1
+            raise RuntimeError("сбой")
+
+        with pytest.raises(RuntimeError):
+            write_json_file(path, LazyObject([("items", LazyArray(broken()))]))
+        assert json.loads(open(path, encoding="utf-8").read()) == {"version": 1}
+        assert not os.path.exists(path + ".tmp")
+
+
+def read_all(reader):
+    """Собирает значение целиком через iter_object/iter_array"""
+    char = reader._peek()
+    if char == "{":
+        return {key: read_all(reader) for key in reader.iter_object()}
+    if char == "[":
+        return [read_all(reader) for _ in reader.iter_array()]
+    return reader.value()
+
+
+class TestJsonStreamReader:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64])
+    def test_reads_across_chunk_boundaries(self, chunk_size):
+        document = {
+            "name": "Тест ё",
+            "numbers": [12345, -0.5, 1e10, True, None],
+            "nested": {"empty": [], "obj": {}, "text": "a,b:{c}"},
+        }
+        text = json.dumps(document, ensure_ascii=False, indent=2)
+        reader = JsonStreamReader(io.BytesIO(text.encode("utf-8")), chunk_size)
+        assert read_all(reader) == document
+        reader.finish()
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 64])
+    def test_iter_values(self, chunk_size):
+        items = [{"id": 1, "tags": ["a", "b"]}, 12.5, "x", [], {"id": 2}]
+        for text in [json.dumps(items), json.dumps(items, indent=2), "[ ]"]:
+            reader = JsonStreamReader(io.BytesIO(text.encode("utf-8")), chunk_size)
+            expected = json.loads(text)
+            assert list(reader.iter_values()) == expected
+            reader.finish()
+
+    def test_progress_is_reported(self):
+        data = json.dumps({"items": list(range(1000))}).encode("utf-8")
+        progress = []
+        reader = JsonStreamReader(
+            io.BytesIO(data),
+            chunk_size=256,
+            on_progress=lambda done, total: progress.append((done, total)),
+            total=len(data),
+        )
+        read_all(reader)
+        assert progress[-1] == (len(data), len(data))
+        assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+        assert len(progress) == -(-len(data) // 256)
+
+    @pytest.mark.parametrize("text", ['{"a" 1}', '{"a": 1', "[1 2]", "{1: 2}"])
+    def test_malformed_input_raises(self, text):
+        reader = JsonStreamReader(io.BytesIO(text.encode("utf-8")), chunk_size=2)
+        with pytest.raises(json.JSONDecodeError):
+            read_all(reader)
+
+    def test_extra_data_raises(self):
+        reader = JsonStreamReader(io.BytesIO(b"[1] [2]"))
+        read_all(reader)
+        with pytest.raises(json.JSONDecodeError):
+            reader.finish()
+
+
+class TestStreamingLoad:
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_load_matches_regular_loader(self, tmp_path, monkeypatch, compact):
+        monkeypatch.chdir(tmp_path)
+        company = make_company()
+        company.save_to_file("company.json", streaming=True, compact=compact)
+        progress = []
+        loaded = Company.load_from_file(
+            "company.json",
+            streaming=True,
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+        assert loaded.to_dict() == Company.load_from_file("company.json").to_dict()
+        size = (tmp_path / "data/json/company.json").stat().st_size
+        assert progress[-1] == (size, size)
+
+    def test_from_stream_small_chunks(self):
+        company = make_company()
+        data = json.dumps(company.to_dict(), ensure_ascii=False).encode("utf-8")
+        loaded = Company.from_stream(JsonStreamReader(io.BytesIO(data), chunk_size=7))
+        assert loaded.to_dict() == company.to_dict()
+
+    def test_broken_file_raises_value_error(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        make_company().save_to_file("broken.json", streaming=True)
+        path = tmp_path / "data/json/broken.json"
+        path.write_text(path.read_text(encoding="utf-8")[:-40], encoding="utf-8")
+        with pytest.raises(ValueError, match="Ошибка при чтении файла"):
+            Company.load_from_file("broken.json", streaming=True)
+
+    def test_team_references_resolved(self):
+        company = make_company()
+        text = json.dumps(company.to_dict(), ensure_ascii=False)
+        loaded = Company.from_stream(JsonStreamReader(io.BytesIO(text.encode())))
+        assert loaded.get_projects()[0].team[0] is loaded.find_employee_by_id(1)
+
+        legacy = company.to_dict()
+        del legacy["format_version"]
+        legacy["projects"] = [p.to_dict() for p in company.projects]
+        text = json.dumps(legacy, ensure_ascii=False)
+        loaded = Company.from_stream(JsonStreamReader(io.BytesIO(text.encode())))
+        member = loaded.get_projects()[0].team[0]
+        assert member.to_dict() == loaded.find_employee_by_id(1).to_dict()
+        assert member is not loaded.find_employee_by_id(1)
@@ -0,0 +1,85 @@
+import pytest
+
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.core.project import Project
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.utils.aggregation import AggregateStats, group_aggregate
+
+
+@pytest.fixture
+def employees():
+    return [
+        Employee(1, "Base", "IT", 4000.0),
+        Manager(2, "Manager", "IT", 5000.0, 1000.0),
+        Developer(3, "Junior", "DEV", 3000.0, ["Python"], "junior"),
+        Developer(4, "Senior", "DEV", 5000.0, ["Python"], "senior"),
+    ]
+
+
+class TestGroupAggregate:
+    def test_group_by_attribute(self, employees):
+        groups = group_aggregate(employees, "department")
+
+        assert list(groups) == ["IT", "DEV"]
+        assert groups["IT"].to_dict() == {
+            "count": 2,
+            "sum": 10000.0,
+            "min": 4000.0,
+            "max": 6000.0,
+            "mean": 5000.0,
+        }
+        assert groups["DEV"].total == 13000.0
+
+    def test_group_by_several_fields(self, employees):
+        groups = group_aggregate(employees, ["type", "seniority"])
+
+        assert groups[("Developer", "senior")].max == 10000.0
+        assert groups[("Employee", None)].count == 1
+
+    def test_count_only(self, employees):
+        groups = group_aggregate(employees, "type", value=None)
+
+        assert {k: s.count for k, s in groups.items()} == {
+            "Employee": 1,
+            "Manager": 1,
+            "Developer": 2,
+        }
+        assert groups["Developer"].mean is None
+
+    def test_mean_skips_missing_values(self):
+        stats = AggregateStats()
+        stats.add(100.0)
+        stats.add(None)
+
+        assert stats.count == 2
+        assert stats.values == 1
+        assert stats.mean == 100.0
+
+
+class TestCompanyStatsOnAggregation:
+    def test_department_stats_and_budget_analysis(self, employees):
+        company = Company("TechCorp")
+        dept = Department("Development")
+        for emp in employees:
+            dept.add_employee(emp)
+        company.add_department(dept)
+        active = Project(1, "P1", "Desc", "2024-12-31", "active")
+        planning = Project(2, "P2", "Desc", "2024-12-31", "planning")
+        company.add_project(active)
+        company.add_project(planning)
+        active.add_team_member(employees[3])
+        planning.add_team_member(employees[0])
+
+        stats = company.get_department_stats()["Development"]
+        analysis = company.get_project_budget_analysis()
+
+        assert stats["employee_count"] == 4
+        assert stats["employee_types"] == {"Employee": 1, "Manager": 1, "Developer": 2}
+        assert stats["total_salary"] == 23000.0
+        assert analysis["total_budget"] == 14000.0
+        assert analysis["total_projects"] == 2
+        assert analysis["budget_by_status"]["active"]["sum"] == 10000.0
+        assert company.aggregate_employees("seniority")["senior"].count == 1
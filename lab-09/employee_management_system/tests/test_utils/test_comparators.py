@@ -0,0 +1,121 @@
+from functools import cmp_to_key
+
+import pytest
+
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.utils.comparators import (
+    cmp_department_and_name,
+    cmp_name,
+    cmp_salary,
+    key_department_and_name,
+    key_name,
+    key_salary_desc,
+    sort_employees,
+)
+
+
+@pytest.fixture
+def employees():
+    return [
+        Employee(1, "Charlie", "IT", 5000.0),
+        Manager(2, "Alice", "Sales", 4000.0, 1000.0),
+        Developer(3, "Bob", "IT", 3000.0, ["Python"], "senior"),
+        Employee(4, "Alice", "IT", 5000.0),
+        Developer(5, "Dave", "Sales", 2500.0, ["Go"], "middle"),
+    ]
+
+
+class TestKeyFunctions:
+    @pytest.mark.parametrize(
+        "cmp, key",
+        [
+            (cmp_name, key_name),
+            (cmp_salary, key_salary_desc),
+            (cmp_department_and_name, key_department_and_name),
+        ],
+    )
+    def test_keys_match_comparators(self, employees, cmp, key):
+        assert sorted(employees, key=key) == sorted(employees, key=cmp_to_key(cmp))
+
+    def test_sort_employees_matches_comparators(self, employees):
+        assert sort_employees(employees, "-salary") == sorted(
+            employees, key=cmp_to_key(cmp_salary)
+        )
+        assert sort_employees(employees, ["department", "name"]) == sorted(
+            employees, key=cmp_to_key(cmp_department_and_name)
+        )
+
+
+class TestSortEmployees:
+    def test_multi_key_sort_is_stable(self, employees):
+        result = sort_employees(employees, ["department", "-salary", "name"])
+
+        assert [e.id for e in result] == [3, 4, 1, 2, 5]
+
+    def test_salary_computed_once_per_employee(self, employees, monkeypatch):
+        calls = []
+        original = Employee.calculate_salary
+
+        def counting(self):
+            calls.append(self.id)
+            return original(self)
+
+        monkeypatch.setattr(Employee, "calculate_salary", counting)
+        sort_employees([employees[0], employees[3]], ["-salary", "name"])
+
+        assert sorted(calls) == [1, 4]
+
+    def test_missing_values_sort_last(self, employees):
+        result = sort_employees(employees, ["seniority", "id"])
+
+        assert [e.id for e in result] == [5, 3, 1, 2, 4]
+
+    def test_missing_values_sort_last_descending(self, employees):
+        result = sort_employees(employees, ["-seniority", "id"])
+
+        assert [e.id for e in result] == [3, 5, 1, 2, 4]
+
+    def test_empty_fields_rejected(self, employees):
+        with pytest.raises(ValueError):
+            sort_employees(employees, [])
+
+    def test_company_sorted_employees(self, employees):
+        company = Company("TechCorp")
+        dept = Department("Development")
+        for emp in employees:
+            dept.add_employee(emp)
+        company.add_department(dept)
+
+        result = company.sorted_employees(by=["-salary", "id"])
+
+        assert [e.id for e in result] == [3, 1, 2, 4, 5]
+
+    def test_company_sort_keys_cached_until_change(self, employees, monkeypatch):
+        company = Company("TechCorp")
+        dept = Department("Development")
+        for emp in employees:
+            dept.add_employee(emp)
+        company.add_department(dept)
+        calls = []
+        original = Employee.calculate_salary
+
+        def counting(self):
+            calls.append(self.id)
+            return original(self)
+
+        monkeypatch.setattr(Employee, "calculate_salary", counting)
+        company.sorted_employees(by=["-salary", "id"])
+        company.sorted_employees(by=["salary", "name"])
+        first_pass = len(calls)
+        result = company.sorted_employees(by=["-salary", "id"])
+
+        assert sorted(calls) == [1, 4]
+        assert len(calls) == first_pass
+        assert [e.id for e in result] == [3, 1, 2, 4, 5]
+
+        company.find_employee_by_id(5).base_salary = 10000.0
+        assert [e.id for e in company.sorted_employees(by="-salary")][0] == 5
@@ -0,0 +1,165 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.core.project import Project
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.utils.history import VersionHistory, to_timestamp
+
+
+class FakeClock:
+    def __init__(self, start=100.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+class TestVersionHistory:
+    def test_at_uses_latest_version_not_after_moment(self):
+        history = VersionHistory()
+        history.record(10.0, "a")
+        history.record(20.0, "b")
+        assert history.at(5.0) is None
+        assert history.at(10.0) == "a"
+        assert history.at(19.9) == "a"
+        assert history.at(25.0) == "b"
+
+    def test_same_value_and_same_moment(self):
+        history = VersionHistory()
+        history.record(10.0, "a")
+        history.record(11.0, "a")
+        assert len(history) == 1
+        history.record(12.0, "b")
+        history.record(12.0, "c")
+        assert len(history) == 2
+        assert history.at(12.0) == "c"
+        history.record(12.0, "a")
+        assert len(history) == 1
+
+    def test_to_timestamp(self):
+        moment = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        assert to_timestamp(moment) == moment.timestamp()
+        assert to_timestamp(5) == 5.0
+        with pytest.raises(ValueError):
+            to_timestamp("2026-03-01")
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def company(clock):
+    company = Company("TechCorp")
+    qa = Department("QA")
+    qa.add_employee(Employee(1, "Alice", "QA", 3000.0))
+    qa.add_employee(Manager(2, "Bob", "QA", 5000.0, 1000.0))
+    dev = Department("DEV")
+    dev.add_employee(Developer(3, "Carol", "DEV", 4000.0, ["Python"], "junior"))
+    company.add_department(qa)
+    company.add_department(dev)
+    company.enable_history(clock)
+    return company
+
+
+class TestCompanyAsOf:
+    def test_requires_history(self):
+        with pytest.raises(ValueError):
+            Company("X").calculate_total_monthly_cost(as_of=1.0)
+
+    def test_total_and_stats_as_of(self, company, clock):
+        clock.now = 200.0
+        company.find_employee_by_id(1).base_salary = 3500.0
+        clock.now = 300.0
+        company.find_employee_by_id(2).bonus = 2000.0
+        clock.now = 400.0
+        company._find_department("QA").remove_employee(1)
+
+        assert company.calculate_total_monthly_cost(as_of=50.0) == 0.0
+        assert company.calculate_total_monthly_cost(as_of=150.0) == 13000.0
+        assert company.calculate_total_monthly_cost(as_of=250.0) == 13500.0
+        assert company.calculate_total_monthly_cost(as_of=350.0) == 14500.0
+        assert company.calculate_total_monthly_cost(as_of=450.0) == 11000.0
+        assert company.calculate_total_monthly_cost() == 11000.0
+
+        qa = company.get_department_stats(as_of=250.0)["QA"]
+        assert qa == {
+            "employee_count": 2,
+            "employee_types": {"Employee": 1, "Manager": 1},
+            "total_salary": 9500.0,
+        }
+        assert company.get_department_stats(as_of=450.0)["QA"]["employee_count"] == 1
+
+    def test_employee_lookup_as_of(self, company, clock):
+        clock.now = 200.0
+        carol = company.find_employee_by_id(3)
+        carol.seniority_level = "senior"
+        carol.add_skill("Go")
+
+        past = company.find_employee_by_id(3, as_of=150.0)
+        assert past is not carol
+        assert past.seniority_level == "junior"
+        assert past.tech_stack == ["Python"]
+        assert company.find_employee_by_id(3, as_of=250.0).tech_stack == [
+            "Python",
+            "Go",
+        ]
+        assert company.find_employee_by_id(3, as_of=50.0) is None
+        assert len(company.get_all_employees(as_of=150.0)) == 3
+
+    def test_transfer_and_rename(self, company, clock):
+        clock.now = 200.0
+        company.transfer_employee(
+            company.find_employee_by_id(1),
+            company._find_department("QA"),
+            company._find_department("DEV"),
+        )
+        clock.now = 300.0
+        company._find_department("DEV").name = "ENG"
+
+        history = company.history
+        assert history.departments_of(1, 150.0) == ("QA",)
+        assert history.departments_of(1, 250.0) == ("DEV",)
+        assert history.departments_of(1, 350.0) == ("ENG",)
+        assert set(company.get_department_stats(as_of=350.0)) == {"QA", "ENG"}
+
+    def test_id_change(self, company, clock):
+        clock.now = 200.0
+        company.find_employee_by_id(1).id = 7
+
+        assert company.find_employee_by_id(1, as_of=150.0).name == "Alice"
+        assert company.find_employee_by_id(1, as_of=250.0) is None
+        assert company.find_employee_by_id(7, as_of=250.0).name == "Alice"
+        assert company.calculate_total_monthly_cost(as_of=250.0) == 13000.0
+
+    def test_project_team_history(self, company, clock):
+        project = Project(10, "P", "Desc", "2030-12-31", "active")
+        clock.now = 200.0
+        company.add_project(project)
+        clock.now = 300.0
+        project.add_team_member(company.find_employee_by_id(3))
+        clock.now = 400.0
+        project.remove_team_member(3)
+        company.remove_project(10)
+
+        history = company.history
+        assert history.team(10, 150.0) is None
+        assert history.team(10, 250.0) == ()
+        assert history.team(10, 350.0) == (3,)
+        assert history.team(10, 450.0) is None
+
+    def test_bulk_load_is_captured(self, company, clock):
+        clock.now = 200.0
+        with company.bulk_load():
+            ops = Department("OPS")
+            ops.add_employee(Employee(4, "Dan", "OPS", 1000.0))
+            company.add_department(ops)
+        assert company.find_employee_by_id(4, as_of=150.0) is None
+        assert company.find_employee_by_id(4, as_of=200.0).name == "Dan"
+        assert company.calculate_total_monthly_cost(as_of=200.0) == 14000.0
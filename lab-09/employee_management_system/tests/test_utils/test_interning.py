@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from src.core.company import Company
+from src.core.department import Department
+from src.core.project import Project
+from src.employees.developer import Developer
+from src.factories.employee_factory import DeveloperFactory
+from src.patterns.builder import EmployeeBuilder
+from src.utils.interning import STRING_POOL, StringPool, intern_employee_data
+
+
+def fresh(value: str) -> str:
+    """Равная, но отдельная копия строки"""
+    return "".join(list(value))
+
+
+class TestStringPool:
+    def test_intern_returns_shared_instance(self):
+        pool = StringPool()
+        first = fresh("Development")
+        second = fresh("Development")
+        assert first is not second
+        assert pool.intern(first) is first
+        assert pool.intern(second) is first
+        assert len(pool) == 1
+        stats = pool.stats()
+        assert stats["unique"] == 1
+        assert stats["hits"] == 1
+        assert stats["saved_bytes"] > 0
+
+    def test_non_strings_pass_through(self):
+        pool = StringPool()
+        assert pool.intern(5) == 5
+        assert pool.intern_list("Python") == "Python"
+        assert len(pool) == 0
+
+    def test_disabled_and_clear(self):
+        pool = StringPool()
+        pool.enabled = False
+        value = fresh("QA")
+        assert pool.intern(value) is value
+        assert len(pool) == 0
+        pool.enabled = True
+        pool.intern(value)
+        pool.clear()
+        assert len(pool) == 0
+        assert pool.stats()["hits"] == 0
+
+    def test_intern_employee_data(self):
+        pool = StringPool()
+        shared = pool.intern(fresh("Python"))
+        data = {
+            "department": fresh("DEV"),
+            "seniority_level": fresh("junior"),
+            "tech_stack": [fresh("Python")],
+            "name": fresh("Alice"),
+        }
+        assert intern_employee_data(data, pool) is data
+        assert data["tech_stack"][0] is shared
+        assert "DEV" in pool and "junior" in pool
+        assert "Alice" not in pool
+
+
+@pytest.fixture
+def pool():
+    STRING_POOL.clear()
+    yield STRING_POOL
+    STRING_POOL.clear()
+
+
+class TestInterningUsage:
+    def test_deserialized_company_shares_strings(self, pool):
+        company = Company("TechCorp")
+        dept = Department("DEV")
+        for emp_id in (1, 2):
+            dept.add_employee(
+                Developer(emp_id, "A", fresh("DEV"), 1000.0, [fresh("Go")], "junior")
+            )
+        company.add_department(dept)
+        company.add_project(
+            Project(1, "P", "Desc", "2030-12-31", "active", [fresh("Go")])
+        )
+        loaded = Company.from_dict(json.loads(json.dumps(company.to_dict())))
+        first, second = loaded.get_all_employees()
+        assert first.department is second.department
+        assert first.tech_stack[0] is second.tech_stack[0]
+        assert loaded.projects[0].required_skills[0] is first.tech_stack[0]
+
+    def test_factory_and_builder_share_strings(self, pool):
+        from_factory = DeveloperFactory.create_employee(
+            id=1,
+            name="A",
+            department=fresh("DEV"),
+            base_salary=1000.0,
+            tech_stack=[fresh("Go")],
+            seniority_level="junior",
+        )
+        from_builder = (
+            EmployeeBuilder()
+            .set_type("developer")
+            .set_id(2)
+            .set_name("B")
+            .set_department(fresh("DEV"))
+            .set_base_salary(1000.0)
+            .set_tech_stack([fresh("Go")])
+            .build()
+        )
+        assert from_factory.department is from_builder.department
+        assert from_factory.tech_stack[0] is from_builder.tech_stack[0]
@@ -0,0 +1,125 @@
+import random
+
+import pytest
+
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.core.project import Project
+from src.employees.manager import Manager
+from src.utils.salary_index import SalaryIndex
+
+
+@pytest.fixture
+def employees():
+    return [
+        Employee(1, "Alice", "IT", 5000.0),
+        Employee(2, "Bob", "IT", 3000.0),
+        Manager(3, "Carol", "IT", 4000.0, 2000.0),
+        Employee(4, "Dave", "IT", 3000.0),
+        Employee(5, "Eve", "IT", 8000.0),
+    ]
+
+
+@pytest.fixture
+def small_buckets(monkeypatch):
+    monkeypatch.setattr(SalaryIndex, "LOAD", 2)
+
+
+class TestSalaryIndexQueries:
+    def test_top_and_bottom_k(self, employees):
+        index = SalaryIndex(employees)
+
+        assert [e.id for e in index.top_k(3)] == [5, 3, 1]
+        assert [e.id for e in index.bottom_k(2)] == [2, 4]
+        assert len(index.top_k(10)) == 5
+        with pytest.raises(ValueError):
+            index.top_k(-1)
+
+    def test_range_is_inclusive(self, employees):
+        index = SalaryIndex(employees)
+
+        assert [e.id for e in index.range(3000.0, 5000.0)] == [2, 4, 1]
+        assert index.range(9000.0, 10000.0) == []
+        assert index.range(5000.0, 3000.0) == []
+
+    def test_rank_and_percentile(self, employees):
+        index = SalaryIndex(employees)
+
+        assert index.rank(5) == 1
+        assert index.rank(3) == 2
+        assert index.percentile(0) == 3000.0
+        assert index.percentile(50) == 5000.0
+        assert index.percentile(100) == 8000.0
+        with pytest.raises(KeyError):
+            index.rank(42)
+        with pytest.raises(ValueError):
+            index.percentile(120)
+
+    def test_matches_sorted_scan_after_updates(self, small_buckets):
+        rng = random.Random(7)
+        staff = [
+            Employee(i, f"E{i}", "IT", rng.randint(1, 50) * 100.0) for i in range(1, 60)
+        ]
+        index = SalaryIndex(staff)
+        for _ in range(200):
+            emp = rng.choice(staff)
+            if emp.id in index and rng.random() < 0.3:
+                index.remove(emp.id)
+            else:
+                index.add(emp, rng.randint(1, 50) * 100.0)
+
+        expected = sorted((index.salary_of(e.id), e.id) for e in staff if e.id in index)
+        assert [e.id for e in index] == [emp_id for _, emp_id in expected]
+        assert [e.id for e in index.top_k(7)] == [i for _, i in reversed(expected)][:7]
+        low, high = expected[10][0], expected[30][0]
+        assert [e.id for e in index.range(low, high)] == [
+            i for s, i in expected if low <= s <= high
+        ]
+
+
+class TestCompanySalaryIndex:
+    def test_index_follows_company_changes(self, employees):
+        company = Company("TechCorp")
+        dept = Department("IT")
+        for emp in employees:
+            dept.add_employee(emp)
+        company.add_department(dept)
+        index = company.salary_index
+
+        employees[1].base_salary = 9000.0
+        dept.remove_employee(5)
+
+        assert [e.id for e in index.top_k(2)] == [2, 3]
+        assert 5 not in index
+        assert index.salary_of(2) == 9000.0
+
+    def test_bulk_load_rebuilds_index(self, employees):
+        company = Company("TechCorp")
+        with company.bulk_load():
+            dept = Department("IT")
+            company.add_department(dept)
+            for emp in employees:
+                dept.add_employee(emp)
+
+        assert [e.id for e in company.salary_index.bottom_k(2)] == [2, 4]
+
+    def test_project_total_reuses_index(self, employees, monkeypatch):
+        company = Company("TechCorp")
+        dept = Department("IT")
+        for emp in employees[:3]:
+            dept.add_employee(emp)
+        company.add_department(dept)
+        project = Project(1, "P1", "Desc", "2024-12-31")
+        for emp in employees[:4]:
+            project.add_team_member(emp)
+        calls = []
+        original = Employee.calculate_salary
+        monkeypatch.setattr(
+            Employee,
+            "calculate_salary",
+            lambda self: calls.append(self.id) or original(self),
+        )
+
+        assert project.calculate_total_salary(company.salary_index) == 17000.0
+        assert calls == [4]
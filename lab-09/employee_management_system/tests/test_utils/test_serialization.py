@@ -0,0 +1,82 @@
+import copy
+
+import pytest
+
+from src.core.department import employee_from_dict
+from src.core.employee import Employee
+from src.employees.developer import Developer
+from src.employees.manager import Manager
+from src.employees.salesperson import Salesperson
+from src.utils.serialization import EMPLOYEE_TYPES, codec_for, decode_employee
+
+EMPLOYEES = [
+    Employee(1, "Alice", "IT", 5000.0),
+    Manager(2, "Bob", "IT", 5000.0, 1000.0),
+    Developer(3, "Carol", "IT", 5000.0, ["Python", "Go"], "senior"),
+    Salesperson(4, "Dan", "IT", 5000.0, 0.1, 1000.0),
+]
+
+
+class TestEmployeeCodec:
+    def test_registry_and_cache(self):
+        for cls in (Employee, Manager, Developer, Salesperson):
+            assert EMPLOYEE_TYPES[cls.__name__] is cls
+            assert codec_for(cls) is codec_for(cls)
+        assert codec_for(Developer).fields == (
+            "id",
+            "name",
+            "department",
+            "base_salary",
+            "tech_stack",
+            "seniority_level",
+        )
+
+    @pytest.mark.parametrize("emp", EMPLOYEES)
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_round_trip_does_not_mutate_input(self, emp, trusted):
+        data = emp.to_dict()
+        original = copy.deepcopy(data)
+        restored = employee_from_dict(data, trusted)
+        assert data == original
+        assert type(restored) is type(emp)
+        assert restored.to_dict() == original
+        assert restored.calculate_salary() == emp.calculate_salary()
+
+    def test_lists_are_not_shared(self):
+        dev = EMPLOYEES[2]
+        data = dev.to_dict()
+        data["tech_stack"].append("Rust")
+        assert dev.tech_stack == ["Python", "Go"]
+        restored = decode_employee(data)
+        data["tech_stack"].clear()
+        assert restored.tech_stack == ["Python", "Go", "Rust"]
+
+    def test_checked_decode_validates_fields(self):
+        data = EMPLOYEES[1].to_dict()
+        data["bonus"] = -5
+        with pytest.raises(ValueError):
+            decode_employee(data)
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="Неизвестный тип"):
+            decode_employee({"type": "Intern"})
+        with pytest.raises(ValueError, match="Неизвестный тип"):
+            decode_employee({"bonus": 1.0})
+        with pytest.raises(ValueError, match="sales_volume"):
+            decode_employee(
+                {
+                    "type": "Salesperson",
+                    "id": 1,
+                    "name": "A",
+                    "department": "IT",
+                    "base_salary": 1.0,
+                    "commission_rate": 0.1,
+                }
+            )
+        with pytest.raises(ValueError, match="Неподходящий тип"):
+            Manager.from_dict(EMPLOYEES[0].to_dict())
+
+    def test_trusted_decode_has_no_observers(self):
+        restored = decode_employee(EMPLOYEES[0].to_dict(), trusted=True)
+        restored.base_salary = 100.0
+        assert restored.base_salary == 100.0
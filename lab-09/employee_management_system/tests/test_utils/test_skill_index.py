@@ -0,0 +1,85 @@
+import pytest
+
+from src.core.company import Company
+from src.core.department import Department
+from src.core.employee import Employee
+from src.employees.developer import Developer
+from src.utils.skill_index import SkillIndex, normalize_skill
+
+
+@pytest.fixture
+def developers():
+    return [
+        Developer(1, "Alice", "DEV", 5000.0, ["Python", "Kafka"], "senior"),
+        Developer(2, "Bob", "DEV", 4000.0, ["python", "SQL"], "middle"),
+        Developer(3, "Carol", "DATA", 4500.0, [" Kafka ", "Scala"], "senior"),
+        Developer(4, "Dave", "DATA", 3000.0, ["Python", "Kafka", "SQL"], "junior"),
+    ]
+
+
+class TestSkillIndexQueries:
+    def test_normalize_skill(self):
+        assert normalize_skill("  PyThon ") == "python"
+        with pytest.raises(ValueError):
+            normalize_skill(" ")
+
+    def test_and_or_not(self, developers):
+        index = SkillIndex(developers)
+
+        assert index.query_ids(all_of=["Python", "kafka"]) == {1, 4}
+        assert index.query_ids(any_of=["Scala", "SQL"]) == {2, 3, 4}
+        assert index.query_ids(all_of=["kafka"], none_of=["sql"]) == {1, 3}
+        assert index.query_ids(all_of=["Rust"]) == set()
+        assert index.skill_count("PYTHON") == 3
+
+    def test_filters_combine_with_skills(self, developers):
+        index = SkillIndex(developers)
+
+        assert index.query_ids(all_of=["kafka"], seniority="senior") == {1, 3}
+        assert index.query_ids(any_of=["python"], department="DATA") == {4}
+        assert [d.id for d in index.query(seniority="senior", department="DEV")] == [1]
+
+    def test_non_developers_are_skipped(self, developers):
+        index = SkillIndex([Employee(10, "Eve", "IT", 1000.0), *developers])
+
+        assert 10 not in index
+        assert len(index) == 4
+
+
+class TestCompanySkillIndex:
+    @pytest.fixture
+    def company(self, developers):
+        company = Company("TechCorp")
+        dept = Department("Engineering")
+        for dev in developers:
+            dept.add_employee(dev)
+        company.add_department(dept)
+        return company
+
+    def test_index_follows_developer_changes(self, company, developers):
+        developers[1].add_skill("Kafka")
+        developers[0].tech_stack = ["Go"]
+        developers[3].seniority_level = "senior"
+        developers[2].department = "DEV"
+
+        assert company.find_developers(all_of=["kafka"], seniority="senior") == [
+            developers[2],
+            developers[3],
+        ]
+        assert company.find_developers(all_of=["go"]) == [developers[0]]
+        assert company.find_developers(department="DEV") == developers[:3]
+
+    def test_index_follows_membership(self, company, developers):
+        company.departments[0].remove_employee(1)
+
+        assert company.find_developers(all_of=["python"]) == developers[1::2]
+
+    def test_bulk_load_builds_index(self, developers):
+        company = Company("TechCorp")
+        with company.bulk_load():
+            dept = Department("Engineering")
+            company.add_department(dept)
+            for dev in developers:
+                dept.add_employee(dev)
+
+        assert company.skill_index.query_ids(all_of=["sql"]) == {2, 4}